@@ -1,3 +1,8 @@
+import json
+import os
+import zlib
+from shutil import copyfile
+
 import numpy as np
 import pytest
 from autotest.conftest import get_example_data_path
@@ -11,9 +16,14 @@ from flopy.utils import (
     CellBudgetFile,
     HeadFile,
     HeadUFile,
+    UcnFile,
     Util2d,
 )
-from flopy.utils.binaryfile import get_headfile_precision
+from flopy.utils.binaryfile import (
+    _load_index_cache,
+    get_headfile_precision,
+    get_index_cache_path,
+)
 
 
 @pytest.fixture
@@ -207,3 +217,590 @@ def test_budgetfile_detect_precision_single(path):
 def test_budgetfile_detect_precision_double(path):
     file = CellBudgetFile(path, precision="auto")
     assert file.realtype == np.float64
+
+
+@pytest.mark.parametrize(
+    "path,cls",
+    [
+        (
+            _example_data_path
+            / "mt3d_test"
+            / "mfnwt_mt3dusgs"
+            / "sft_crnkNic"
+            / "CrnkNic.hds",
+            HeadFile,
+        ),
+        (
+            _example_data_path
+            / "mf6"
+            / "create_tests"
+            / "test005_advgw_tidal"
+            / "expected_output"
+            / "AdvGW_tidal.hds",
+            HeadFile,
+        ),
+        (
+            _example_data_path / "mt3d_test" / "mf2kmt3d" / "mnw" / "t5.ucn",
+            UcnFile,
+        ),
+    ],
+)
+def test_layerfile_mmap(path, cls):
+    lf = cls(str(path))
+    lfmm = cls(str(path), mmap=True)
+    assert lfmm._recordview is not None
+
+    data = lfmm.get_data()
+    assert not data.flags.writeable
+    assert np.array_equal(lf.get_data(), data, equal_nan=True)
+    for totim in lf.get_times():
+        assert np.array_equal(
+            lf.get_data(totim=totim, mflay=0),
+            lfmm.get_data(totim=totim, mflay=0),
+            equal_nan=True,
+        )
+
+    alldata = lfmm.get_alldata()
+    assert alldata.dtype == lf.realtype
+    assert np.array_equal(lf.get_alldata(), alldata, equal_nan=True)
+    assert np.array_equal(
+        lf.get_alldata(mflay=lf.nlay - 1),
+        lfmm.get_alldata(mflay=lf.nlay - 1),
+        equal_nan=True,
+    )
+
+    # nodata values are replaced in a writeable copy of the records
+    nodata = alldata.flat[0]
+    alldata = lfmm.get_alldata(nodata=nodata)
+    assert alldata.flags.writeable
+    assert np.isnan(alldata.flat[0])
+    assert np.array_equal(
+        lf.get_alldata(nodata=nodata), alldata, equal_nan=True
+    )
+    assert lfmm.get_data(idx=0).flat[0] == nodata
+
+    kijlist = [(0, 0, 0), (lf.nlay - 1, lf.nrow - 1, lf.ncol - 1)]
+    assert np.array_equal(lf.get_ts(kijlist), lfmm.get_ts(kijlist))
+    lf.close()
+    lfmm.close()
+
+
+def test_headufile_mmap(example_data_path):
+    fname = str(example_data_path / "unstructured" / "headu.githds")
+    hf = HeadUFile(fname)
+    hfmm = HeadUFile(fname, mmap=True)
+    for a, b in zip(hf.get_data(), hfmm.get_data()):
+        assert np.array_equal(a, b)
+    assert np.array_equal(hf.get_ts([1, 15000]), hfmm.get_ts([1, 15000]))
+    hfmm.close()
+
+
+@pytest.mark.parametrize("mmap", [False, True])
+def test_headfile_get_ts_multiple_cells(example_data_path, mmap):
+    fpth = str(
+        example_data_path
+        / "mf6"
+        / "create_tests"
+        / "test005_advgw_tidal"
+        / "expected_output"
+        / "AdvGW_tidal.hds"
+    )
+    hf = HeadFile(fpth, mmap=mmap)
+    alldata = hf.get_alldata()
+    kijlist = [
+        (k, i, j)
+        for k in range(hf.nlay)
+        for i in range(0, hf.nrow, 3)
+        for j in range(0, hf.ncol, 4)
+    ]
+    ts = hf.get_ts(kijlist)
+    assert ts.shape == (len(hf.times), len(kijlist) + 1)
+    assert np.array_equal(ts[:, 0], hf.get_times())
+    for icol, (k, i, j) in enumerate(kijlist, start=1):
+        assert np.array_equal(ts[:, icol], alldata[:, k, i, j])
+
+    # time series read in chunks of time should match
+    chunks = list(hf.iter_ts(kijlist, chunksize=50))
+    assert max(chunk.shape[0] for chunk in chunks) == 50
+    assert np.array_equal(np.vstack(chunks), ts)
+    hf.close()
+
+
+def test_index_cache(tmpdir, example_data_path):
+    hds = str(tmpdir / "AdvGW_tidal.hds")
+    cbc = str(tmpdir / "flow_adj.cbc")
+    copyfile(
+        example_data_path
+        / "mf6"
+        / "create_tests"
+        / "test005_advgw_tidal"
+        / "expected_output"
+        / "AdvGW_tidal.hds",
+        hds,
+    )
+    copyfile(
+        example_data_path
+        / "mf6"
+        / "test006_gwf3"
+        / "expected_output"
+        / "flow_adj.cbc",
+        cbc,
+    )
+
+    # head file index is the same when loaded from the cache
+    hf = HeadFile(hds)
+    assert not os.path.isfile(get_index_cache_path(hds))
+    HeadFile(hds, index_cache=True)
+    assert os.path.isfile(get_index_cache_path(hds))
+    hfc = HeadFile(hds, index_cache=True)
+    assert np.array_equal(hf.recordarray, hfc.recordarray)
+    assert np.array_equal(hf.iposarray, hfc.iposarray)
+    assert hf.get_times() == hfc.get_times()
+    assert hf.get_kstpkper() == hfc.get_kstpkper()
+    assert np.array_equal(hf.get_alldata(), hfc.get_alldata())
+
+    # budget file index and precision are the same when loaded from the cache
+    cf = CellBudgetFile(cbc)
+    CellBudgetFile(cbc, index_cache=True)
+    assert os.path.isfile(get_index_cache_path(cbc))
+    cfc = CellBudgetFile(cbc, index_cache=True)
+    assert cfc.realtype == cf.realtype
+    assert np.array_equal(cf.recordarray, cfc.recordarray)
+    assert np.array_equal(cf.iposarray, cfc.iposarray)
+    assert np.array_equal(cf.iposheader, cfc.iposheader)
+    assert cf.get_times() == cfc.get_times()
+    assert cf.get_kstpkper() == cfc.get_kstpkper()
+    assert cf.get_unique_record_names() == cfc.get_unique_record_names()
+    assert cf.imethlist == cfc.imethlist
+    text = cf.get_unique_record_names()[0]
+    for r0, r1 in zip(cf.get_data(text=text), cfc.get_data(text=text)):
+        assert np.array_equal(r0, r1)
+
+    # cache is stale if the file has been modified
+    os.utime(cbc, ns=(0, 0))
+    assert _load_index_cache(cbc) is None
+    CellBudgetFile(cbc, index_cache=True)
+    assert _load_index_cache(cbc) is not None
+
+    # cache is not used if the precision does not match
+    assert _load_index_cache(cbc, precision="single") is None
+
+
+@pytest.mark.parametrize("version", [1, 2])
+@pytest.mark.parametrize("cls", [HeadFile, CellBudgetFile])
+def test_index_cache_without_index_end(
+    tmpdir, example_data_path, version, cls
+):
+    # caches written before index_end was added are rebuilt
+    if cls is HeadFile:
+        src = (
+            example_data_path
+            / "mf6"
+            / "create_tests"
+            / "test005_advgw_tidal"
+            / "expected_output"
+            / "AdvGW_tidal.hds"
+        )
+    else:
+        src = (
+            example_data_path
+            / "mf6"
+            / "test006_gwf3"
+            / "expected_output"
+            / "flow_adj.cbc"
+        )
+    fpth = str(tmpdir / src.name)
+    copyfile(src, fpth)
+    cls(fpth, index_cache=True)
+    path = get_index_cache_path(fpth)
+    with np.load(path) as npz:
+        old = {key: npz[key] for key in npz.files if key != "index_end"}
+    old["version"] = np.array(version)
+    np.savez(path, **old)
+
+    f = cls(fpth)
+    fc = cls(fpth, index_cache=True)
+    assert np.array_equal(f.recordarray, fc.recordarray)
+    assert np.array_equal(f.iposarray, fc.iposarray)
+    assert f.get_times() == fc.get_times()
+    assert fc._index_end == f._index_end
+    cache = _load_index_cache(fpth)
+    assert cache["version"] == 2
+    assert cache["index_end"] == f._index_end
+
+
+def test_headfile_refresh(tmpdir, example_data_path):
+    src = str(
+        example_data_path
+        / "mf6"
+        / "create_tests"
+        / "test005_advgw_tidal"
+        / "expected_output"
+        / "AdvGW_tidal.hds"
+    )
+    hf = HeadFile(src)
+    with open(src, "rb") as f:
+        data = f.read()
+
+    # write part of the file, ending with a partially written record
+    fpth = str(tmpdir / "running.hds")
+    ipos = int(hf.iposarray[100]) + 10
+    with open(fpth, "wb") as f:
+        f.write(data[:ipos])
+    hfr = HeadFile(fpth, mmap=True)
+    assert hfr.recordarray.shape[0] == 100
+
+    # only complete simulation times are returned by follow
+    items = list(hfr.follow(interval=0.01, timeout=0.0))
+    ntimes = 100 // hfr.nlay
+    assert len(items) == ntimes
+    kstpkper, totim, head = items[-1]
+    assert kstpkper == hf.get_kstpkper()[ntimes - 1]
+    assert totim == hf.get_times()[ntimes - 1]
+    assert np.array_equal(head, hf.get_data(totim=totim))
+
+    # nothing is added until the partial record has been written
+    with open(fpth, "ab") as f:
+        f.write(data[ipos : ipos + 10])
+    assert hfr.refresh() == 0
+    with open(fpth, "ab") as f:
+        f.write(data[ipos + 10 :])
+    assert hfr.refresh() == hf.recordarray.shape[0] - 100
+    assert np.array_equal(hfr.recordarray, hf.recordarray)
+    assert np.array_equal(hfr.iposarray, hf.iposarray)
+    assert hfr.get_times() == hf.get_times()
+    assert hfr.get_kstpkper() == hf.get_kstpkper()
+    assert np.array_equal(hfr.get_alldata(), hf.get_alldata())
+    hfr.close()
+
+
+def test_cellbudgetfile_refresh(tmpdir, example_data_path):
+    src = str(example_data_path / "mf2005_test" / "swiex1.gitzta")
+    cbf = CellBudgetFile(src)
+    with open(src, "rb") as f:
+        data = f.read()
+
+    # write part of the file, ending with a partially written record
+    fpth = str(tmpdir / "running.zta")
+    ipos = int(cbf.iposheader[2]) + 60
+    with open(fpth, "wb") as f:
+        f.write(data[:ipos])
+    cbfr = CellBudgetFile(fpth, precision="single")
+    assert cbfr.get_nrecords() == 2
+    records = list(cbfr.follow(interval=0.01, timeout=0.0))
+    assert len(records) == 2
+
+    with open(fpth, "ab") as f:
+        f.write(data[ipos:])
+    assert cbfr.refresh() == cbf.get_nrecords() - 2
+    assert np.array_equal(cbfr.recordarray, cbf.recordarray)
+    assert np.array_equal(cbfr.iposheader, cbf.iposheader)
+    assert np.array_equal(cbfr.iposarray, cbf.iposarray)
+    assert cbfr.get_times() == cbf.get_times()
+    assert cbfr.get_kstpkper() == cbf.get_kstpkper()
+    text = cbf.get_unique_record_names()[0]
+    records = list(cbfr.follow(text, interval=0.01, timeout=0.0))
+    for (kstpkper, totim, rec), rec0 in zip(records, cbf.get_data(text=text)):
+        assert np.array_equal(rec, rec0)
+    assert len(records) == len(cbf.get_data(text=text))
+
+
+def write_synthetic_budget_file(
+    fpth, nstp=10, nja=1000, nlist=100, precision="double"
+):
+    """
+    Write a MODFLOW 6 style compact budget file with a FLOW-JA-FACE
+    (imeth 1) and a WEL (imeth 6) record for each time step.
+    """
+    ftype = np.float64 if precision == "double" else np.float32
+    h1dt = np.dtype(
+        [
+            ("kstp", np.int32),
+            ("kper", np.int32),
+            ("text", "S16"),
+            ("ncol", np.int32),
+            ("nrow", np.int32),
+            ("nlay", np.int32),
+        ]
+    )
+    h2dt = np.dtype(
+        [
+            ("imeth", np.int32),
+            ("delt", ftype),
+            ("pertim", ftype),
+            ("totim", ftype),
+        ]
+    )
+    names = np.array(["MODEL", "WEL", "MODEL", "WEL"], dtype="S16")
+    listdt = np.dtype([("node", np.int32), ("node2", np.int32), ("q", ftype)])
+    flowja = np.arange(nja, dtype=ftype)
+    wel = np.zeros(nlist, dtype=listdt)
+    wel["node"] = np.arange(1, nlist + 1)
+    wel["node2"] = wel["node"]
+    wel["q"] = -1.0
+    with open(fpth, "wb") as f:
+        for kstp in range(1, nstp + 1):
+            totim = float(kstp)
+            for text, ncol, imeth in [
+                ("    FLOW-JA-FACE", nja, 1),
+                ("             WEL", nja, 6),
+            ]:
+                np.array([(kstp, 1, text, ncol, 1, -1)], dtype=h1dt).tofile(f)
+                np.array([(imeth, 1.0, totim, totim)], dtype=h2dt).tofile(f)
+                if imeth == 1:
+                    flowja.tofile(f)
+                else:
+                    names.tofile(f)
+                    np.array([1, nlist], dtype=np.int32).tofile(f)
+                    wel.tofile(f)
+
+
+@pytest.mark.parametrize("precision", ["single", "double"])
+def test_budgetfile_detect_precision_synthetic(tmpdir, precision):
+    fpth = str(tmpdir / f"synthetic_{precision}.cbc")
+    write_synthetic_budget_file(fpth, precision=precision)
+    cbf = CellBudgetFile(fpth, precision="auto")
+    assert cbf._detect_precision() == precision
+    realtype = np.float64 if precision == "double" else np.float32
+    assert cbf.realtype == realtype
+    assert cbf.get_nrecords() == 20
+    assert len(cbf.get_times()) == 10
+    wel = cbf.get_data(text="WEL")
+    assert len(wel) == 10
+    assert np.all(wel[-1]["q"] == -1.0)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("precision", ["single", "double"])
+def test_budgetfile_open_time(tmpdir, benchmark, precision):
+    fpth = str(tmpdir / f"synthetic_{precision}.cbc")
+    write_synthetic_budget_file(
+        fpth, nstp=1000, nja=10000, nlist=1000, precision=precision
+    )
+    cbf = benchmark(lambda: CellBudgetFile(fpth, precision="auto"))
+    assert cbf.get_nrecords() == 2000
+
+
+@pytest.mark.parametrize("text", ["FLOW-JA-FACE", "WEL", "SFR"])
+def test_cellbudgetfile_get_alldata(example_data_path, text):
+    fpth = str(
+        example_data_path
+        / "mf6"
+        / "create_tests"
+        / "test028_sfr"
+        / "expected_output"
+        / "test1tr.cbc"
+    )
+    with CellBudgetFile(fpth) as cbc:
+        records = cbc.get_data(text=text)
+        data = cbc.get_alldata(text=text)
+        if text == "FLOW-JA-FACE":
+            assert data.shape == (len(records),) + records[0].shape
+            for i, rec in enumerate(records):
+                assert np.array_equal(data[i], rec)
+        else:
+            assert data.dtype.names == ("itim",) + records[0].dtype.names
+            assert len(data) == sum(len(rec) for rec in records)
+            for i, rec in enumerate(records):
+                values = data[data["itim"] == i]
+                for name in rec.dtype.names:
+                    assert np.array_equal(values[name], rec[name])
+
+            # full3D list records stack to masked arrays
+            records = cbc.get_data(text=text, full3D=True)
+            data = cbc.get_alldata(text=text, full3D=True)
+            assert data.shape == (len(records),) + records[0].shape
+            for i, rec in enumerate(records):
+                assert np.array_equal(data[i].mask, rec.mask)
+                assert np.allclose(data[i].filled(0.0), rec.filled(0.0))
+
+        # a single time step gives a stack of one record
+        data = cbc.get_alldata(kstpkper=cbc.get_kstpkper()[-1], text=text)
+        if text == "FLOW-JA-FACE":
+            assert data.shape[0] == 1
+        else:
+            assert np.all(data["itim"] == 0)
+
+
+def test_cellbudgetfile_get_ts_list(example_data_path):
+    fpth = str(
+        example_data_path
+        / "mf6"
+        / "create_tests"
+        / "test028_sfr"
+        / "expected_output"
+        / "test1tr.cbc"
+    )
+    with CellBudgetFile(fpth) as cbc:
+        nrow, ncol = cbc.nrow, cbc.ncol
+        for text in ["WEL", "GHB"]:
+            nodes = cbc.get_data(text=text)[0]["node"] - 1
+            kijlist = [
+                (n // (nrow * ncol), (n // ncol) % nrow, n % ncol)
+                for n in nodes
+            ]
+            # cell that is not in the list
+            kijlist.append((0, 0, 0))
+            ts = cbc.get_ts(idx=kijlist, text=text)
+            assert ts.shape == (len(cbc.get_times()), len(kijlist) + 1)
+            assert np.array_equal(ts[:, 0], cbc.get_times())
+            assert np.all(np.isnan(ts[:, -1]))
+            for itim, kstpkper in enumerate(cbc.get_kstpkper()):
+                v = cbc.get_data(kstpkper=kstpkper, text=text, full3D=True)[0]
+                v = v.filled(np.nan)
+                expected = [v[kij] for kij in kijlist[:-1]]
+                assert np.allclose(ts[itim, 1:-1], expected, equal_nan=True)
+
+
+@pytest.mark.parametrize("mmap", [False, True])
+@pytest.mark.parametrize("workers", [1, 3])
+def test_headfile_iter_alldata(example_data_path, mmap, workers):
+    fpth = str(
+        example_data_path
+        / "mf6"
+        / "create_tests"
+        / "test005_advgw_tidal"
+        / "expected_output"
+        / "AdvGW_tidal.hds"
+    )
+    with HeadFile(fpth, mmap=mmap) as hds:
+        expected = hds.get_alldata()
+        chunks = list(hds.iter_alldata(chunksize=50, workers=workers))
+        assert [len(chunk) for chunk in chunks[:-1]] == [50] * (
+            len(chunks) - 1
+        )
+        assert np.array_equal(np.concatenate(chunks), expected)
+
+        chunks = list(hds.iter_alldata(chunksize=50, mflay=1))
+        assert np.array_equal(np.concatenate(chunks), expected[:, 1])
+
+        # times that are not in the file are nan
+        times = hds.get_times()[::10] + [-1.0]
+        data = np.concatenate(list(hds.iter_alldata(times=times)))
+        assert np.array_equal(data[:-1], expected[::10])
+        assert np.all(np.isnan(data[-1]))
+
+
+def test_headfile_to_zarr(tmpdir, example_data_path):
+    fpth = str(example_data_path / "mt3d_test" / "mf2kmt3d" / "mnw" / "t5.ucn")
+    ucn = UcnFile(fpth)
+    expected = ucn.get_alldata()
+    path = ucn.to_zarr(tmpdir / "t5.zarr", chunksize=3)
+
+    with open(os.path.join(path, ".zarray")) as f:
+        zarray = json.load(f)
+    assert zarray["shape"] == list(expected.shape)
+    assert zarray["chunks"] == [3] + list(expected.shape[1:])
+    with open(os.path.join(path, ".zattrs")) as f:
+        zattrs = json.load(f)
+    assert np.allclose(zattrs["totim"], ucn.get_times())
+
+    nchunks = int(np.ceil(expected.shape[0] / 3))
+    chunks = []
+    for ichunk in range(nchunks):
+        with open(os.path.join(path, f"{ichunk}.0.0.0"), "rb") as f:
+            chunk = np.frombuffer(
+                zlib.decompress(f.read()), dtype=zarray["dtype"]
+            )
+        chunks.append(chunk.reshape(zarray["chunks"]))
+    data = np.concatenate(chunks)
+    assert np.array_equal(data[: expected.shape[0]], expected, equal_nan=True)
+    assert np.all(np.isnan(data[expected.shape[0] :]))
+    ucn.close()
+
+
+@pytest.mark.parametrize("mmap", [False, True])
+def test_headfile_as_array(example_data_path, mmap):
+    fpth = str(
+        example_data_path
+        / "mf6"
+        / "test045_lake2tr"
+        / "expected_output"
+        / "lakeex2a_unch.hds"
+    )
+    with HeadFile(fpth, mmap=mmap) as hds:
+        expected = np.array([hds.get_data(totim=t) for t in hds.get_times()])
+        view = hds.as_array()
+        assert view.shape == expected.shape
+        assert len(view) == len(hds.get_times())
+        for key in [
+            (slice(2, 9), 1, slice(None), 4),
+            (Ellipsis, 3),
+            0,
+            (-1, -1, -1, -1),
+            (slice(None, None, -3), slice(None), 5),
+        ]:
+            data = view[key]
+            assert data.shape == expected[key].shape
+            assert np.array_equal(data, expected[key])
+
+        # index arrays select each dimension independently
+        data = view[:, [0, 4], :, [1, 2, 3]]
+        assert data.shape == (expected.shape[0], 2, expected.shape[2], 3)
+        assert np.array_equal(data, expected[:, [0, 4]][..., [1, 2, 3]])
+        assert np.array_equal(np.asarray(view), expected)
+
+        with pytest.raises(IndexError):
+            view[0, expected.shape[1]]
+
+
+def test_headfile_as_array_reads(example_data_path, monkeypatch):
+    fpth = str(
+        example_data_path
+        / "mf6"
+        / "test045_lake2tr"
+        / "expected_output"
+        / "lakeex2a_unch.hds"
+    )
+    reads = []
+    binaryread = flopy.utils.binaryfile.binaryread
+
+    def counted_binaryread(file, vartype, shape=(1,), charlen=16):
+        reads.append(int(np.prod(shape)))
+        return binaryread(file, vartype, shape=shape, charlen=charlen)
+
+    with HeadFile(fpth) as hds:
+        expected = np.array([hds.get_data(totim=t) for t in hds.get_times()])
+        nrow, ncol = expected.shape[2:]
+        view = hds.as_array()
+        monkeypatch.setattr(
+            flopy.utils.binaryfile, "binaryread", counted_binaryread
+        )
+
+        # a column transect only reads the selected column of each row
+        data = view[2:6, 1, :, 4]
+        assert np.array_equal(data, expected[2:6, 1, :, 4])
+        assert reads == 4 * nrow * [1]
+
+        # sparse rows and columns, in any order and with repeats
+        reads.clear()
+        data = view[0, 0, [20, 3, 20], [9, 1]]
+        assert np.array_equal(data, expected[0, 0][[20, 3, 20]][:, [9, 1]])
+        assert reads == 3 * [9]
+
+        # a dense selection is read in one span for each record
+        reads.clear()
+        data = view[0, :, 2:5]
+        assert np.array_equal(data, expected[0, :, 2:5])
+        assert reads == expected.shape[1] * [3 * ncol]
+
+
+def test_cellbudgetfile_as_array(example_data_path):
+    fpth = str(
+        example_data_path
+        / "mf6"
+        / "create_tests"
+        / "test028_sfr"
+        / "expected_output"
+        / "test1tr.cbc"
+    )
+    with CellBudgetFile(fpth) as cbc:
+        for text in ["FLOW-JA-FACE", "STO-SS"]:
+            expected = np.array(cbc.get_data(text=text))
+            view = cbc.as_array(text)
+            assert view.shape == expected.shape
+            assert np.array_equal(view[3:7, 0, 0], expected[3:7, 0, 0])
+            assert np.array_equal(view[..., 5], expected[..., 5])
+
+        with pytest.raises(ValueError):
+            cbc.as_array("WEL")
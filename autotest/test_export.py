@@ -189,6 +189,62 @@ def test_export_output(tmpdir, example_data_path):
     nc.nc.close()
 
 
+@requires_pkg("netCDF4", "pyproj")
+@pytest.mark.parametrize("chunksize, workers", [(1, 1), (2, 1), (2, 3)])
+def test_export_output_chunked(tmpdir, example_data_path, chunksize, workers):
+    ml = Modflow.load(
+        "freyberg.nam", model_ws=str(example_data_path / "freyberg")
+    )
+    nrow, ncol = ml.dis.nrow, ml.dis.ncol
+
+    # write a head file with more times than the chunk size
+    hds_pth = os.path.join(tmpdir, "freyberg.hds")
+    ntimes = 5
+    with open(hds_pth, "wb") as fout:
+        for i in range(ntimes):
+            totim = float(i + 1)
+            header = flopy.utils.BinaryHeader.create(
+                bintype="head",
+                precision="single",
+                text="head",
+                nrow=nrow,
+                ncol=ncol,
+                ilay=1,
+                pertim=totim,
+                totim=totim,
+                kstp=1,
+                kper=i + 1,
+            )
+            a = ml.dis.top.array.astype(np.float32) - i
+            a[i, :] = ml.hdry
+            flopy.utils.Util2d.write_bin(a.shape, fout, a, header_data=header)
+
+    hds = HeadFile(hds_pth)
+    assert len(hds.get_times()) > chunksize
+    out_pth = os.path.join(tmpdir, "freyberg.out.nc")
+    nc = flopy.export.utils.output_helper(
+        out_pth,
+        ml,
+        {"freyberg.hds": hds},
+        chunksize=chunksize,
+        workers=workers,
+    )
+    nc.nc.close()
+
+    from netCDF4 import Dataset
+
+    expected = hds.get_alldata().astype(np.float32)
+    inactive = ml.bas6.ibound.array == 0
+    mask = (expected == np.float32(ml.hdry)) | inactive[np.newaxis]
+    with Dataset(out_pth) as ds:
+        arr = ds.variables["head"][:]
+        assert arr.shape == expected.shape
+        assert np.array_equal(np.ma.getmaskarray(arr), mask)
+        assert np.array_equal(arr.data[~mask], expected[~mask])
+        assert np.isclose(ds.variables["head"].min, expected[~mask].min())
+        assert np.isclose(ds.variables["head"].max, expected[~mask].max())
+
+
 @requires_pkg("shapefile")
 def test_write_gridlines_shapefile(tmpdir):
     import shapefile
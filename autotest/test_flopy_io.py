@@ -1,4 +1,7 @@
-from flopy.utils.flopy_io import line_parse
+import numpy as np
+
+from flopy.modflow import Modflow, ModflowWel
+from flopy.utils.flopy_io import line_parse, ulstrd
 
 
 def test_line_parse():
@@ -7,3 +10,44 @@ def test_line_parse():
     # comment handling
     line = line_parse("Well-A  -1                   ; 2a. WELLID,NNODES")
     assert line == ["Well-A", "-1"]
+
+
+def test_ulstrd(tmpdir):
+    ml = Modflow("ulstrd", model_ws=str(tmpdir))
+    lines = [
+        "SFAC 2.0\n",
+        "1 2 3 -1.5 well-a\n",
+        "  2, 3, 4, 0.25 ; comment\n",
+        "3 4 5\n",
+        "4 5 6 1e2 # another comment\n",
+    ]
+    pth = str(tmpdir / "list.txt")
+    with open(pth, "w") as f:
+        f.writelines(lines)
+    with open(pth) as f:
+        ra = ulstrd(f, 4, ModflowWel.get_empty(4), ml, ["flux"], None)
+    assert ra["k"].tolist() == [1, 2, 3, 4]
+    assert ra["j"].tolist() == [3, 4, 5, 6]
+    assert np.allclose(ra["flux"], [-3.0, 0.5, 0.0, 200.0])
+
+    # without comments or commas
+    with open(pth, "w") as f:
+        f.writelines(["1 2 3 -1.5 well-a\n", "4 5 6 1e2\n", "7 8 9 3.\n"])
+    with open(pth) as f:
+        ra = ulstrd(f, 2, ModflowWel.get_empty(2), ml, ["flux"], None)
+        assert f.readline() == "7 8 9 3.\n"
+    assert ra["i"].tolist() == [2, 5]
+    assert np.allclose(ra["flux"], [-1.5, 100.0])
+
+    # binary open/close file
+    data = np.array(
+        [(1, 2, 3, 0.5), (4, 5, 6, -0.5)],
+        dtype=[(name, np.float32) for name in ("k", "i", "j", "flux")],
+    )
+    data.tofile(str(tmpdir / "list.bin"))
+    with open(pth, "w") as f:
+        f.write("OPEN/CLOSE list.bin (BINARY)\n")
+    with open(pth) as f:
+        ra = ulstrd(f, 2, ModflowWel.get_empty(2), ml, ["flux"], None)
+    assert ra["k"].tolist() == [1, 4]
+    assert np.allclose(ra["flux"], [0.5, -0.5])
@@ -207,3 +207,83 @@ def test_mf6obsfile_read(mf6_obs_model_path):
         df = h.get_dataframe(timeunit="S")
         assert isinstance(df, pd.DataFrame), "A DataFrame was not returned"
         assert df.shape == (3, 2), "data shape is not (3, 2)"
+
+
+def test_mf6obsfile_mmap(mf6_obs_model_path):
+    pth = str(mf6_obs_model_path / "maw_obs.gitbin")
+    h = Mf6Obs(pth, isBinary=True)
+    hmm = Mf6Obs(pth, isBinary=True, mmap=True)
+    assert isinstance(hmm.data, np.memmap)
+    assert hmm.get_times() == h.get_times()
+    for label in h.get_obsnames():
+        assert np.array_equal(
+            hmm.get_data(obsname=label)[label],
+            h.get_data(obsname=label)[label],
+        )
+
+
+def test_mf6obsfile_csv_columns(tmpdir):
+    nobs, ntimes = 50, 25
+    obsnames = [f"OBS{i}" for i in range(nobs)]
+    values = np.random.default_rng(0).random((ntimes, nobs))
+    pth = str(tmpdir / "obs.csv")
+    with open(pth, "w") as f:
+        f.write(",".join(["time"] + obsnames) + "\n")
+        for itim in range(ntimes):
+            row = [f"{itim + 1.0}"] + [f"{v:.15g}" for v in values[itim]]
+            f.write(",".join(row) + "\n")
+
+    h = Mf6Obs(pth, isBinary=False)
+    assert h.get_obsnames() == obsnames
+    assert h.get_times() == [itim + 1.0 for itim in range(ntimes)]
+
+    # only the requested columns are read
+    data = h.get_data(obsname=["OBS3", "OBS40"])
+    assert data.dtype.names == ("totim", "OBS3", "OBS40")
+    assert np.allclose(data["OBS3"], values[:, 3])
+    assert np.allclose(data["OBS40"], values[:, 40])
+
+    assert h._csv._data is None
+
+    # columns that were read are not read from the file again
+    nread = []
+    read_csv = h._csv.read_csv
+
+    def counted_read_csv(*args, **kwargs):
+        nread.append(kwargs.get("usecols"))
+        return read_csv(*args, **kwargs)
+
+    h._csv.read_csv = counted_read_csv
+    assert h.get_times() == [itim + 1.0 for itim in range(ntimes)]
+    assert h.get_ntimes() == ntimes
+    assert np.allclose(h.get_data(obsname="OBS3", idx=2)["OBS3"], values[2, 3])
+    assert np.allclose(h.get_data(obsname="OBS40")["OBS40"], values[:, 40])
+    assert nread == []
+    assert np.allclose(h.get_data(obsname="OBS41")["OBS41"], values[:, 41])
+    assert nread == [[42]]
+    assert h._csv._data is None
+
+    # the cached columns are dropped when the file changes
+    values = values[:-1] * 2.0
+    ntimes -= 1
+    with open(pth, "w") as f:
+        f.write(",".join(["time"] + obsnames) + "\n")
+        for itim in range(ntimes):
+            row = [f"{itim + 1.0}"] + [f"{v:.15g}" for v in values[itim]]
+            f.write(",".join(row) + "\n")
+    st = os.stat(pth)
+    os.utime(pth, ns=(st.st_atime_ns, st.st_mtime_ns + 1000000000))
+    assert h.get_ntimes() == ntimes
+    assert np.allclose(h.get_data(obsname="OBS3")["OBS3"], values[:, 3])
+    assert len(nread) == 3
+    h._csv.read_csv = read_csv
+
+    # stream blocks of rows
+    blocks = list(h._csv.iter_rows(names=["OBS7"], chunksize=10))
+    assert [len(block) for block in blocks] == [10, 10, 4]
+    assert np.allclose(np.concatenate(blocks)["OBS7"], values[:, 7])
+
+    # all of the data
+    data = h.get_data()
+    assert len(data.dtype.names) == nobs + 1
+    assert np.allclose(data["OBS49"], values[:, 49])
@@ -1,8 +1,12 @@
 import os
+import shutil
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pytest
-from autotest.conftest import requires_exe
+from autotest.conftest import has_pkg, requires_exe
 
 import flopy
 from flopy.mf6 import (
@@ -50,8 +54,12 @@ from flopy.mf6.coordinates.modeldimensions import (
     PackageDimensions,
 )
 from flopy.mf6.data.mffileaccess import MFFileAccessArray
-from flopy.mf6.data.mfstructure import MFDataItemStructure, MFDataStructure
-from flopy.mf6.mfbase import MFFileMgmt
+from flopy.mf6.data.mfstructure import (
+    DatumType,
+    MFDataItemStructure,
+    MFDataStructure,
+)
+from flopy.mf6.mfbase import MFFileMgmt, MFProfiler
 from flopy.mf6.modflow import (
     mfgwf,
     mfgwfdis,
@@ -73,6 +81,7 @@ from flopy.utils import (
     Mf6Obs,
     ZoneBudget6,
 )
+from flopy.utils.datautil import PyListUtil
 from flopy.utils.observationfile import CsvFile
 
 pytestmark = pytest.mark.mf6
@@ -403,6 +412,626 @@ def test_binary_read(tmpdir):
     assert np.allclose(arr, arr2), "Binary read for Unstructured failed"
 
 
+def test_binary_external_roundtrip(tmpdir):
+    nlay, nrow, ncol = 3, 10, 10
+    shape3d = (nlay, nrow, ncol)
+    sim = MFSimulation(sim_ws=str(tmpdir))
+    ModflowTdis(sim)
+    ModflowIms(sim)
+    gwf = ModflowGwf(sim, modelname="gwf")
+    ModflowGwfdis(gwf, nlay=nlay, nrow=nrow, ncol=ncol)
+    k = np.random.default_rng(0).random(shape3d)
+    icelltype = np.arange(nlay * nrow * ncol).reshape(shape3d) % 2
+    k33 = {"data": np.full(shape3d, 0.1), "layered": False}
+    ModflowGwfnpf(gwf, k=k, k33=k33, icelltype=icelltype)
+    ModflowGwfic(gwf, strt=np.full(shape3d, 10.0))
+    sim.set_all_data_external(binary=True)
+    sim.write_simulation()
+
+    # each record is a header followed by one copy of the data
+    header_size = 52
+    fpth = str(tmpdir / "gwf.npf_k_layer1.bin")
+    assert os.path.getsize(fpth) == header_size + nrow * ncol * 8
+    fpth = str(tmpdir / "gwf.npf_icelltype_layer1.bin")
+    assert os.path.getsize(fpth) == header_size + nrow * ncol * 4
+    fpth = str(tmpdir / "gwf.npf_k33.bin")
+    assert os.path.getsize(fpth) == header_size + nlay * nrow * ncol * 8
+
+    sim2 = MFSimulation.load(sim_ws=str(tmpdir))
+    npf = sim2.get_model().npf
+    assert np.array_equal(npf.k.array, k)
+    assert np.array_equal(npf.icelltype.array, icelltype)
+    assert np.array_equal(npf.k33.array, k33["data"])
+    assert np.array_equal(
+        sim2.get_model().ic.strt.array, np.full(shape3d, 10.0)
+    )
+
+
+@pytest.mark.slow
+def test_binary_external_write_time(tmpdir, benchmark):
+    sim = MFSimulation(sim_ws=str(tmpdir))
+    ModflowTdis(sim)
+    gwf = ModflowGwf(sim, modelname="gwf")
+    nlay, nrow, ncol = 5, 500, 500
+    ModflowGwfdis(gwf, nlay=nlay, nrow=nrow, ncol=ncol)
+    k = np.random.default_rng(0).random((nlay, nrow, ncol))
+    npf = ModflowGwfnpf(gwf, k=k)
+    benchmark(lambda: npf.k.store_as_external_file("k.bin", binary=True))
+
+
+def test_text_read(tmpdir):
+    nlay, nrow, ncol = 3, 10, 10
+    arr = np.arange(nlay * nrow * ncol).astype(np.float64) / 3.0
+    data_shape = (nlay, nrow, ncol)
+    data_size = nlay * nrow * ncol
+
+    sim_data = MFSimulationData("integration", None)
+    dstruct = MFDataItemStructure()
+    dstruct.is_cellid = False
+    dstruct.name = "fake"
+    dstruct.data_items = [
+        None,
+    ]
+    mfstruct = MFDataStructure(dstruct, False, "ic", None)
+    mfstruct.data_item_structures = [
+        dstruct,
+    ]
+    mfstruct.path = [
+        "fake",
+    ]
+
+    md = ModelDimensions("test", None)
+    pd = PackageDimensions([md], None, "integration")
+    dd = DataDimensions(pd, mfstruct)
+    fa = MFFileAccessArray(mfstruct, dd, sim_data, None, None)
+
+    rows = [" ".join(f"{v!r}" for v in row) for row in arr.reshape(-1, ncol)]
+    blocks = {
+        "plain": rows,
+        "comments": ["# header comment"]
+        + rows[:5]
+        + ["", "! more"]
+        + rows[5:],
+    }
+    for name, lines in blocks.items():
+        txtfile = str(tmpdir / f"{name}.txt")
+        with open(txtfile, "w") as foo:
+            foo.write("\n".join(lines + ["END GRIDDATA", ""]))
+
+        with open(txtfile) as fd:
+            arr2 = fa.read_text_data_from_file(
+                data_size, DatumType.double_precision, data_shape, 0, fd=fd
+            )[0]
+            # the file is left at the line following the data
+            assert fd.readline().strip() == "END GRIDDATA"
+        assert arr2.shape == data_shape
+        assert np.array_equal(arr.reshape(data_shape), arr2), name
+
+    # integer data
+    txtfile = str(tmpdir / "int.txt")
+    with open(txtfile, "w") as foo:
+        foo.write("1 2 3\n4 5 6 7\n")
+    arr2 = fa.read_text_data_from_file(
+        6, DatumType.integer, (6,), 0, fname=txtfile
+    )[0]
+    assert arr2.dtype == np.int32
+    assert np.array_equal(arr2, np.arange(1, 7))
+
+
+def test_array_data_string():
+    sim_data = MFSimulationData("integration", None)
+    dstruct = MFDataItemStructure()
+    dstruct.is_cellid = False
+    dstruct.name = "fake"
+    dstruct.data_items = [
+        None,
+    ]
+    mfstruct = MFDataStructure(dstruct, False, "ic", None)
+    mfstruct.data_item_structures = [
+        dstruct,
+    ]
+    mfstruct.path = [
+        "fake",
+    ]
+
+    md = ModelDimensions("test", None)
+    pd = PackageDimensions([md], None, "integration")
+    dd = DataDimensions(pd, mfstruct)
+    fa = MFFileAccessArray(mfstruct, dd, sim_data, None, None)
+
+    rng = np.random.default_rng(0)
+    values = rng.standard_normal(2 * 3 * 25) * 10.0 ** rng.integers(
+        -6, 8, 2 * 3 * 25
+    )
+    values[:6] = [0.0, -0.0, 1.0e5, 1.0e-3, np.nan, -np.inf]
+    arrays = {
+        DatumType.double_precision: [
+            values,
+            values.reshape((6, 25)),
+            values.reshape((2, 3, 25)),
+            values.astype(np.float32),
+        ],
+        DatumType.integer: [
+            rng.integers(-1000, 1000, 150),
+            rng.integers(0, 10, (6, 25)).astype(np.int32),
+        ],
+    }
+
+    def data_strings(data, data_type, indent):
+        sim_data.vectorized_array_format = False
+        expected = fa.get_data_string(data, data_type, indent)
+        sim_data.vectorized_array_format = True
+        return expected, fa.get_data_string(data, data_type, indent)
+
+    for wrap in (True, False):
+        sim_data.wrap_multidim_arrays = wrap
+        for max_columns in (10, 25, 40):
+            sim_data._max_columns_of_data = max_columns
+            for data_type, data_list in arrays.items():
+                for data in data_list:
+                    for indent in ("", "  "):
+                        expected, result = data_strings(
+                            data, data_type, indent
+                        )
+                        assert result == expected
+
+    # cell ids are written one based
+    sim_data.wrap_multidim_arrays = True
+    dstruct.is_cellid = True
+    data = np.arange(30)
+    expected, result = data_strings(data, DatumType.integer, "")
+    assert result == expected
+    assert result.split()[0] == "1"
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("vectorized", [True, False])
+def test_array_write_time(tmpdir, benchmark, vectorized):
+    sim = MFSimulation(sim_ws=str(tmpdir))
+    sim.simulation_data.vectorized_array_format = vectorized
+    ModflowTdis(sim)
+    gwf = ModflowGwf(sim, modelname="gwf")
+    nlay, nrow, ncol = 5, 200, 200
+    ModflowGwfdis(gwf, nlay=nlay, nrow=nrow, ncol=ncol)
+    k = np.random.default_rng(0).random((nlay, nrow, ncol)) * 100.0
+    npf = ModflowGwfnpf(gwf, k=k)
+    benchmark(lambda: npf.write())
+
+
+def test_load_list_columns(tmpdir):
+    sim = MFSimulation(sim_ws=str(tmpdir))
+    ModflowTdis(sim, nper=3)
+    ModflowIms(sim)
+    gwf = ModflowGwf(sim, modelname="model")
+    ModflowGwfdis(gwf, nlay=2, nrow=5, ncol=5)
+    rng = np.random.default_rng(0)
+    spd = {}
+    for per in range(3):
+        spd[per] = [
+            ((k, i, 4 - i), rng.random(), rng.random(), f"Well{i}_{k}")
+            for k in range(2)
+            for i in range(5)
+        ]
+    ModflowGwfwel(
+        gwf, auxiliary=["conc"], boundnames=True, stress_period_data=spd
+    )
+    sim.write_simulation()
+
+    # add a comment to the second stress period
+    fname = str(tmpdir / "model.wel")
+    with open(fname) as f:
+        lines = f.readlines()
+    index = [line.strip().upper() for line in lines].index("BEGIN PERIOD  2")
+    lines.insert(index + 3, "# comment line\n")
+    with open(fname, "w") as f:
+        f.writelines(lines)
+
+    sim_r = MFSimulation.load(sim_ws=str(tmpdir))
+    spd_r = sim_r.get_model().wel.stress_period_data.get_data()
+    for per in range(3):
+        data = spd_r[per]
+        assert data.dtype.names == ("cellid", "q", "conc", "boundname")
+        assert data["cellid"].tolist() == [row[0] for row in spd[per]]
+        assert np.allclose(data["q"], [row[1] for row in spd[per]])
+        assert np.allclose(data["conc"], [row[2] for row in spd[per]])
+        assert data["boundname"].tolist() == [
+            row[3].lower() for row in spd[per]
+        ]
+
+
+@pytest.mark.parametrize(
+    "columns",
+    [
+        [6, 5, 5, 5],
+        [5, 6, 6, 6],
+        [6, 6, 5, 6],
+        [5, 5, 6, 5],
+        [5, 6, 4, 5],
+        [6, 5, 6, 4],
+    ],
+)
+def test_load_list_optional_columns(tmpdir, columns):
+    sim = MFSimulation(sim_ws=str(tmpdir))
+    ModflowTdis(sim)
+    ModflowIms(sim)
+    gwf = ModflowGwf(sim, modelname="model")
+    ModflowGwfdis(gwf, nlay=1, nrow=5, ncol=5)
+    ModflowGwfwel(
+        gwf,
+        auxiliary=["conc"],
+        boundnames=True,
+        stress_period_data={0: [((0, 0, 0), -1.0, 0.5, "well")]},
+    )
+    sim.write_simulation()
+
+    # aux values and boundnames, some of them numeric, are only given on
+    # some lines, so the lines do not all have the same number of columns
+    rows = [
+        (
+            i,
+            -float(i + 1),
+            0.1 * i if ncol > 4 else np.nan,
+            str(100 + i) if ncol > 5 else None,
+        )
+        for i, ncol in enumerate(columns)
+    ]
+    fname = str(tmpdir / "model.wel")
+    with open(fname) as f:
+        lines = f.readlines()
+    keys = [line.strip().upper() for line in lines]
+    index = keys.index("BEGIN PERIOD  1")
+    end = keys.index("END PERIOD  1")
+    lines[index + 1 : end] = [
+        " ".join(f"  1 {i + 1} 1 {q} {conc} {bname}".split()[:ncol]) + "\n"
+        for (i, q, conc, bname), ncol in zip(rows, columns)
+    ]
+    with open(fname, "w") as f:
+        f.writelines(lines)
+
+    sim_r = MFSimulation.load(sim_ws=str(tmpdir))
+    data = sim_r.get_model().wel.stress_period_data.get_data(0)
+    assert data["cellid"].tolist() == [(0, row[0], 0) for row in rows]
+    assert np.allclose(data["q"], [row[1] for row in rows])
+    assert np.allclose(data["conc"], [row[2] for row in rows], equal_nan=True)
+    assert data["boundname"].tolist() == [row[3] for row in rows]
+
+
+def test_pylistutil_delimiter_state():
+    PyListUtil.reset_delimiter_used()
+    PyListUtil.split_data_line("1,2,3")
+    assert PyListUtil.line_num == 1
+    assert PyListUtil.delimiter_used == ","
+    assert PyListUtil.consistent_delim
+    assert PyListUtil().line_num == 1
+    with pytest.raises(AttributeError):
+        PyListUtil().line_num = 0
+
+    # the state is kept separately for each thread
+    def split():
+        PyListUtil.reset_delimiter_used()
+        PyListUtil.split_data_line("1 2 3")
+        PyListUtil.split_data_line("4 5 6")
+        return PyListUtil.line_num, PyListUtil.delimiter_used
+
+    with ThreadPoolExecutor(1) as executor:
+        assert executor.submit(split).result() == (2, None)
+    assert PyListUtil.line_num == 1
+    assert PyListUtil.delimiter_used == ","
+
+
+@pytest.mark.parametrize("ex_name", ["test005_advgw_tidal", "test045_lake2tr"])
+def test_load_workers(tmpdir, example_data_path, ex_name):
+    sim_ws = str(example_data_path / "mf6" / ex_name)
+    sims = {}
+    for workers in (1, 4):
+        sim = MFSimulation.load(
+            sim_ws=sim_ws,
+            verbosity_level=0,
+            write_headers=False,
+            workers=workers,
+        )
+        sim.set_sim_path(str(tmpdir / f"workers{workers}"))
+        sim.write_simulation()
+        sims[workers] = sim
+
+    # packages are registered in the same order
+    for name in sims[1].model_names:
+        packages = sims[1].get_model(name).packagelist
+        packages_p = sims[4].get_model(name).packagelist
+        assert [pkg.path for pkg in packages] == [
+            pkg.path for pkg in packages_p
+        ]
+        assert [pkg.filename for pkg in packages] == [
+            pkg.filename for pkg in packages_p
+        ]
+
+    # and written out the same way
+    files = sorted(os.listdir(str(tmpdir / "workers1")))
+    assert files == sorted(os.listdir(str(tmpdir / "workers4")))
+    for fname in files:
+        with open(str(tmpdir / "workers1" / fname)) as f:
+            text = f.read()
+        with open(str(tmpdir / "workers4" / fname)) as f:
+            assert f.read() == text, fname
+
+
+def test_lazy_load(tmpdir, example_data_path):
+    sim_ws = str(tmpdir / "lazy")
+    shutil.copytree(
+        str(example_data_path / "mf6" / "test005_advgw_tidal"), sim_ws
+    )
+    sim = MFSimulation.load(sim_ws=sim_ws, verbosity_level=0)
+    sim_lazy = MFSimulation.load(
+        sim_ws=sim_ws, verbosity_level=0, write_headers=False, lazy_load=True
+    )
+    model = sim.get_model()
+    model_lazy = sim_lazy.get_model()
+    assert model_lazy.npf.blocks["griddata"]._deferred_load is not None
+    assert model_lazy.wel.blocks["period"]._deferred_load is not None
+
+    # only the data that is accessed is parsed
+    k = model_lazy.npf.k.array
+    assert np.array_equal(k, model.npf.k.array)
+    assert model_lazy.npf.blocks["griddata"]._deferred_load is None
+    assert model_lazy.wel.blocks["period"]._deferred_load is not None
+
+    # untouched blocks are written unchanged
+    model_lazy.npf.k = k * 2.0
+    sim_lazy.write_simulation()
+    assert model_lazy.wel.blocks["period"]._deferred_load is not None
+    with open(os.path.join(sim_ws, "AdvGW_tidal.wel")) as f:
+        text = f.read()
+    with open(
+        str(
+            example_data_path
+            / "mf6"
+            / "test005_advgw_tidal"
+            / "AdvGW_tidal.wel"
+        )
+    ) as f:
+        text_org = f.read()
+    period = text_org[text_org.upper().index("BEGIN PERIOD") :].rstrip()
+    assert period in text
+
+    # data can still be parsed after the package files are overwritten
+    wel_data = model_lazy.wel.stress_period_data.get_data()
+    wel_data_org = model.wel.stress_period_data.get_data()
+    assert wel_data.keys() == wel_data_org.keys()
+    for key, data in wel_data.items():
+        assert np.array_equal(data, wel_data_org[key])
+
+    sim_load = MFSimulation.load(sim_ws=sim_ws, verbosity_level=0)
+    model_load = sim_load.get_model()
+    assert np.allclose(model_load.npf.k.array, k * 2.0)
+    assert np.array_equal(model_load.sto.ss.array, model_lazy.sto.ss.array)
+
+    # packages loaded after the simulation is loaded are parsed eagerly
+    assert not sim_lazy.simulation_data.lazy_load
+    wel = model_lazy.load_package(
+        "wel", "AdvGW_tidal.wel", "wel_2", True, None
+    )
+    assert wel.blocks["period"]._deferred_load is None
+
+
+def test_write_simulation_workers(tmpdir, example_data_path):
+    sim_ws = str(example_data_path / "mf6" / "test045_lake2tr")
+    for workers in (1, 4):
+        sim = MFSimulation.load(
+            sim_ws=sim_ws, verbosity_level=0, write_headers=False
+        )
+        sim.set_sim_path(str(tmpdir / f"workers{workers}"))
+        sim.write_simulation(workers=workers)
+
+    files = sorted(os.listdir(str(tmpdir / "workers1")))
+    assert files == sorted(os.listdir(str(tmpdir / "workers4")))
+    for fname in files:
+        with open(str(tmpdir / "workers1" / fname)) as f:
+            text = f.read()
+        with open(str(tmpdir / "workers4" / fname)) as f:
+            assert f.read() == text, fname
+
+
+def test_write_simulation_skip_unchanged(tmpdir, example_data_path):
+    sim_ws = str(tmpdir / "skip")
+    shutil.copytree(
+        str(example_data_path / "mf6" / "test005_advgw_tidal"), sim_ws
+    )
+    sim = MFSimulation.load(sim_ws=sim_ws, verbosity_level=0)
+    model = sim.get_model()
+    assert not sim.name_file.modified
+    assert not any(pkg.modified for pkg in model.packagelist)
+
+    # reading data does not change a package
+    model.npf.k.get_data()
+    model.wel.stress_period_data.get_data()
+    assert not model.npf.modified
+    assert not model.wel.modified
+
+    k = model.npf.k.array * 2.0
+    model.npf.k = k
+    assert model.npf.modified
+    assert [pkg for pkg in model.packagelist if pkg.modified] == [model.npf]
+
+    # only the changed package is written
+    for fname in os.listdir(sim_ws):
+        os.utime(os.path.join(sim_ws, fname), (0, 0))
+    sim.write_simulation(skip_unchanged=True)
+    changed = [
+        fname
+        for fname in os.listdir(sim_ws)
+        if os.path.getmtime(os.path.join(sim_ws, fname)) > 0
+    ]
+    assert changed == ["AdvGW_tidal.npf"]
+    assert not model.npf.modified
+
+    sim_load = MFSimulation.load(sim_ws=sim_ws, verbosity_level=0)
+    assert np.allclose(sim_load.get_model().npf.k.array, k)
+
+    # packages are written to a new simulation folder
+    sim.set_sim_path(str(tmpdir / "skip_new"))
+    assert model.wel.modified
+    sim.write_simulation(skip_unchanged=True)
+    sim_load.set_sim_path(str(tmpdir / "full"))
+    sim_load.write_simulation()
+    assert sorted(os.listdir(str(tmpdir / "skip_new"))) == sorted(
+        os.listdir(str(tmpdir / "full"))
+    )
+
+
+def test_load_write_profiler(tmpdir, example_data_path):
+    sim_ws = str(example_data_path / "mf6" / "test045_lake2tr")
+    profiler = MFProfiler()
+    sim = MFSimulation.load(
+        sim_ws=sim_ws, verbosity_level=0, profiler=profiler
+    )
+    assert sim.simulation_data.profiler is None
+    report = profiler.get_report("load")
+    packages = [rec for rec in report if rec["block"] is None]
+    blocks = [rec for rec in report if rec["block"] is not None]
+    model = sim.get_model()
+    assert {rec["package"] for rec in packages} >= {
+        pkg.package_name for pkg in model.packagelist
+    }
+    assert all(rec["time"] > 0.0 for rec in report)
+
+    # block records add up to the package records
+    npf = [rec for rec in packages if rec["package_type"] == "npf"][0]
+    assert npf["bytes"] > 0 and npf["lines"] > 0
+    npf_blocks = [
+        rec
+        for rec in blocks
+        if rec["package"] == npf["package"] and rec["model"] == npf["model"]
+    ]
+    assert {rec["block"] for rec in npf_blocks} >= {"options", "griddata"}
+    assert sum(rec["bytes"] for rec in npf_blocks) <= npf["bytes"]
+    assert sum(rec["time"] for rec in npf_blocks) <= npf["time"]
+    period = [
+        rec
+        for rec in blocks
+        if rec["package_type"] == "lak" and rec["block"] == "period"
+    ]
+    assert period and all(rec["header"] is not None for rec in period)
+    assert len(profiler.get_report("initialize")) == 1
+
+    # writes are recorded separately
+    profiler.reset()
+    sim.set_sim_path(str(tmpdir))
+    sim.write_simulation(workers=2, profiler=profiler)
+    assert sim.simulation_data.profiler is None
+    report = profiler.get_report("write")
+    assert {rec["operation"] for rec in profiler.get_report()} == {"write"}
+    npf = [
+        rec
+        for rec in report
+        if rec["package_type"] == "npf" and rec["block"] is None
+    ][0]
+    with open(str(tmpdir / model.npf.filename)) as f:
+        text = f.read()
+    assert npf["bytes"] == len(text)
+    assert npf["lines"] == text.count("\n")
+
+    if has_pkg("pandas"):
+        df = profiler.get_dataframe()
+        assert len(df) == len(report)
+        assert df["bytes"].sum() > 0
+
+
+def test_lazy_package_import():
+    # package classes and structures are only set up when first used
+    script = """
+import sys
+import flopy
+from flopy.mf6.data.mfstructure import MFStructure, MFStructureDict
+
+def imported(module):
+    return f"flopy.mf6.modflow.{module}" in sys.modules
+
+assert not imported("mfgwfnpf") and not imported("mfgwf")
+sim = flopy.mf6.MFSimulation()
+gwf = flopy.mf6.ModflowGwf(sim)
+dis = flopy.mf6.ModflowGwfdis(gwf)
+assert imported("mfgwfdis")
+assert not imported("mfgwfnpf") and not imported("mfgwtdsp")
+structs = MFStructure().sim_struct.model_struct_objs["gwf6"].package_struct_objs
+assert isinstance(structs, MFStructureDict)
+assert "npf" in structs
+assert not imported("mfgwfnpf")
+assert structs["npf"].dfn_file_name == "gwf-npf.dfn"
+assert imported("mfgwfnpf")
+assert structs["rcha"].read_as_arrays and not structs["rch"].read_as_arrays
+for name in flopy.mf6.__all__:
+    getattr(flopy.mf6, name)
+"""
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+
+def test_get_data_view(tmpdir):
+    nlay, nrow, ncol = 3, 10, 10
+    shape3d = (nlay, nrow, ncol)
+    sim = MFSimulation(sim_ws=str(tmpdir))
+    ModflowTdis(sim, nper=2)
+    ModflowIms(sim)
+    gwf = ModflowGwf(sim, modelname="gwf")
+    ModflowGwfdis(gwf, nlay=nlay, nrow=nrow, ncol=ncol)
+    k = np.random.default_rng(0).random(shape3d)
+    npf = ModflowGwfnpf(
+        gwf,
+        k={"data": k, "layered": False},
+        k33=[1.0, 2.0, 3.0],
+        icelltype=[0, 1, 1],
+    )
+    wel = ModflowGwfwel(
+        gwf, stress_period_data={0: [((0, 0, 0), -1.0)], 1: []}
+    )
+
+    # stored arrays are returned read-only without a copy
+    view = npf.k.get_data_view()
+    assert np.array_equal(view, k)
+    storage = npf.k._get_storage_obj().layer_storage.first_item()
+    assert np.shares_memory(view, storage.internal_data)
+    assert not view.flags.writeable
+    assert npf.k.get_data_view() is view
+    with pytest.raises(ValueError):
+        view[0, 0, 0] = 0.0
+
+    # built arrays are cached
+    k33 = npf.k33.get_data_view()
+    assert np.array_equal(k33, npf.k33.array)
+    assert npf.k33.get_data_view() is k33
+    assert np.array_equal(npf.k33.get_data_view(1), np.full((nrow, ncol), 2))
+    assert np.array_equal(npf.icelltype.get_data_view(), npf.icelltype.array)
+
+    # views are rebuilt when the data changes
+    npf.k.factor = 2.0
+    assert np.array_equal(npf.k.get_data_view(), k * 2.0)
+    assert np.array_equal(npf.k.get_data_view(apply_mult=False), k)
+    npf.k.set_data(k + 1.0)
+    assert np.array_equal(npf.k.get_data_view(apply_mult=False), k + 1.0)
+    npf.k33[0].factor = 4.0
+    assert npf.k33.get_data_view()[0, 0, 0] == 4.0
+    npf.k33.set_data([5.0, 6.0, 7.0])
+    assert np.array_equal(npf.k33.get_data_view(), npf.k33.array)
+
+    # external arrays are read once
+    npf.k33.store_as_external_file("k33.txt")
+    k33 = npf.k33.get_data_view()
+    assert np.array_equal(k33, npf.k33.array)
+    assert npf.k33.get_data_view() is k33
+
+    # stress period data
+    spd = wel.stress_period_data.get_data_view(0)
+    assert not spd.flags.writeable
+    assert spd["q"][0] == -1.0
+    assert wel.stress_period_data.get_data_view(0) is spd
+    wel.stress_period_data.set_data([((0, 0, 1), -2.0)], key=0)
+    spd = wel.stress_period_data.get_data_view(0)
+    assert spd["cellid"][0] == (0, 0, 1)
+    assert spd["q"][0] == -2.0
+    views = wel.stress_period_data.get_data_view()
+    assert views.keys() == wel.stress_period_data.get_data().keys()
+    assert views[0] is spd
+
+
 @requires_exe("mf6")
 def test_write_simulation(tmpdir):
     sim = MFSimulation(sim_ws=str(tmpdir))
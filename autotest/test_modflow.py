@@ -731,6 +731,44 @@ def test_mflist_add_record():
     np.testing.assert_array_equal(wel.stress_period_data[1], check1)
 
 
+def test_mflist_write(tmpdir):
+    ml = Modflow("mflist_write", model_ws=str(tmpdir))
+    ModflowDis(ml, 2, 10, 10, nper=3)
+    wel_data = {
+        0: [[0, 1, 2, 0.1], [1, 9, 9, -1.5e-7]],
+        2: [[0, 0, 0, 2.0e12]],
+    }
+    ModflowWel(ml, stress_period_data=wel_data)
+    ml.write_input()
+    with open(str(tmpdir / "mflist_write.wel")) as f:
+        lines = f.readlines()
+    assert lines[-6:] == [
+        "         2         0 # stress period 1\n",
+        "         1         2         3             0.1\n",
+        "         2        10        10        -1.5e-07\n",
+        "        -1         0 # stress period 2\n",
+        "         1         0 # stress period 3\n",
+        "         1         1         1 2000000000000.0\n",
+    ]
+
+    # binary periods are written to external files
+    ml = Modflow("mflist_binary", model_ws=str(tmpdir))
+    ModflowDis(ml, 2, 10, 10, nper=3)
+    wel = ModflowWel(ml, stress_period_data=wel_data, binary=True)
+    ml.write_input()
+    data = np.fromfile(
+        str(tmpdir / "WEL_0000.bin"),
+        dtype=[(name, np.float32) for name in wel.dtype.names],
+    )
+    assert np.array_equal(data["k"], [1, 2])
+    assert np.array_equal(data["i"], [2, 10])
+    assert np.array_equal(data["j"], [3, 10])
+    assert np.array_equal(
+        data["flux"], wel.stress_period_data[0]["flux"].astype(np.float32)
+    )
+    assert (tmpdir / "WEL_0002.bin").exists()
+
+
 __mf2005_test_path = get_example_data_path() / "mf2005_test"
 
 
@@ -999,6 +1037,44 @@ def test_mfcbc(tmpdir):
     ml.write_input()
 
 
+def test_load_lazy_arrays(tmpdir):
+    ws = str(tmpdir / "original")
+    m = Modflow("lazy", model_ws=ws)
+    ModflowDis(m, nlay=2, nrow=10, ncol=12)
+    ModflowBas(m)
+    hk = np.random.default_rng(0).random((2, 10, 12)) * 10.0
+    lpf = ModflowLpf(m, hk=hk, vka=hk)
+    for u2d in lpf.hk.util_2ds:
+        u2d.how = "openclose"
+    lpf.hk[1].format.binary = True
+    m.write_input()
+
+    # open/close arrays are not read until they are accessed
+    ml = Modflow.load("lazy.nam", model_ws=ws, check=False, lazy_load=True)
+    hk_files = []
+    for u2d in ml.lpf.hk.util_2ds:
+        assert u2d.vtype == str
+        hk_files.append(u2d.get_value())
+    assert ml.lpf.hk[1].format.binary
+    assert ml.lpf.vka[0].vtype != str
+
+    m0 = Modflow.load("lazy.nam", model_ws=ws, check=False)
+    assert np.array_equal(ml.lpf.hk.array, m0.lpf.hk.array)
+    assert np.allclose(ml.lpf.hk.array, hk)
+
+    # unmodified arrays are copied from the original files
+    ws2 = str(tmpdir / "copy")
+    ml.change_model_ws(ws2)
+    ml.write_input()
+    for k, fpth in enumerate(hk_files):
+        with open(fpth, "rb") as f:
+            original = f.read()
+        with open(os.path.join(ws2, ml.lpf.hk[k].filename), "rb") as f:
+            assert f.read() == original
+    m2 = Modflow.load("lazy.nam", model_ws=ws2, check=False)
+    assert np.array_equal(m2.lpf.hk.array, m0.lpf.hk.array)
+
+
 def test_load_with_list_reader(tmpdir):
     # Create an original model and then manually modify to use
     # advanced list reader capabilities
@@ -1198,3 +1274,53 @@ def test_model_load_time(tmpdir, benchmark):
     benchmark(
         lambda: Modflow.load(f"{name}.nam", model_ws=str(tmpdir), check=False)
     )
+
+
+@pytest.mark.slow
+def test_mflist_write_time(tmpdir, benchmark):
+    ml = Modflow("mflist_time", model_ws=str(tmpdir))
+    nlay, nrow, ncol, nper = 3, 100, 100, 10
+    ModflowDis(ml, nlay, nrow, ncol, nper=nper)
+    cells = np.indices((nlay, nrow, ncol)).reshape(3, -1).T
+    flux = np.random.default_rng(0).random(len(cells))
+    wel_data = {
+        kper: np.column_stack([cells, flux * kper]).tolist()
+        for kper in range(nper)
+    }
+    wel = ModflowWel(ml, stress_period_data=wel_data)
+    benchmark(lambda: wel.write_file())
+
+
+@pytest.mark.slow
+def test_mflist_load_time(tmpdir, benchmark):
+    ml = Modflow("mflist_load", model_ws=str(tmpdir))
+    nlay, nrow, ncol, nper = 3, 100, 100, 10
+    ModflowDis(ml, nlay, nrow, ncol, nper=nper)
+    cells = np.indices((nlay, nrow, ncol)).reshape(3, -1).T
+    flux = np.random.default_rng(0).random(len(cells))
+    wel_data = {
+        kper: np.column_stack([cells, flux * kper]).tolist()
+        for kper in range(nper)
+    }
+    ModflowWel(ml, stress_period_data=wel_data)
+    ml.write_input()
+    benchmark(
+        lambda: ModflowWel.load(
+            str(tmpdir / "mflist_load.wel"), ml, nper=nper, check=False
+        )
+    )
+
+
+@pytest.mark.slow
+def test_mflist_4d_arrays_time(benchmark):
+    ml = Modflow("mflist_4d")
+    nlay, nrow, ncol, nper = 3, 100, 100, 100
+    ModflowDis(ml, nlay, nrow, ncol, nper=nper)
+    cells = np.indices((nlay, nrow, ncol)).reshape(3, -1).T[::10]
+    flux = np.random.default_rng(0).random(len(cells))
+    wel_data = {
+        kper: np.column_stack([cells, flux * (kper % 5)]).tolist()
+        for kper in range(nper)
+    }
+    wel = ModflowWel(ml, stress_period_data=wel_data)
+    benchmark(lambda: list(wel.stress_period_data.masked_4D_arrays_itr()))
@@ -583,6 +583,37 @@ def test_mflist(tmpdir, example_data_path):
     assert df.groupby(["k", "i", "j"])["rbot"].count()[(1, 2, 4)] == 10
 
 
+def test_mflist_to_array_reuse():
+    ml = Modflow()
+    ModflowDis(ml, nlay=1, nrow=3, ncol=3, nper=5)
+    wel_data = {
+        0: [[0, 0, 0, 1.0], [0, 0, 0, 2.0]],
+        1: -1,
+        2: 0,
+        3: [[0, 1, 1, 5.0]],
+        4: [[0, 1, 1, 5.0]],
+    }
+    wel = ModflowWel(ml, stress_period_data=wel_data)
+    spd = wel.stress_period_data
+
+    # reused stress periods resolve to the data they reuse
+    assert spd.to_array(1)["flux"][0, 0, 0] == 3.0
+    assert spd.to_array(1)["flux"].sum() == 3.0
+    assert np.isnan(spd.to_array(2, mask=True)["flux"]).all()
+
+    m4d = dict(spd.masked_4D_arrays_itr())["flux"]
+    assert m4d.shape == (5, 1, 3, 3)
+    assert np.array_equal(m4d[0], m4d[1], equal_nan=True)
+    assert np.isnan(m4d[0]).sum() == 8
+    assert np.isnan(m4d[2]).all()
+    assert np.array_equal(m4d[3], m4d[4], equal_nan=True)
+    assert m4d[4, 0, 1, 1] == 5.0
+    for kper in range(ml.nper):
+        assert np.array_equal(
+            m4d[kper], spd.to_array(kper, mask=True)["flux"], equal_nan=True
+        )
+
+
 def test_how(tmpdir):
     ml = Modflow(model_ws=str(tmpdir))
     ml.array_free_format = False
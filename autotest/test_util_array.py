@@ -5,6 +5,7 @@ from tempfile import TemporaryFile
 from textwrap import dedent
 
 import numpy as np
+import pytest
 
 from flopy.utils.util_array import Util2d
 
@@ -86,6 +87,43 @@ def test_load_txt_fixed():
     assert fa.dtype == a.dtype
 
 
+def test_load_txt_stops_at_array_end():
+    # values past the end of the array on its last line are not read
+    a = np.array([1.0, 1.0, 1.0, 2.0, 2.0], dtype=np.float32)
+    fp = StringIO("3*1.0\n1*2.0 4*2.0 x\nNEXT\n")
+    fa = Util2d.load_txt(a.shape, fp, a.dtype, "(FREE)")
+    np.testing.assert_equal(fa, a)
+    assert fp.readline() == "NEXT\n"
+
+    a = np.arange(1, 6, dtype=np.int32)
+    fp = StringIO(" 1 2 3\n 4   5 x\nNEXT\n")
+    fa = Util2d.load_txt(a.shape, fp, a.dtype, "(3I2)")
+    np.testing.assert_equal(fa, a)
+    assert fp.readline() == "NEXT\n"
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("fmtin", ["(FREE)", "(10E15.6)", "repeat"])
+def test_load_txt_time(benchmark, fmtin):
+    nrow, ncol = 1000, 1000
+    a = np.random.default_rng(0).random((nrow, ncol)).astype(np.float32)
+    fp = StringIO()
+    if fmtin == "repeat":
+        for value in a[:, 0]:
+            fp.write(f"{ncol}*{value}\n")
+        fmtin = "(FREE)"
+        a[:] = a[:, :1]
+    else:
+        Util2d.write_txt(a.shape, fp, a, fortran_format=fmtin)
+
+    def load():
+        fp.seek(0)
+        return Util2d.load_txt(a.shape, fp, a.dtype, fmtin)
+
+    fa = benchmark(load)
+    np.testing.assert_allclose(fa, a, rtol=1e-5)
+
+
 def test_load_block():
     a = np.ones((2, 5), dtype=np.int32) * 4
     fp = StringIO(
@@ -13,6 +13,7 @@ from ..utils import (
     ZBNetOutput,
     import_optional_dependency,
 )
+from ..utils.binaryfile import BinaryLayerFile
 from . import NetCdf, netcdf, shapefile_utils, vtk
 from .longnames import NC_LONG_NAMES
 from .unitsformat import NC_UNITS_FORMAT
@@ -142,7 +143,29 @@ def _add_output_nc_variable(
     text="",
     mask_vals=(),
     mask_array3d=None,
+    chunksize=10,
+    workers=1,
 ):
+    # stream binary layer files to the netcdf file in chunks of times
+    if (
+        isinstance(f, NetCdf)
+        and isinstance(out_obj, BinaryLayerFile)
+        and not text
+    ):
+        _add_output_nc_layerfile_variable(
+            f,
+            times,
+            shape3d,
+            out_obj,
+            var_name,
+            logger=logger,
+            mask_vals=mask_vals,
+            mask_array3d=mask_array3d,
+            chunksize=chunksize,
+            workers=workers,
+        )
+        return
+
     if logger:
         logger.log(f"creating array for {var_name}")
 
@@ -249,6 +272,116 @@ def _add_output_nc_variable(
             raise Exception(estr)
 
 
+def _add_output_nc_layerfile_variable(
+    f,
+    times,
+    shape3d,
+    out_obj,
+    var_name,
+    logger=None,
+    mask_vals=(),
+    mask_array3d=None,
+    chunksize=10,
+    workers=1,
+):
+    """
+    Method to add a binary layer file (head, drawdown, or concentration)
+    to a netcdf file, reading and writing chunksize times at a time so that
+    the data for all times is never held in memory.
+
+    Parameters
+    ----------
+    f : NetCdf object
+    times : list of float
+        output times to write
+    shape3d : tuple
+        (nlay, nrow, ncol) of the model grid
+    out_obj : BinaryLayerFile
+        binary layer file instance
+    var_name : str
+        name of the netcdf variable
+    logger : flopy.export.netcdf.Logger instance
+    mask_vals : list
+        values to set to the netcdf fill value
+    mask_array3d : np.ndarray
+        boolean array of cells to set to the netcdf fill value
+    chunksize : int
+        number of output times read and written at a time
+    workers : int
+        number of threads used to read chunks from out_obj
+
+    """
+    units = None
+    if var_name in NC_UNITS_FORMAT:
+        units = NC_UNITS_FORMAT[var_name].format(f.grid_units, f.time_units)
+    precision_str = "f4"
+
+    attribs = {"long_name": var_name}
+    attribs["coordinates"] = "time layer latitude longitude"
+    if units is not None:
+        attribs["units"] = units
+    try:
+        dim_tuple = ("time",) + f.dimension_names
+        var = f.create_variable(
+            var_name,
+            attribs,
+            precision_str=precision_str,
+            dimensions=dim_tuple,
+        )
+    except Exception as e:
+        estr = f"error creating variable {var_name}:\n{e!s}"
+        if logger:
+            logger.lraise(estr)
+        else:
+            raise Exception(estr)
+
+    if logger:
+        logger.log(f"writing chunks for {var_name}")
+    mn, mx = np.NaN, np.NaN
+    itim0 = 0
+    for array in out_obj.iter_alldata(
+        chunksize=chunksize, nodata=None, times=times, workers=workers
+    ):
+        itim1 = itim0 + array.shape[0]
+        array = array.astype(np.float32)
+        if array.shape[1:] != tuple(shape3d):
+            estr = (
+                f"error assigning {var_name} data to array for times "
+                f"{times[itim0]} to {times[itim1 - 1]}: data shape "
+                f"{array.shape[1:]} does not match {tuple(shape3d)}"
+            )
+            if logger:
+                logger.warn(estr)
+            else:
+                print(estr)
+            itim0 = itim1
+            continue
+        if mask_array3d is not None:
+            array[:, mask_array3d] = np.NaN
+        for mask_val in mask_vals:
+            array[np.where(array == mask_val)] = np.NaN
+        if not np.all(np.isnan(array)):
+            mn = np.fmin(mn, np.nanmin(array))
+            mx = np.fmax(mx, np.nanmax(array))
+        array[np.isnan(array)] = netcdf.FILLVALUE
+        try:
+            var[itim0:itim1] = array
+        except Exception as e:
+            estr = f"error setting array to variable {var_name}:\n{e!s}"
+            if logger:
+                logger.lraise(estr)
+            else:
+                raise Exception(estr)
+        itim0 = itim1
+    if logger:
+        logger.log(f"writing chunks for {var_name}")
+
+    attribs["min"] = mn
+    attribs["max"] = mx
+    var.setncattr("min", mn)
+    var.setncattr("max", mx)
+
+
 def _add_output_nc_zonebudget_variable(f, array, var_name, flux, logger=None):
     """
     Method to add zonebudget output data to netcdf file
@@ -310,6 +443,12 @@ def output_helper(f, ml, oudic, **kwargs):
             zero based model layer which can be used in shapefile exporting
         kper : int
             zero based stress period which can be used for shapefile exporting
+        chunksize : int
+            number of output times of binary head and concentration files
+            that are read and written to netcdf files at a time (default 10)
+        workers : int
+            number of threads used to read binary head and concentration
+            files for netcdf export (default 1)
 
     Returns
     -------
@@ -324,6 +463,8 @@ def output_helper(f, ml, oudic, **kwargs):
     logger = kwargs.pop("logger", None)
     stride = kwargs.pop("stride", 1)
     forgive = kwargs.pop("forgive", False)
+    chunksize = kwargs.pop("chunksize", 10)
+    workers = kwargs.pop("workers", 1)
     kwargs.pop("suffix", None)
     mask_vals = []
     mflay = kwargs.pop("mflay", None)
@@ -424,6 +565,8 @@ def output_helper(f, ml, oudic, **kwargs):
                     logger=logger,
                     mask_vals=mask_vals,
                     mask_array3d=mask_array3d,
+                    chunksize=chunksize,
+                    workers=workers,
                 )
 
             elif isinstance(out_obj, HeadFile):
@@ -436,6 +579,8 @@ def output_helper(f, ml, oudic, **kwargs):
                     logger=logger,
                     mask_vals=mask_vals,
                     mask_array3d=mask_array3d,
+                    chunksize=chunksize,
+                    workers=workers,
                 )
 
             elif isinstance(out_obj, FormattedHeadFile):
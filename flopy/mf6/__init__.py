@@ -1,5 +1,28 @@
-from . import coordinates, data, utils
+from . import coordinates, data, modflow, utils
 from .data import mfdataarray, mfdatalist, mfdatascalar
-from .mfbase import ExtFileAction
+from .mfbase import ExtFileAction, MFProfiler
 from .mfmodel import MFModel
-from .modflow import *
+from .modflow import MFSimulation
+
+__all__ = [
+    "coordinates",
+    "data",
+    "modflow",
+    "utils",
+    "mfdataarray",
+    "mfdatalist",
+    "mfdatascalar",
+    "ExtFileAction",
+    "MFProfiler",
+    "MFModel",
+    *modflow.__all__,
+]
+
+
+def __getattr__(name):
+    # generated package and model classes are imported on first use
+    return getattr(modflow, name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -5,6 +5,7 @@ modeldimensions module.  Contains the model dimension information
 """
 
 import sys
+import threading
 
 from ...utils.datautil import DatumUtil, NameIter
 from ..data.mfstructure import DatumType
@@ -287,6 +288,13 @@ class PackageDimensions:
         return names_dict
 
 
+class _LockState(threading.local):
+    locked = False
+
+    def __init__(self):
+        self.stored_shapes = {}
+
+
 class ModelDimensions:
     """
     Contains model dimension information and helper methods
@@ -341,15 +349,33 @@ class ModelDimensions:
         self.simulation_data = simulation_data
         self._model_grid = None
         self.simulation_time = SimulationTime(simulation_data)
-        self.locked = False
-        self.stored_shapes = {}
+        # lock state and cached shapes are kept per thread so that
+        # packages can be loaded from several threads at once
+        self._lock_state = _LockState()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock_state"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock_state = _LockState()
+
+    @property
+    def locked(self):
+        return self._lock_state.locked
+
+    @property
+    def stored_shapes(self):
+        return self._lock_state.stored_shapes
 
     def lock(self):
-        self.locked = True
+        self._lock_state.locked = True
 
     def unlock(self):
-        self.locked = False
-        self.stored_shapes = {}
+        self._lock_state.locked = False
+        self._lock_state.stored_shapes = {}
 
     # returns model grid
     def get_model_grid(self):
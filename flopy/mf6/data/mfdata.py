@@ -93,6 +93,7 @@ class MFTransient:
             if self._current_key == old_transient_key:
                 # update current key
                 self._current_key = new_transient_key
+            self._set_modified()
 
     def _transient_setup(self, data_storage):
         self._data_storage = data_storage
@@ -225,6 +226,9 @@ class MFData(DataInterface):
 
     """
 
+    # block whose file contents have not been parsed yet (lazy loading)
+    _deferred_block = None
+
     def __init__(
         self,
         sim_data,
@@ -276,6 +280,17 @@ class MFData(DataInterface):
     def __str__(self):
         return str(self._get_storage_obj())
 
+    @property
+    def _data_storage(self):
+        # parse data skipped by a lazy load the first time it is needed
+        if self._deferred_block is not None:
+            self._deferred_block.load_deferred()
+        return self._storage
+
+    @_data_storage.setter
+    def _data_storage(self, storage):
+        self._storage = storage
+
     @property
     def path(self):
         return self._path
@@ -536,6 +551,18 @@ class MFData(DataInterface):
     def _get_storage_obj(self):
         return self._data_storage
 
+    def _set_modified(self):
+        # flag the package containing this data as changed
+        storage = self._get_storage_obj()
+        if storage is not None:
+            storage.set_modified()
+            return
+        package_dim = self._data_dimensions.package_dim
+        if package_dim is not None:
+            self._simulation_data.modified_packages.add(
+                package_dim.package_path
+            )
+
 
 class MFMultiDimVar(MFData):
     def __init__(
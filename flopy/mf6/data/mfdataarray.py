@@ -130,14 +130,10 @@ class MFArray(MFMultiDimVar):
     def __setattr__(self, name, value):
         if name == "__setstate__":
             raise AttributeError(name)
-        elif name == "fname":
-            self._get_storage_obj().layer_storage.first_item().fname = value
-        elif name == "factor":
-            self._get_storage_obj().layer_storage.first_item().factor = value
-        elif name == "iprn":
-            self._get_storage_obj().layer_storage.first_item().iprn = value
-        elif name == "binary":
-            self._get_storage_obj().layer_storage.first_item().binary = value
+        elif name in ("fname", "factor", "iprn", "binary"):
+            storage = self._get_storage_obj()
+            setattr(storage.layer_storage.first_item(), name, value)
+            storage.set_modified()
         else:
             super().__setattr__(name, value)
 
@@ -405,6 +401,7 @@ class MFArray(MFMultiDimVar):
                 self._simulation_data.debug,
             )
         self._get_storage_obj().layered = layered_data
+        self._set_modified()
 
     def make_layered(self):
         """Changes the data to be stored by layer instead of as a single array."""
@@ -754,6 +751,49 @@ class MFArray(MFMultiDimVar):
                 )
         return None
 
+    def get_data_view(self, layer=None, apply_mult=True):
+        """Returns a read-only view of the data associated with layer
+        "layer".  If "layer" is None, returns all data.  Unlike get_data,
+        stored arrays are returned without being copied and arrays that
+        must be built (constants, multipliers, external files) are cached
+        until the data is changed.
+
+        Parameters
+        ----------
+            layer : int
+            apply_mult : bool
+                Whether to apply the multiplier to the data
+
+        Returns
+        -------
+             data : ndarray
+                Read-only array data in an ndarray
+
+        """
+        if isinstance(layer, int):
+            layer = (layer,)
+        storage = self._get_storage_obj()
+        if storage is None:
+            return None
+        try:
+            return storage.get_data_view(layer, apply_mult)
+        except Exception as ex:
+            type_, value_, traceback_ = sys.exc_info()
+            raise MFDataException(
+                self.structure.get_model(),
+                self.structure.get_package(),
+                self._path,
+                "getting data view",
+                self.structure.name,
+                inspect.stack()[0][3],
+                type_,
+                value_,
+                traceback_,
+                None,
+                self._simulation_data.debug,
+                ex,
+            )
+
     def get_record(self, layer=None):
         """Returns the data record associated with layer "layer".  If "layer"
         is None, returns all data.
@@ -1635,6 +1675,7 @@ class MFTransientArray(MFArray, MFTransient):
         """
         if transient_key in self._data_storage:
             del self._data_storage[transient_key]
+            self._set_modified()
 
     def add_transient_key(self, transient_key):
         """Adds a new transient time allowing data for that time to be stored
@@ -1847,6 +1888,40 @@ class MFTransientArray(MFArray, MFTransient):
         else:
             return None
 
+    def get_data_view(self, key=None, apply_mult=True):
+        """Returns a read-only view of the data associated with stress
+        period key `key`.  If `key` is None, returns a dictionary of views
+        of all stress periods.  Views are cached until the data is
+        changed.
+
+        Parameters
+        ----------
+            key : int
+                Zero-based stress period of data to return
+            apply_mult : bool
+                Whether to apply multiplier to data prior to returning it
+
+        """
+        if self._data_storage is not None and len(self._data_storage) > 0:
+            if key is None:
+                sim_time = self._data_dimensions.package_dim.model_dim[
+                    0
+                ].simulation_time
+                output = {}
+                for sp in range(0, sim_time.get_num_stress_periods()):
+                    output[sp] = None
+                    if sp in self._data_storage:
+                        self.get_data_prep(sp)
+                        output[sp] = super().get_data_view(
+                            apply_mult=apply_mult
+                        )
+                return output
+            else:
+                self.get_data_prep(key)
+                return super().get_data_view(apply_mult=apply_mult)
+        else:
+            return None
+
     def _build_period_data(
         self, num_sp, apply_mult=False, get_record=False, **kwargs
     ):
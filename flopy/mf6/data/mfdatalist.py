@@ -383,6 +383,47 @@ class MFList(mfdata.MFMultiDimVar, DataListInterface):
         """
         return self._get_data(apply_mult, **kwargs)
 
+    def get_data_view(self, apply_mult=False):
+        """Returns a read-only view of the list's data.  The stored recarray
+        is returned without being copied and data read from external files
+        is cached until the data is changed.
+
+        Parameters
+        ----------
+            apply_mult : bool
+                Whether to apply a multiplier.
+
+        Returns
+        -------
+            data : recarray
+
+        """
+        try:
+            if self._get_storage_obj() is None:
+                return None
+            block_exists = self._block.header_exists(
+                self._current_key, self.path
+            )
+            return self._get_storage_obj().get_data_view(
+                block_exists=block_exists
+            )
+        except Exception as ex:
+            type_, value_, traceback_ = sys.exc_info()
+            raise MFDataException(
+                self.structure.get_model(),
+                self.structure.get_package(),
+                self._path,
+                "getting data view",
+                self.structure.name,
+                inspect.stack()[0][3],
+                type_,
+                value_,
+                traceback_,
+                None,
+                self._simulation_data.debug,
+                ex,
+            )
+
     def get_record(self):
         """Returns the list's data and metadata in a dictionary.  Data is in
         key "data" and metadata in keys "filename" and "binary".
@@ -1611,6 +1652,7 @@ class MFTransientList(MFList, mfdata.MFTransient, DataListInterface):
         """
         if transient_key in self._data_storage:
             del self._data_storage[transient_key]
+            self._set_modified()
 
     def add_transient_key(self, transient_key):
         """Adds a new transient time allowing data for that time to be stored
@@ -1785,6 +1827,35 @@ class MFTransientList(MFList, mfdata.MFTransient, DataListInterface):
         else:
             return None
 
+    def get_data_view(self, key=None, apply_mult=False):
+        """Returns a read-only view of the data for stress period `key`.  If
+        `key` is None, returns a dictionary of views of all stress periods
+        with data.  Views are cached until the data is changed.
+
+        Parameters
+        ----------
+            key : int
+                Zero-based stress period to return data from.
+            apply_mult : bool
+                Apply multiplier
+
+        Returns
+        -------
+            data : recarray
+
+        """
+        if self._data_storage is not None and len(self._data_storage) > 0:
+            if key is None:
+                output = {}
+                for sp in list(self._data_storage.keys()):
+                    self.get_data_prep(sp)
+                    output[sp] = super().get_data_view(apply_mult=apply_mult)
+                return output
+            self.get_data_prep(key)
+            return super().get_data_view(apply_mult=apply_mult)
+        else:
+            return None
+
     def set_record(self, data_record, autofill=False, check_data=True):
         """Sets the contents of the data based on the contents of
         'data_record`.
@@ -95,6 +95,15 @@ class LayerStorage:
 
     """
 
+    _view_attributes = {
+        "internal_data",
+        "data_const_value",
+        "data_storage_type",
+        "fname",
+        "factor",
+        "binary",
+    }
+
     def __init__(
         self,
         data_storage,
@@ -116,6 +125,12 @@ class LayerStorage:
         self.iprn = None
         self.binary = False
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in self._view_attributes:
+            # cached views of the parent's data are out of date
+            self._data_storage_parent._data_views.clear()
+
     def set_internal_constant(self):
         self.data_storage_type = DataStorageType.internal_constant
 
@@ -224,6 +239,8 @@ class DataStorage:
         returns true if data exists for the specified layer, false otherwise
     get_data(layer) : ndarray/recarray/string
         returns the data for the specified layer
+    get_data_view(layer) : ndarray/recarray/string
+        returns a cached, read-only view of the data for the specified layer
     update_item(data, key_index)
         updates the data in a recarray at index "key_index" with data "data".
         data is a list containing all data for a single record in the
@@ -296,6 +313,8 @@ class DataStorage:
         stress_period=0,
         data_path=(),
     ):
+        # read-only views of the data, cleared when the data changes
+        self._data_views = {}
         self.data_dimensions = data_dimensions
         self._model_or_sim = model_or_sim
         self._simulation_data = sim_data
@@ -338,12 +357,23 @@ class DataStorage:
     def __str__(self):
         return self.get_data_str(False)
 
+    def set_modified(self):
+        """Flags the package containing this data as changed since it was
+        last loaded or written."""
+        self._data_views.clear()
+        package_dim = self.data_dimensions.package_dim
+        if package_dim is not None:
+            self._simulation_data.modified_packages.add(
+                package_dim.package_path
+            )
+
     def _create_layer(self, indexes):
         return LayerStorage(
             self, indexes, self._data_storage_type, self._data_type
         )
 
     def flatten(self):
+        self._data_views.clear()
         self.layered = False
         storage_type = self.layer_storage.first_item().data_storage_type
         self.layer_storage = MultiList(
@@ -351,6 +381,7 @@ class DataStorage:
         )
 
     def make_layered(self):
+        self.set_modified()
         if not self.layered:
             if self.data_structure_type != DataStructureType.ndarray:
                 message = (
@@ -671,6 +702,37 @@ class DataStorage:
         else:
             return data
 
+    def get_data_view(self, layer=None, apply_mult=True, block_exists=False):
+        if isinstance(layer, list):
+            layer = tuple(layer)
+        key = (layer, apply_mult)
+        if key in self._data_views:
+            return self._data_views[key]
+        data = None
+        if self.data_structure_type == DataStructureType.ndarray and (
+            layer is None
+            and not self.layered
+            and self.data_dimensions.structure.name != "aux"
+        ):
+            # unlayered internal arrays without a multiplier are returned
+            # as they are stored
+            layer_storage = self.layer_storage.first_item()
+            factor = layer_storage.factor if apply_mult else None
+            if (
+                layer_storage.data_storage_type
+                == DataStorageType.internal_array
+                and isinstance(layer_storage.internal_data, np.ndarray)
+                and (factor is None or factor == 1)
+            ):
+                data = layer_storage.internal_data
+        if data is None:
+            data = self.get_data(layer, apply_mult, block_exists)
+        if isinstance(data, np.ndarray):
+            data = data.view()
+            data.flags.writeable = False
+            self._data_views[key] = data
+        return data
+
     def _access_data(self, layer, return_data=False, apply_mult=True):
         layer_check = self._resolve_layer(layer)
         if (
@@ -831,6 +893,7 @@ class DataStorage:
                     return True
 
     def append_data(self, data):
+        self.set_modified()
         # currently only support appending to recarrays
         if not (self.data_structure_type == DataStructureType.recarray):
             message = (
@@ -900,6 +963,7 @@ class DataStorage:
         check_data=False,
         preserve_record=False,
     ):
+        self.set_modified()
         if (
             self.data_structure_type == DataStructureType.recarray
             or self.data_structure_type == DataStructureType.scalar
@@ -1260,6 +1324,7 @@ class DataStorage:
         check_data=False,
         preserve_record=False,
     ):
+        self.set_modified()
         if multiplier is None and layer is not None:
             layer = self._layer_prep(layer)
             if self.layer_storage.in_shape(layer) and preserve_record:
@@ -1650,6 +1715,7 @@ class DataStorage:
         binary=False,
         preserve_record=False,
     ):
+        self.set_modified()
         if multiplier is None and layer is not None:
             layer = self._layer_prep(layer)
             if self.layer_storage.in_shape(layer) and preserve_record:
@@ -1750,6 +1816,8 @@ class DataStorage:
                     ext_file_entry = self._get_file_entry()
                     fd.write(ext_file_entry)
                     fd.close()
+                    if self._simulation_data.profiler is not None:
+                        self._simulation_data.profiler.add_file(fp)
 
                 # set as external data
                 self.layer_storage.first_item().internal_data = None
@@ -1825,6 +1893,7 @@ class DataStorage:
         )
 
     def set_ext_file_attributes(self, layer, file_path, print_format, binary):
+        self.set_modified()
         # point to the external file and set flags
         self.layer_storage[layer].fname = file_path
         self.layer_storage[layer].iprn = print_format
@@ -1986,6 +2055,8 @@ class DataStorage:
                 )
                 data_out = self._build_recarray(data, layer, False)
             else:
+                if self._simulation_data.profiler is not None:
+                    self._simulation_data.profiler.add_file(read_file)
                 with open(read_file, "r") as fd_read_file:
                     data_out = file_access.read_list_data_from_file(
                         fd_read_file,
@@ -2663,6 +2734,7 @@ class DataStorage:
             return data_array
 
     def set_tas(self, tas_name, tas_label, current_key, check_name=True):
+        self.set_modified()
         if check_name:
             package_dim = self.data_dimensions.package_dim
             tas_names = package_dim.get_tasnames()
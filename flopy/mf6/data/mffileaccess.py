@@ -1,5 +1,7 @@
 import inspect
+import os
 import sys
+import warnings
 from copy import deepcopy
 
 import numpy as np
@@ -157,6 +159,8 @@ class MFFileAccess:
             options = f"{options}b"
         try:
             fd = open(read_file, options)
+            if not write:
+                self._profile_ext_file(read_file)
             return fd
         except:
             message = (
@@ -179,6 +183,21 @@ class MFFileAccess:
                 self._simulation_data.debug,
             )
 
+    def _profile_ext_file(self, file_path):
+        # add an external file read or written to the load/write profile
+        if self._simulation_data.profiler is not None:
+            self._simulation_data.profiler.add_file(file_path)
+
+    @staticmethod
+    def _parse_text(text, data_type):
+        # parse whitespace delimited numbers, None if anything else is found
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", DeprecationWarning)
+            try:
+                return np.fromstring(text, dtype=data_type, sep=" ")
+            except (DeprecationWarning, ValueError):
+                return None
+
     @staticmethod
     def datum_to_numpy_type(datum_type):
         if datum_type == DatumType.integer:
@@ -211,49 +230,33 @@ class MFFileAccessArray(MFFileAccess):
         write_multi_layer=False,
     ):
         data = self._resolve_cellid_numbers_to_file(data)
+        # write from a contiguous buffer of the type MODFLOW reads back
+        numpy_type, name = self.datum_to_numpy_type(
+            self.structure.data_item_structures[0].type
+        )
+        if numpy_type is None or numpy_type is str:
+            numpy_type = None
+        data = np.ascontiguousarray(data, dtype=numpy_type)
         fd = self._open_ext_file(fname, binary=True, write=True)
         if write_multi_layer:
+            header_data = self._get_header(
+                modelgrid, modeltime, stress_period, precision, text, fname, 1
+            )
+            has_ilay = "ilay" in header_data.dtype.names
             for layer, value in enumerate(data):
-                self._write_layer(
-                    fd,
-                    value,
-                    modelgrid,
-                    modeltime,
-                    stress_period,
-                    precision,
-                    text,
-                    fname,
-                    layer + 1,
-                )
+                if has_ilay:
+                    header_data["ilay"] = layer + 1
+                self._write_layer(fd, header_data, value)
         else:
-            self._write_layer(
-                fd,
-                data,
-                modelgrid,
-                modeltime,
-                stress_period,
-                precision,
-                text,
-                fname,
+            header_data = self._get_header(
+                modelgrid, modeltime, stress_period, precision, text, fname
             )
-        data.tofile(fd)
+            self._write_layer(fd, header_data, data)
         fd.close()
+        self._profile_ext_file(fd.name)
 
-    def _write_layer(
-        self,
-        fd,
-        data,
-        modelgrid,
-        modeltime,
-        stress_period,
-        precision,
-        text,
-        fname,
-        ilay=None,
-    ):
-        header_data = self._get_header(
-            modelgrid, modeltime, stress_period, precision, text, fname, ilay
-        )
+    @staticmethod
+    def _write_layer(fd, header_data, data):
         header_data.tofile(fd)
         data.tofile(fd)
 
@@ -388,6 +391,7 @@ class MFFileAccessArray(MFFileAccess):
             )
         fd.write(self.get_data_string(data, data_type, ""))
         fd.close()
+        self._profile_ext_file(fp)
 
     def read_binary_data_from_file(
         self,
@@ -409,41 +413,35 @@ class MFFileAccessArray(MFFileAccess):
         header_dtype = bf.BinaryHeader.set_dtype(
             bintype=self._get_bintype(modelgrid), precision="double"
         )
-        if read_multi_layer and len(data_shape) > 1:
-            try:
-                all_data = np.empty(data_shape, numpy_type)
-                headers = []
-                layer_shape = data_shape[1:]
-                layer_data_size = int(data_size / data_shape[0])
-                for index in range(0, data_shape[0]):
-                    layer_data = self._read_binary_file_layer(
+        try:
+            if read_multi_layer and len(data_shape) > 1:
+                # one header and one layer of data per record
+                try:
+                    all_data, headers = self._read_binary_file_records(
                         fd,
                         fname,
                         header_dtype,
                         numpy_type,
-                        layer_data_size,
-                        layer_shape,
+                        int(data_size / data_shape[0]),
+                        data_shape[0],
                     )
-                    all_data[index, :] = layer_data[0]
-                    headers.append(layer_data[1])
-                fd.close()
-                return all_data, headers
-            except MFDataException:
-                fd.seek(self._pos, 0)
-                bin_data = self._read_binary_file_layer(
-                    fd, fname, header_dtype, numpy_type, data_size, data_shape
-                )
-                self._pos = fd.tell()
-                fd.close()
-                return bin_data
-        else:
-            bin_data = self._read_binary_file_layer(
-                fd, fname, header_dtype, numpy_type, data_size, data_shape
+                    return all_data.reshape(data_shape), list(headers)
+                except MFDataException:
+                    pass
+            data, headers = self._read_binary_file_records(
+                fd, fname, header_dtype, numpy_type, data_size, 1
             )
+            return data.reshape(data_shape), headers
+        finally:
             fd.close()
-            return bin_data
 
     def get_data_string(self, data, data_type, data_indent=""):
+        if self._simulation_data.vectorized_array_format:
+            data_string = self._get_data_string_vectorized(
+                data, data_type, data_indent
+            )
+            if data_string is not None:
+                return data_string
         layer_data_string = [str(data_indent)]
         line_data_count = 0
         indent_str = self._simulation_data.indent_string
@@ -519,17 +517,104 @@ class MFFileAccessArray(MFFileAccess):
         else:
             return "\n".join(layer_data_string)
 
-    def _read_binary_file_layer(
-        self, fd, fname, header_dtype, numpy_type, data_size, data_shape
+    def _get_data_string_vectorized(self, data, data_type, data_indent):
+        # format arrays a line at a time, None if the data is not supported
+        data_item = self.structure.data_item_structures[0]
+        if (
+            not isinstance(data, np.ndarray)
+            or data.ndim == 0
+            or data.size == 0
+            or data_item.jagged_array is not None
+        ):
+            return None
+        sim_data = self._simulation_data
+        indent_str = sim_data.indent_string
+        if data_type == DatumType.double_precision:
+            if data.dtype.kind != "f":
+                return None
+            # same notation rules as to_string
+            abs_data = np.abs(data)
+            sci_note = (
+                (abs_data > sim_data._sci_note_upper_thres)
+                | (abs_data < sim_data._sci_note_lower_thres)
+            ) & (abs_data != 0)
+            fixed_format = f"{indent_str}{sim_data.sci_format_str}"
+            sci_format = f"{indent_str}{sim_data.reg_format_str}"
+        elif data_type == DatumType.integer:
+            if data.dtype.kind not in "iu":
+                return None
+            if data_item.numeric_index or data_item.is_cellid:
+                data = data + 1
+            sci_note = None
+        else:
+            return None
+
+        # wrap at the end of each row and at max_columns_of_data
+        rows = data.reshape(-1, data.shape[-1])
+        if sim_data.wrap_multidim_arrays:
+            max_columns = sim_data.max_columns_of_data
+            if max_columns < 1:
+                max_columns = rows.shape[1]
+        else:
+            rows = rows.reshape(1, -1)
+            max_columns = rows.shape[1]
+        ncol = rows.shape[1]
+        chunks = [
+            (start, min(start + max_columns, ncol))
+            for start in range(0, ncol, max_columns)
+        ]
+
+        lines = []
+        if sci_note is None:
+            for row in rows.tolist():
+                for start, end in chunks:
+                    values = indent_str.join(map(str, row[start:end]))
+                    lines.append(f"{data_indent}{indent_str}{values}")
+        else:
+            sci_note = sci_note.reshape(rows.shape)
+            row_sci_note = sci_note.any(axis=1)
+            fixed_formats = {}
+            for row, row_sci, row_mask in zip(
+                rows.tolist(), row_sci_note, sci_note
+            ):
+                for start, end in chunks:
+                    if row_sci and row_mask[start:end].any():
+                        line_format = "".join(
+                            sci_format if sci else fixed_format
+                            for sci in row_mask[start:end]
+                        )
+                    else:
+                        line_format = fixed_formats.get(end - start)
+                        if line_format is None:
+                            line_format = fixed_format * (end - start)
+                            fixed_formats[end - start] = line_format
+                    values = line_format.format(*row[start:end])
+                    lines.append(f"{data_indent}{values}")
+
+        if not sim_data.wrap_multidim_arrays:
+            return f"{data_indent}{lines[0].strip()}\n"
+        lines.append("")
+        return "\n".join(lines)
+
+    def _read_binary_file_records(
+        self, fd, fname, header_dtype, numpy_type, data_size, nrecords
     ):
-        header_data = np.fromfile(fd, dtype=header_dtype, count=1)
-        data = np.fromfile(fd, dtype=numpy_type, count=data_size)
-        data = self._resolve_cellid_numbers_from_file(data)
-        if data.size != data_size:
+        # map the file and copy the data out of it in a single pass so the
+        # file is not held open
+        record_dtype = np.dtype(
+            [("header", header_dtype), ("data", numpy_type, (data_size,))]
+        )
+        file_size = os.fstat(fd.fileno()).st_size
+        if file_size < record_dtype.itemsize * nrecords:
+            found_size = max(file_size - header_dtype.itemsize * nrecords, 0)
             message = (
                 "Binary file {} does not contain expected data. "
                 "Expected array size {} but found size "
-                "{}.".format(fname, data_size, data.size)
+                "{}.".format(
+                    fname,
+                    data_size * nrecords,
+                    found_size // np.dtype(numpy_type).itemsize,
+                )
             )
             type_, value_, traceback_ = sys.exc_info()
             raise MFDataException(
@@ -545,7 +630,12 @@ class MFFileAccessArray(MFFileAccess):
                 message,
                 self._simulation_data.debug,
             )
-        return data.reshape(data_shape), header_data
+        records = np.memmap(fd, dtype=record_dtype, mode="r", shape=nrecords)
+        data = np.array(records["data"])
+        headers = np.array(records["header"])
+        del records
+        data = self._resolve_cellid_numbers_from_file(data)
+        return data, headers
 
     def read_text_data_from_file(
         self,
@@ -565,6 +655,20 @@ class MFFileAccessArray(MFFileAccess):
         if fd is None:
             close_file = True
             fd = self._open_ext_file(fname)
+        if data_type == DatumType.double_precision:
+            data_type = np.float64
+        elif data_type == DatumType.integer:
+            data_type = np.int32
+
+        data_out = None
+        if data_size >= 0:
+            data_out = self._read_text_data_bulk(fd, data_size, data_type)
+        if data_out is not None:
+            data_out = self._resolve_cellid_numbers_from_file(data_out)
+            if close_file:
+                fd.close()
+            return np.reshape(data_out, data_dim), current_size
+
         data_raw = []
         line = " "
         PyListUtil.reset_delimiter_used()
@@ -617,11 +721,6 @@ class MFFileAccessArray(MFFileAccess):
                 self._simulation_data.debug,
             )
 
-        if data_type == DatumType.double_precision:
-            data_type = np.float64
-        elif data_type == DatumType.integer:
-            data_type = np.int32
-
         if data_size < 0:
             data_out = np.fromiter(data_raw, dtype=data_type)
         else:
@@ -634,6 +733,67 @@ class MFFileAccessArray(MFFileAccess):
             data_out = np.reshape(data_out, data_dim)
         return data_out, current_size
 
+    def _read_text_data_bulk(
+        self, fd, data_size, data_type, chunk_size=1048576
+    ):
+        """Read a block of whitespace delimited numeric text in bulk.
+
+        Lines are read and parsed in chunks of about chunk_size characters
+        until the chunk that contains the end of the data, which is read
+        line by line so that fd is left at the line following the data.
+        Returns None and rewinds fd if the block contains anything other
+        than plain numbers (comments, other delimiters, quotes, too few
+        values, ...) so that the caller can fall back to line by line
+        parsing.
+        """
+        if data_type not in (np.float64, np.int32):
+            return None
+        try:
+            if not fd.seekable():
+                return None
+            start = fd.tell()
+        except (AttributeError, OSError):
+            return None
+
+        parts = []
+        count = 0
+        while count < data_size:
+            chunk_start = fd.tell()
+            text = fd.read(chunk_size)
+            if text == "":
+                break
+            if text[-1] != "\n":
+                text += fd.readline()
+            data = self._parse_text(text, data_type)
+            if data is None or count + data.size > data_size:
+                fd.seek(chunk_start)
+                break
+            parts.append(data)
+            count += data.size
+
+        lines = []
+        while count < data_size:
+            line = fd.readline()
+            if line == "":
+                break
+            lines.append(line)
+            count += len(line.split())
+        if lines:
+            data = self._parse_text("".join(lines), data_type)
+            if data is None:
+                fd.seek(start)
+                return None
+            parts.append(data)
+
+        if count < data_size:
+            fd.seek(start)
+            return None
+        data = np.concatenate(parts) if parts else np.empty(0, data_type)
+        if data.size < data_size:
+            fd.seek(start)
+            return None
+        return data[:data_size]
+
     def load_from_package(
         self,
         first_line,
@@ -1018,6 +1178,7 @@ class MFFileAccessList(MFFileAccess):
             modelgrid, precision
         )
         file_array = np.fromfile(read_file, dtype=header, count=-1)
+        self._profile_ext_file(read_file)
         # build data list for recarray
         cellid_size = len(self._get_cell_header(modelgrid))
         data_list = []
@@ -1046,6 +1207,7 @@ class MFFileAccessList(MFFileAccess):
         data_array = self._build_data_array(data, modelgrid, precision)
         data_array.tofile(fd)
         fd.close()
+        self._profile_ext_file(fd.name)
 
     def _build_data_array(self, data, modelgrid, precision):
         header, int_cellid_indexes, ext_cellid_indexes = self._get_header(
@@ -1309,13 +1471,26 @@ class MFFileAccessList(MFFileAccess):
             recarrays = parent_block.get_all_recarrays()
         recarray_len = len(recarrays)
 
+        # load the rest of a block of simple lines column by column
+        end_line = None
+        if (
+            self.simple_line
+            and recarray_len == 1
+            and struct.package_type != "sfr"
+        ):
+            end_line = self._load_simple_lines_bulk(file_handle, data_loaded)
+
         # loop until end of block
         line = " "
         optional_line_info = []
         line_info_processed = False
         data_structs = struct.data_item_structures
         while line != "":
-            line = file_handle.readline()
+            if end_line is not None:
+                line = end_line
+                end_line = None
+            else:
+                line = file_handle.readline()
             arr_line = PyListUtil.split_data_line(line)
             if not line or (
                 arr_line
@@ -1507,6 +1682,159 @@ class MFFileAccessList(MFFileAccess):
         else:
             return [False, None, data_line]
 
+    def _simple_line_columns(self, line_len):
+        # build a list of (field kind, column indexes, conversion option)
+        # describing how the simple lines of a block map to data fields,
+        # following the layout of the first line of the block
+        struct = self.structure
+        data_structs = struct.data_item_structures
+        line_info = self._last_line_info
+        for index, data_item in enumerate(data_structs[: len(line_info)]):
+            if data_item.optional:
+                line_info = line_info[:index]
+                break
+        if not line_info or not line_info[0]:
+            return None
+
+        fields = []
+        for index, entry in enumerate(line_info):
+            data_item = data_structs[index]
+            if not entry:
+                return None
+            cellid_size = entry[0][2]
+            if entry[0][1] is not None and cellid_size > 0:
+                if len(entry) != cellid_size:
+                    return None
+                fields.append(
+                    ("cellid", [sub_entry[0] for sub_entry in entry], None)
+                )
+                continue
+            for sub_entry in entry:
+                datum_type = sub_entry[1]
+                if datum_type is None:
+                    fields.append(("none", [], None))
+                elif sub_entry[2] > 0:
+                    return None
+                elif datum_type == DatumType.double_precision:
+                    if data_item.support_negative_index:
+                        return None
+                    fields.append(("float", [sub_entry[0]], None))
+                elif datum_type == DatumType.integer:
+                    sub_amt = 1 if data_item.numeric_index else 0
+                    fields.append(("int", [sub_entry[0]], sub_amt))
+                elif datum_type == DatumType.string:
+                    if (
+                        data_item.indicates_file_name()
+                        or data_item.file_nam_in_nam_file()
+                    ):
+                        return None
+                    fields.append(
+                        ("str", [sub_entry[0]], not data_item.preserve_case)
+                    )
+                elif datum_type == DatumType.keyword:
+                    fields.append(("str", [sub_entry[0]], False))
+                else:
+                    return None
+        data_index = line_info[-1][-1][0] + 1
+        if data_index == line_len:
+            return fields
+
+        # optional aux variables and boundname at the end of the line
+        package_dim = self._data_dimensions.package_dim
+        for data_item in data_structs[len(line_info) :]:
+            if data_index >= line_len:
+                break
+            if data_item.name == "aux":
+                aux_var_names = package_dim.get_aux_variables()
+                if aux_var_names is None:
+                    continue
+                for var_name in aux_var_names[0]:
+                    if var_name.lower() != "auxiliary":
+                        fields.append(("float", [data_index], None))
+                        data_index += 1
+            elif data_item.name == "boundname" and package_dim.boundnames():
+                fields.append(
+                    ("str", [data_index], not data_item.preserve_case)
+                )
+                data_index += 1
+        if data_index != line_len:
+            # partial aux variables or comments at the end of the line
+            return None
+        return fields
+
+    def _load_simple_lines_bulk(self, file_handle, data_loaded):
+        """Load the remaining lines of a block of simple lines in bulk.
+
+        The lines are read up to the end of the block and each field is
+        converted for all lines at once, using the field layout of the
+        line already loaded into self._last_line_info.  Returns the line
+        that ended the block, or None after rewinding file_handle if the
+        lines do not all share the same plain whitespace delimited layout
+        (comments, quoted text, missing optional values, ...).
+        """
+        try:
+            if not file_handle.seekable():
+                return None
+            start = file_handle.tell()
+        except (AttributeError, OSError):
+            return None
+
+        lines = []
+        line = file_handle.readline()
+        while line and line.lstrip()[:3].upper() != "END":
+            lines.append(line)
+            line = file_handle.readline()
+        if not lines:
+            file_handle.seek(start)
+            return None
+
+        text = "".join(lines)
+        fields = None
+        if not any(char in text for char in "#!/'\","):
+            line_tokens = [item.split() for item in lines]
+            line_len = len(line_tokens[0])
+            if line_len > 0 and all(
+                len(items) == line_len for items in line_tokens
+            ):
+                tokens = [item for items in line_tokens for item in items]
+                fields = self._simple_line_columns(line_len)
+        if fields is None:
+            file_handle.seek(start)
+            return None
+
+        nlines = len(lines)
+        columns = []
+        for kind, indexes, option in fields:
+            if kind == "none":
+                columns.append([None] * nlines)
+                continue
+            if kind == "str":
+                column = tokens[indexes[0] :: line_len]
+                if option:
+                    column = [item.lower() for item in column]
+                columns.append(column)
+                continue
+            values = []
+            for index in indexes:
+                value = self._parse_text(
+                    " ".join(tokens[index::line_len]),
+                    np.float64 if kind == "float" else np.int64,
+                )
+                if value is None or value.size != nlines:
+                    file_handle.seek(start)
+                    return None
+                if kind == "cellid":
+                    value -= 1
+                elif kind == "int":
+                    value -= option
+                values.append(value.tolist())
+            if kind == "cellid":
+                columns.append(list(zip(*values)))
+            else:
+                columns.append(values[0])
+        data_loaded.extend(zip(*columns))
+        return line
+
     def load_list_line(
         self,
         storage,
@@ -6,6 +6,7 @@ mfstructure module.  Contains classes related to package structure
 import ast
 import keyword
 import os
+import threading
 from enum import Enum
 from textwrap import TextWrapper
 
@@ -160,10 +161,18 @@ class DfnPackage(Dfn):
     Dfn child class that loads dfn information from a list structure stored
     in the auto-built package classes
 
+    Parameters
+    ----------
+    package_abbr : str
+        abbreviation of the package
+    dfn_file_name : str
+        name of the package's dfn file
+
     Attributes
     ----------
     package : MFPackage
-        MFPackage subclass that contains dfn information
+        MFPackage subclass that contains dfn information, imported the first
+        time the dfn information is needed
 
     Methods
     -------
@@ -181,11 +190,12 @@ class DfnPackage(Dfn):
     ----
     """
 
-    def __init__(self, package):
+    def __init__(self, package_abbr, dfn_file_name):
         super().__init__()
-        self.package = package
-        self.package_type = package._package_type
-        self.dfn_file_name = package.dfn_file_name
+        self.package = None
+        self.package_abbr = package_abbr
+        self.dfn_file_name = dfn_file_name
+        self.package_type = os.path.splitext(dfn_file_name[4:])[0]
         # the package type is always the text after the last -
         package_name = self.package_type.split("-")
         self.package_type = package_name[-1]
@@ -196,7 +206,14 @@ class DfnPackage(Dfn):
         self.dfn_type, self.model_type = self._file_type(
             self.dfn_file_name.replace("-", "")
         )
-        self.dfn_list = package.dfn
+
+    @property
+    def dfn_list(self):
+        if self.package is None:
+            self.package = PackageContainer.package_factory(
+                self.package_abbr, ""
+            )
+        return self.package.dfn
 
     def get_block_structure_dict(self, path, common, model_file):
         block_dict = {}
@@ -2126,6 +2143,76 @@ class MFInputFileStructure:
             return None
 
 
+class MFStructureDict(dict):
+    """
+    Dictionary of input file structures keyed by package type.  The
+    structure of each input file is built from its dfn information the first
+    time it is accessed, so only the packages that are used are processed.
+
+    Methods
+    -------
+    add_structure(dfn_file : DfnFile, path : tuple, common : dict,
+            model_file : bool)
+        Adds the dfn information of an input file structure that will be built
+        when first accessed
+    set_read_as_arrays(package_type : string)
+        Tags an input file structure as the READASARRAYS version of a package
+
+    """
+
+    _lock = threading.RLock()
+
+    def __getitem__(self, package_type):
+        struct = super().__getitem__(package_type)
+        if isinstance(struct, _MFInputFileDefinition):
+            with MFStructureDict._lock:
+                struct = super().__getitem__(package_type)
+                if isinstance(struct, _MFInputFileDefinition):
+                    struct = struct.build()
+                    super().__setitem__(package_type, struct)
+        return struct
+
+    def get(self, package_type, default=None):
+        if package_type in self:
+            return self[package_type]
+        return default
+
+    def values(self):
+        return [self[package_type] for package_type in self]
+
+    def items(self):
+        return [(package_type, self[package_type]) for package_type in self]
+
+    def add_structure(self, dfn_file, path, common, model_file):
+        super().__setitem__(
+            dfn_file.package_type,
+            _MFInputFileDefinition(dfn_file, path, common, model_file),
+        )
+
+    def set_read_as_arrays(self, package_type):
+        super().__getitem__(package_type).read_as_arrays = True
+
+
+class _MFInputFileDefinition:
+    """
+    Arguments of an input file structure that has not been built yet.
+    """
+
+    def __init__(self, dfn_file, path, common, model_file):
+        self.dfn_file = dfn_file
+        self.path = path
+        self.common = common
+        self.model_file = model_file
+        self.read_as_arrays = False
+
+    def build(self):
+        struct = MFInputFileStructure(
+            self.dfn_file, self.path, self.common, self.model_file
+        )
+        struct.read_as_arrays = self.read_as_arrays
+        return struct
+
+
 class MFModelStructure:
     """
     Defines the structure of a MF6 model and its packages
@@ -2141,7 +2228,7 @@ class MFModelStructure:
         simulation structure validity
     name_file_struct_obj : MFInputFileStructure
         describes the structure of the simulation name file
-    package_struct_objs : dict
+    package_struct_objs : MFStructureDict
         describes the structure of the simulation packages
     model_type : string
         dictionary containing simulation package structure
@@ -2172,7 +2259,7 @@ class MFModelStructure:
         # add name file structure
         self.model_type = model_type
         self.name_file_struct_obj = None
-        self.package_struct_objs = {}
+        self.package_struct_objs = MFStructureDict()
         self.utl_struct_objs = utl_struct_objs
 
     def add_namefile(self, dfn_file, common):
@@ -2181,7 +2268,7 @@ class MFModelStructure:
         )
 
     def add_package(self, dfn_file, common):
-        self.package_struct_objs[dfn_file.package_type] = MFInputFileStructure(
+        self.package_struct_objs.add_structure(
             dfn_file, (self.model_type,), common, True
         )
 
@@ -2228,11 +2315,11 @@ class MFSimulationStructure:
     ----------
     name_file_struct_obj : MFInputFileStructure
         describes the structure of the simulation name file
-    package_struct_objs : dict
+    package_struct_objs : MFStructureDict
         describes the structure of the simulation packages
     model_struct_objs : dict
         describes the structure of the supported model types
-    utl_struct_objs : dict
+    utl_struct_objs : MFStructureDict
         describes the structure of the supported utility packages
     common : dict
         common file information
@@ -2276,8 +2363,8 @@ class MFSimulationStructure:
     def __init__(self):
         # initialize
         self.name_file_struct_obj = None
-        self.package_struct_objs = {}
-        self.utl_struct_objs = {}
+        self.package_struct_objs = MFStructureDict()
+        self.utl_struct_objs = MFStructureDict()
         self.model_struct_objs = {}
         self.common = None
         self.model_type = ""
@@ -2338,12 +2425,10 @@ class MFSimulationStructure:
         )
 
     def add_util(self, dfn_file):
-        self.utl_struct_objs[dfn_file.package_type] = MFInputFileStructure(
-            dfn_file, (), self.common, True
-        )
+        self.utl_struct_objs.add_structure(dfn_file, (), self.common, True)
 
     def add_package(self, dfn_file, model_file=True):
-        self.package_struct_objs[dfn_file.package_type] = MFInputFileStructure(
+        self.package_struct_objs.add_structure(
             dfn_file, (), self.common, model_file
         )
 
@@ -2395,19 +2480,16 @@ class MFSimulationStructure:
             return None
 
     def tag_read_as_arrays(self):
-        for key, package_struct in self.package_struct_objs.items():
+        for key in self.package_struct_objs:
             if key[0:-1] in self.package_struct_objs and key[-1] == "a":
-                package_struct.read_as_arrays = True
+                self.package_struct_objs.set_read_as_arrays(key)
         for model_key, model_struct in self.model_struct_objs.items():
-            for (
-                key,
-                package_struct,
-            ) in model_struct.package_struct_objs.items():
+            for key in model_struct.package_struct_objs:
                 if (
                     key[0:-1] in model_struct.package_struct_objs
                     and key[-1] == "a"
                 ):
-                    package_struct.read_as_arrays = True
+                    model_struct.package_struct_objs.set_read_as_arrays(key)
 
 
 class MFStructure:
@@ -2494,9 +2576,13 @@ class MFStructure:
                 self.sim_struct.process_dfn(DfnFile(file))
             self.sim_struct.tag_read_as_arrays()
         else:
-            package_list = PackageContainer.package_list()
-            for package in package_list:
-                self.sim_struct.process_dfn(DfnPackage(package))
+            # package structures are built from the package classes when
+            # first accessed
+            package_definitions = PackageContainer.package_definitions()
+            for package_abbr, dfn_file_name in package_definitions.items():
+                self.sim_struct.process_dfn(
+                    DfnPackage(package_abbr, dfn_file_name)
+                )
             self.sim_struct.tag_read_as_arrays()
 
         return True
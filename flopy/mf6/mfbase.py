@@ -3,11 +3,17 @@ import copy
 import inspect
 import os
 import sys
+import threading
+import time
 import traceback
 from collections.abc import Iterable
+from contextlib import contextmanager
 from enum import Enum
+from importlib import import_module
 from shutil import copyfile
 
+from ..utils import import_optional_dependency
+
 
 # internal handled exceptions
 class MFInvalidTransientBlockHeaderException(Exception):
@@ -449,6 +455,202 @@ class MFFileMgmt:
             return os.path.join(self.get_sim_path(last_loaded_path), file_path)
 
 
+class MFProfiler:
+    """
+    Records the time spent loading and writing each package and block of a
+    simulation along with the amount of data read or written.  Pass a
+    profiler to MFSimulation.load or MFSimulation.write_simulation, or
+    assign one to a simulation's simulation_data.profiler attribute to
+    profile everything the simulation reads and writes.
+
+    Attributes
+    ----------
+    records : list
+        One dictionary for each profiled package or block, in the order they
+        were started.  Each dictionary contains "operation" ("initialize",
+        "load", or "write"), "model", "package", "package_type", "block"
+        (None for package totals), "header" (block header values), "time"
+        (wall time in seconds), "bytes" (characters of package file text
+        plus the size of external files), "lines" (lines of package file
+        text), and "external_files" (number of external files).  Block
+        totals are included in their package's totals.
+
+    Examples
+    --------
+    >>> profiler = flopy.mf6.MFProfiler()
+    >>> sim = flopy.mf6.MFSimulation.load(sim_ws=ws, profiler=profiler)
+    >>> df = profiler.get_dataframe()
+    >>> df[df.block.isnull()].sort_values("time")
+
+    """
+
+    def __init__(self):
+        self.records = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _active_records(self):
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    @contextmanager
+    def record(
+        self,
+        operation,
+        model=None,
+        package=None,
+        package_type=None,
+        block=None,
+        header=None,
+    ):
+        """Context manager that profiles the code run inside of it.  For
+        internal FloPy use, not intended for end user."""
+        record = {
+            "operation": operation,
+            "model": model,
+            "package": package,
+            "package_type": package_type,
+            "block": block,
+            "header": header,
+            "time": 0.0,
+            "bytes": 0,
+            "lines": 0,
+            "external_files": 0,
+        }
+        with self._lock:
+            self.records.append(record)
+        active_records = self._active_records()
+        active_records.append(record)
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["time"] = time.perf_counter() - start
+            active_records.pop()
+
+    def add_io(self, nbytes, nlines=0):
+        """Adds data read or written to the records being profiled.  For
+        internal FloPy use, not intended for end user."""
+        for record in self._active_records():
+            record["bytes"] += nbytes
+            record["lines"] += nlines
+
+    def add_file(self, file_path):
+        """Adds an external file read or written to the records being
+        profiled.  For internal FloPy use, not intended for end user."""
+        try:
+            nbytes = os.path.getsize(file_path)
+        except OSError:
+            nbytes = 0
+        for record in self._active_records():
+            record["bytes"] += nbytes
+            record["external_files"] += 1
+
+    def wrap_file(self, fd):
+        """Returns a file object that adds the text read from or written to
+        `fd` to the records being profiled.  For internal FloPy use, not
+        intended for end user."""
+        return _MFProfiledFile(fd, self)
+
+    def reset(self):
+        """Removes all records."""
+        with self._lock:
+            self.records = []
+
+    def get_report(self, operation=None):
+        """Returns the profile records.
+
+        Parameters
+        ----------
+            operation : str
+                Only return records of this operation ("initialize", "load",
+                or "write")
+
+        Returns
+        -------
+            records : list
+                List of dictionaries, see the records attribute
+        """
+        return [
+            dict(record)
+            for record in self.records
+            if operation is None or record["operation"] == operation
+        ]
+
+    def get_dataframe(self, operation=None):
+        """Returns the profile records in a pandas DataFrame.
+
+        Parameters
+        ----------
+            operation : str
+                Only return records of this operation ("initialize", "load",
+                or "write")
+
+        Returns
+        -------
+            df : pandas.DataFrame
+        """
+        pd = import_optional_dependency(
+            "pandas",
+            error_message="get_dataframe() requires pandas.",
+        )
+        columns = [
+            "operation",
+            "model",
+            "package",
+            "package_type",
+            "block",
+            "header",
+            "time",
+            "bytes",
+            "lines",
+            "external_files",
+        ]
+        return pd.DataFrame(self.get_report(operation), columns=columns)
+
+
+class _MFProfiledFile:
+    """File object wrapper that reports the text read or written to a
+    profiler."""
+
+    def __init__(self, fd, profiler):
+        self._fd = fd
+        self._profiler = profiler
+
+    def __getattr__(self, name):
+        return getattr(self._fd, name)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        line = next(self._fd)
+        self._profiler.add_io(len(line), 1)
+        return line
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self._fd.close()
+
+    def readline(self, *args):
+        line = self._fd.readline(*args)
+        if line:
+            self._profiler.add_io(len(line), 1)
+        return line
+
+    def read(self, *args):
+        text = self._fd.read(*args)
+        self._profiler.add_io(len(text), text.count("\n"))
+        return text
+
+    def write(self, text):
+        self._profiler.add_io(len(text), text.count("\n"))
+        return self._fd.write(text)
+
+
 class PackageContainer:
     """
     Base class for any class containing packages.
@@ -495,11 +697,33 @@ class PackageContainer:
         """
         # all packages except "group" classes
         package_list = []
-        for abbr, package in sorted(PackageContainer.packages_by_abbr.items()):
+        for abbr in PackageContainer.package_definitions():
+            package_list.append(PackageContainer.package_factory(abbr, ""))
+        return package_list
+
+    @staticmethod
+    def package_definitions():
+        """Static method that returns the definition file names of the
+        available packages, without importing the generated package classes.
+        For internal FloPy use only, not intended for end users.
+
+        Returns
+        -------
+            definitions : dict
+                Definition file name of each package, by package abbreviation
+
+        """
+        from . import modflow
+
+        definitions = {
+            abbr: module_info[2]
+            for abbr, module_info in modflow.package_modules.items()
+        }
+        for abbr, package in PackageContainer.packages_by_abbr.items():
             # don't store packages "group" classes
             if not abbr.endswith("packages"):
-                package_list.append(package)
-        return package_list
+                definitions[abbr] = package.dfn_file_name
+        return dict(sorted(definitions.items()))
 
     @staticmethod
     def package_factory(package_type: str, model_type: str):
@@ -520,10 +744,10 @@ class PackageContainer:
 
         """
         package_abbr = f"{model_type}{package_type}"
-        factory = PackageContainer.packages_by_abbr.get(package_abbr)
+        factory = PackageContainer._registered_class(package_abbr)
         if factory is None:
             package_utl_abbr = "utl{}".format(package_type)
-            factory = PackageContainer.packages_by_abbr.get(package_utl_abbr)
+            factory = PackageContainer._registered_class(package_utl_abbr)
         return factory
 
     @staticmethod
@@ -542,8 +766,31 @@ class PackageContainer:
             model : MFModel subclass
 
         """
+        if model_type not in PackageContainer.models_by_type:
+            from . import modflow
+
+            # import the generated model class, which registers it
+            module_info = modflow.model_modules.get(model_type)
+            if module_info is not None:
+                import_module(f".{module_info[0]}", modflow.__name__)
         return PackageContainer.models_by_type.get(model_type)
 
+    @staticmethod
+    def _registered_class(package_abbr):
+        """Returns the package class registered for package_abbr, importing
+        the generated module that defines it the first time it is needed."""
+        if package_abbr not in PackageContainer.packages_by_abbr:
+            from . import modflow
+
+            # "group" classes are defined with the package they contain
+            if package_abbr.endswith("packages"):
+                module_info = modflow.package_modules.get(package_abbr[:-8])
+            else:
+                module_info = modflow.package_modules.get(package_abbr)
+            if module_info is not None:
+                import_module(f".{module_info[0]}", modflow.__name__)
+        return PackageContainer.packages_by_abbr.get(package_abbr)
+
     @staticmethod
     def get_module_val(module, item, attrb):
         """Static method that returns a python class module value.  For
@@ -1,6 +1,8 @@
 import inspect
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
@@ -29,6 +31,9 @@ from .mfpackage import MFPackage
 from .utils.mfenums import DiscretizationType
 from .utils.output_util import MF6Output
 
+# packages loaded by the current thread while loading packages in parallel
+_package_load_state = threading.local()
+
 
 class MFModel(PackageContainer, ModelInterface):
     """
@@ -692,6 +697,7 @@ class MFModel(PackageContainer, ModelInterface):
         strict=True,
         model_rel_path=".",
         load_only=None,
+        workers=1,
     ):
         """
         Class method that loads an existing model.
@@ -725,6 +731,12 @@ class MFModel(PackageContainer, ModelInterface):
             setting. subpackages, like time series and observations, will also
             load regardless of this setting.
             example list: ['ic', 'maw', 'npf', 'oc', 'my_well_package_1']
+        workers : int
+            number of threads used to load the model's packages.  the
+            discretization package is loaded first, the remaining packages
+            are then loaded in parallel and registered with the model in
+            name file order.  default is 1, which loads packages one at a
+            time.
 
         Returns
         -------
@@ -772,6 +784,7 @@ class MFModel(PackageContainer, ModelInterface):
         # load packages
         sim_struct = mfstructure.MFStructure().sim_struct
         instance._ftype_num_dict = {}
+        parallel_packages = []
         for ftype, fname, pname in packages_ordered:
             ftype_orig = ftype
             ftype = ftype[0:-1].lower()
@@ -801,6 +814,13 @@ class MFModel(PackageContainer, ModelInterface):
                     >= VerbosityLevel.normal.value
                 ):
                     print(f"    loading package {ftype}...")
+                if workers > 1 and ftype_orig not in priority_packages:
+                    # name package now, load it with the thread pool below
+                    dict_package_name = instance._get_dict_package_name(
+                        ftype, pname, None, None
+                    )
+                    parallel_packages.append((ftype, fname, dict_package_name))
+                    continue
                 # load package
                 instance.load_package(ftype, fname, pname, strict, None)
                 sim_data = simulation.simulation_data
@@ -811,6 +831,11 @@ class MFModel(PackageContainer, ModelInterface):
                         sim_data.max_columns_of_data = dis.ncol.get_data()
                         sim_data.max_columns_user_set = False
                         sim_data.max_columns_auto_set = True
+        if parallel_packages:
+            instance._load_packages_parallel(
+                parallel_packages, strict, workers
+            )
+
         # load referenced packages
         if modelname in instance.simulation_data.referenced_files:
             for ref_file in instance.simulation_data.referenced_files[
@@ -1577,7 +1602,7 @@ class MFModel(PackageContainer, ModelInterface):
                 )
 
     def set_all_data_external(
-        self, check_data=True, external_data_folder=None
+        self, check_data=True, external_data_folder=None, binary=False
     ):
         """Sets the model's list and array data to be stored externally.
 
@@ -1590,10 +1615,15 @@ class MFModel(PackageContainer, ModelInterface):
                 Folder, relative to the simulation path or model relative path
                 (see use_model_relative_path parameter), where external data
                 will be stored
+            binary : bool
+                Whether array data will be stored in binary files.  List
+                data is always stored in text files.
 
         """
         for package in self.packagelist:
-            package.set_all_data_external(check_data, external_data_folder)
+            package.set_all_data_external(
+                check_data, external_data_folder, binary
+            )
 
     def set_all_data_internal(self, check_data=True):
         """Sets the model's list and array data to be stored externally.
@@ -1803,6 +1833,29 @@ class MFModel(PackageContainer, ModelInterface):
         """
         if ref_path is not None:
             fname = os.path.join(ref_path, fname)
+        dict_package_name = self._get_dict_package_name(
+            ftype, pname, dict_package_name, parent_package
+        )
+        package = self._load_package_file(
+            ftype, fname, dict_package_name, strict, parent_package
+        )
+
+        # register child package with the model
+        loaded_packages = getattr(_package_load_state, "packages", None)
+        if loaded_packages is not None:
+            # loading in a worker thread, register in load order later
+            loaded_packages.append(package)
+        else:
+            self._add_package(package, package.path)
+        if parent_package is not None:
+            # register child package with the parent package
+            parent_package._add_package(package, package.path)
+
+        return package
+
+    def _get_dict_package_name(
+        self, ftype, pname, dict_package_name, parent_package
+    ):
         sim_struct = mfstructure.MFStructure().sim_struct
         if (
             ftype in self.structure.package_struct_objs
@@ -1839,7 +1892,11 @@ class MFModel(PackageContainer, ModelInterface):
                     )
         else:
             dict_package_name = ftype
+        return dict_package_name
 
+    def _load_package_file(
+        self, ftype, fname, dict_package_name, strict, parent_package
+    ):
         # clean up model type text
         model_type = self.structure.model_type
         while datautil.DatumUtil.is_int(model_type[-1]):
@@ -1867,15 +1924,40 @@ class MFModel(PackageContainer, ModelInterface):
                 parent_file=parent_package,
             )
             package.load(strict)
-
-        # register child package with the model
-        self._add_package(package, package.path)
-        if parent_package is not None:
-            # register child package with the parent package
-            parent_package._add_package(package, package.path)
-
         return package
 
+    def _load_packages_parallel(self, package_list, strict, workers):
+        # build the model grid before package data is loaded by the threads
+        self.dimensions.get_model_grid()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    self._load_package_in_thread,
+                    ftype,
+                    fname,
+                    dict_package_name,
+                    strict,
+                )
+                for ftype, fname, dict_package_name in package_list
+            ]
+            # register packages in name file order
+            for future in futures:
+                for package in future.result():
+                    self._add_package(package, package.path)
+
+    def _load_package_in_thread(self, ftype, fname, dict_package_name, strict):
+        # load a package and its child packages in a worker thread,
+        # returning the packages in the order they are to be registered
+        _package_load_state.packages = []
+        try:
+            package = self._load_package_file(
+                ftype, fname, dict_package_name, strict, None
+            )
+            _package_load_state.packages.append(package)
+            return _package_load_state.packages
+        finally:
+            _package_load_state.packages = None
+
     def plot(self, SelPackList=None, **kwargs):
         """
         Plot 2-D, 3-D, transient 2-D, and stress period list (MfList)
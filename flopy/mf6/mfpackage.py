@@ -4,6 +4,7 @@ import errno
 import inspect
 import os
 import sys
+from contextlib import nullcontext
 from re import S
 
 import numpy as np
@@ -378,6 +379,9 @@ class MFBlock:
         self.enabled = structure.number_non_optional_data() > 0
         self.loaded = False
         self.external_file_name = None
+        # file locations of block data skipped by a lazy load
+        self._deferred_load = None
+        self._deferred_text = None
         self._structure_init()
 
     def __repr__(self):
@@ -858,6 +862,10 @@ class MFBlock:
                     external_file_info = arr_line
                     file_name = datautil.clean_filename(arr_line[1])
                     fd_block = open(os.path.join(root_path, file_name), "r")
+                    if self._simulation_data.profiler is not None:
+                        fd_block = self._simulation_data.profiler.wrap_file(
+                            fd_block
+                        )
                     # read first line of external file
                     line = fd_block.readline()
                     arr_line = datautil.PyListUtil.split_data_line(line)
@@ -1004,6 +1012,143 @@ class MFBlock:
         self.loaded = True
         self.is_valid()
 
+    def defer_load(
+        self, block_header, header_line, fd, strict, post_block_comments
+    ):
+        """Records the location of the block in file object `fd` and
+        advances `fd` to the end of the block without parsing the block's
+        data.  The data is parsed the first time it is accessed.  File
+        object must be advanced to beginning of block before calling.
+
+        Parameters
+        ----------
+            block_header : MFBlockHeader
+                Block header for block block being loaded.
+            header_line : str
+                Line of the file containing the block header.
+            fd : file
+                File descriptor of file being loaded
+            strict : bool
+                Enforce strict MODFLOW 6 file format.
+            post_block_comments : MFComment
+                Comments following the block
+
+        Returns
+        -------
+            deferred : bool
+                False if the block can not be loaded lazily, in which case
+                `fd` is left at the beginning of the block.
+        """
+        if self.loaded and self._deferred_load is None:
+            return False
+        if self.structure.name.lower() in ("options", "dimensions"):
+            return False
+        for data_structure in self.structure.data_structures.values():
+            # blocks that reference other files are always loaded
+            if data_structure.file_data:
+                return False
+        try:
+            start = fd.tell()
+        except OSError:
+            return False
+        line = fd.readline()
+        while line != "":
+            clean_line = line.strip()
+            if "open/close" in clean_line.lower():
+                # external data must be loaded so that it can be copied
+                self.load_deferred()
+                fd.seek(start)
+                return False
+            if clean_line[:3].upper() == "END":
+                break
+            line = fd.readline()
+
+        if self._deferred_load is None:
+            self._deferred_load = []
+            for dataset in self.datasets.values():
+                dataset._deferred_block = self
+        self._deferred_load.append(
+            [
+                block_header,
+                header_line,
+                os.path.abspath(fd.name),
+                start,
+                strict,
+                post_block_comments,
+            ]
+        )
+        self.enabled = True
+        self.loaded = True
+        return True
+
+    def load_deferred(self):
+        """Parses block data that was skipped by a lazy load.  Does nothing
+        if all of the block's data has already been loaded."""
+        deferred_load = self._deferred_load
+        if deferred_load is None:
+            return
+        # blocks can depend on data in the blocks that precede them
+        for block in self._container_package.blocks.values():
+            if block is self:
+                break
+            block.load_deferred()
+        self._deferred_load = None
+        self._deferred_text = None
+        for dataset in self.datasets.values():
+            dataset._deferred_block = None
+        self.loaded = False
+        package_path = self._container_package.dimensions.package_path
+        modified_packages = self._simulation_data.modified_packages
+        modified = package_path in modified_packages
+        profiler = self._simulation_data.profiler
+        for entry in deferred_load:
+            block_header, _, file_path, start, strict, comments = entry
+            with self._container_package._profile_block(
+                "load", block_header
+            ), open(file_path, "r") as fd:
+                fd.seek(start)
+                if profiler is not None:
+                    fd = profiler.wrap_file(fd)
+                self.load(block_header, fd, strict)
+            self._simulation_data.mfdata[
+                block_header.blk_post_comment_path
+            ] = comments
+        if not modified:
+            # parsing the file does not change the package
+            modified_packages.discard(package_path)
+
+    def _read_deferred_text(self):
+        # read the unparsed text of each deferred block
+        deferred_text = []
+        for entry in self._deferred_load:
+            with open(entry[2], "r") as fd:
+                fd.seek(entry[3])
+                lines = []
+                line = fd.readline()
+                while line != "":
+                    lines.append(line)
+                    if line.strip()[:3].upper() == "END":
+                        break
+                    line = fd.readline()
+            deferred_text.append("".join(lines))
+        return deferred_text
+
+    def _write_deferred(self, fd):
+        deferred_text = self._deferred_text
+        self._deferred_text = None
+        if deferred_text is None:
+            deferred_text = self._read_deferred_text()
+        # copy the block text verbatim and track where it now resides
+        file_path = os.path.abspath(fd.name)
+        for entry, text in zip(self._deferred_load, deferred_text):
+            fd.write(entry[1])
+            entry[2] = file_path
+            entry[3] = fd.tell()
+            fd.write(text)
+            entry[5].write(fd)
+            if not self._simulation_data.comments_on:
+                fd.write("\n")
+
     def _find_data_by_keyword(self, line, fd, initial_comment):
         first_key = None
         nothing_found = False
@@ -1229,6 +1374,10 @@ class MFBlock:
             File object to write to.
 
         """
+        if self._deferred_load is not None:
+            # block data was never parsed, copy it from the loaded file
+            self._write_deferred(fd)
+            return
         # never write an empty block
         is_empty = self.is_empty()
         if (
@@ -1273,7 +1422,11 @@ class MFBlock:
         return False
 
     def set_all_data_external(
-        self, base_name, check_data=True, external_data_folder=None
+        self,
+        base_name,
+        check_data=True,
+        external_data_folder=None,
+        binary=False,
     ):
         """Sets the block's list and array data to be stored externally,
         base_name is external file name's prefix, check_data determines
@@ -1287,6 +1440,9 @@ class MFBlock:
                 Whether to do data error checking.
             external_data_folder
                 Folder where external data will be stored
+            binary : bool
+                Whether array data will be stored in binary files.  List
+                data is always stored in text files.
 
         """
         for key, dataset in self.datasets.items():
@@ -1298,7 +1454,13 @@ class MFBlock:
                 )
                 and dataset.enabled
             ):
-                file_path = f"{base_name}_{dataset.structure.name}.txt"
+                binary_array = binary and isinstance(
+                    dataset, mfdataarray.MFArray
+                )
+                if binary_array:
+                    file_path = f"{base_name}_{dataset.structure.name}.bin"
+                else:
+                    file_path = f"{base_name}_{dataset.structure.name}.txt"
                 replace_existing_external = False
                 if external_data_folder is not None:
                     # get simulation root path
@@ -1321,6 +1483,7 @@ class MFBlock:
                     replace_existing_external = True
                 dataset.store_as_external_file(
                     file_path,
+                    binary=binary_array,
                     replace_existing_external=replace_existing_external,
                     check_data=check_data,
                 )
@@ -1336,6 +1499,9 @@ class MFBlock:
                 Whether to do data error checking.
 
         """
+        if self._deferred_load is not None:
+            # unparsed blocks never contain external data
+            return
         for key, dataset in self.datasets.items():
             if (
                 isinstance(dataset, mfdataarray.MFArray)
@@ -1423,6 +1589,8 @@ class MFBlock:
             fd_path = os.path.split(os.path.realpath(fd.name))[0]
             try:
                 fd = open(os.path.join(fd_path, self.external_file_name), "w")
+                if self._simulation_data.profiler is not None:
+                    fd = self._simulation_data.profiler.wrap_file(fd)
             except:
                 type_, value_, traceback_ = sys.exc_info()
                 message = (
@@ -1718,6 +1886,8 @@ class MFPackage(PackageContainer, PackageInterface):
         self.post_block_comments = None
         self.last_error = None
         self.bc_color = "black"
+        # file the package was last loaded from or written to
+        self._written_file = None
         self.__inattr = False
         self._child_package_groups = {}
         if (
@@ -1852,6 +2022,23 @@ class MFPackage(PackageContainer, PackageInterface):
         # return [data_object, data_object, ...]
         return self._data_list
 
+    @property
+    def modified(self):
+        """Whether the package has changed since it was loaded from or last
+        written to its file."""
+        modified_packages = self._simulation_data.modified_packages
+        if self.dimensions.package_path in modified_packages:
+            return True
+        file_path = os.path.abspath(self.get_file_path())
+        return file_path != self._written_file or not os.path.isfile(file_path)
+
+    def _set_unmodified(self):
+        # package file is now up to date with the package's data
+        self._written_file = os.path.abspath(self.get_file_path())
+        self._simulation_data.modified_packages.discard(
+            self.dimensions.package_path
+        )
+
     def _add_package(self, package, path):
         pkg_type = package.package_type.lower()
         if pkg_type in self.package_type_dict:
@@ -2039,6 +2226,26 @@ class MFPackage(PackageContainer, PackageInterface):
                         )
         return data_str
 
+    def _profile(self, operation, block=None, header=None):
+        # context that profiles the package when a profiler is in use
+        profiler = self._simulation_data.profiler
+        if profiler is None:
+            return nullcontext()
+        return profiler.record(
+            operation,
+            self.model_name,
+            self.package_name,
+            self.package_type,
+            block,
+            header,
+        )
+
+    def _profile_block(self, operation, block_header):
+        if self._simulation_data.profiler is None:
+            return nullcontext()
+        header = " ".join(block_header.variable_strings) or None
+        return self._profile(operation, block_header.name.lower(), header)
+
     def _get_pname(self):
         if self.package_name is not None:
             return str(self.package_name)
@@ -2110,6 +2317,9 @@ class MFPackage(PackageContainer, PackageInterface):
 
         # loop through all data
         for block in self.blocks.values():
+            if block._deferred_load is not None:
+                # unparsed data keeps the sizes in the file
+                continue
             for dataset in block.datasets.values():
                 # if data shape is 1-D
                 if (
@@ -2560,7 +2770,7 @@ class MFPackage(PackageContainer, PackageInterface):
             package.set_model_relative_path(model_ws)
 
     def set_all_data_external(
-        self, check_data=True, external_data_folder=None
+        self, check_data=True, external_data_folder=None, binary=False
     ):
         """Sets the package's list and array data to be stored externally.
 
@@ -2570,16 +2780,20 @@ class MFPackage(PackageContainer, PackageInterface):
                 Determine if data error checking is enabled
             external_data_folder
                 Folder where external data will be stored
+            binary : bool
+                Whether array data will be stored in binary files
         """
         # set blocks
         for key, block in self.blocks.items():
             file_name = os.path.split(self.filename)[1]
             block.set_all_data_external(
-                file_name, check_data, external_data_folder
+                file_name, check_data, external_data_folder, binary
             )
         # set sub-packages
         for package in self._packagelist:
-            package.set_all_data_external(check_data, external_data_folder)
+            package.set_all_data_external(
+                check_data, external_data_folder, binary
+            )
 
     def set_all_data_internal(self, check_data=True):
         """Sets the package's list and array data to be stored internally.
@@ -2610,6 +2824,10 @@ class MFPackage(PackageContainer, PackageInterface):
         success : bool
 
         """
+        with self._profile("load"):
+            return self._load_file(strict)
+
+    def _load_file(self, strict):
         # open file
         try:
             fd_input_file = open(
@@ -2634,6 +2852,9 @@ class MFPackage(PackageContainer, PackageInterface):
                     message,
                     self._simulation_data.debug,
                 )
+        profiler = self._simulation_data.profiler
+        if profiler is not None:
+            fd_input_file = profiler.wrap_file(fd_input_file)
 
         try:
             self._load_blocks(fd_input_file, strict)
@@ -2645,6 +2866,7 @@ class MFPackage(PackageContainer, PackageInterface):
 
         if self.simulation_data.auto_set_sizes:
             self._update_size_defs()
+        self._set_unmodified()
 
         # return validity of file
         return self.is_valid()
@@ -2813,14 +3035,27 @@ class MFPackage(PackageContainer, PackageInterface):
                             "", self.path, self._simulation_data
                         )
 
-                        cur_block.load(
-                            block_header_info, fd_input_file, strict
-                        )
+                        with self._profile_block("load", block_header_info):
+                            if not (
+                                self._simulation_data.lazy_load
+                                and cur_block.defer_load(
+                                    block_header_info,
+                                    line,
+                                    fd_input_file,
+                                    strict,
+                                    self.post_block_comments,
+                                )
+                            ):
+                                cur_block.load(
+                                    block_header_info, fd_input_file, strict
+                                )
 
-                        # write post block comment comment
-                        self._simulation_data.mfdata[
-                            cur_block.block_headers[-1].blk_post_comment_path
-                        ] = self.post_block_comments
+                                # write post block comment comment
+                                self._simulation_data.mfdata[
+                                    cur_block.block_headers[
+                                        -1
+                                    ].blk_post_comment_path
+                                ] = self.post_block_comments
 
                         blocks_read += 1
                         if blocks_read >= max_blocks:
@@ -2863,6 +3098,10 @@ class MFPackage(PackageContainer, PackageInterface):
         ext_file_action : ExtFileAction
             How to handle pathing of external data files.
         """
+        with self._profile("write"):
+            self._write_file(ext_file_action)
+
+    def _write_file(self, ext_file_action):
         if self.simulation_data.auto_set_sizes:
             self._update_size_defs()
 
@@ -2872,8 +3111,15 @@ class MFPackage(PackageContainer, PackageInterface):
         if package_folder and not os.path.isdir(package_folder):
             os.makedirs(os.path.split(package_file_path)[0])
 
+        # read unparsed blocks first, they may come from this file
+        for block in self.blocks.values():
+            if block._deferred_load is not None:
+                block._deferred_text = block._read_deferred_text()
+
         # open file
         fd = open(package_file_path, "w")
+        if self._simulation_data.profiler is not None:
+            fd = self._simulation_data.profiler.wrap_file(fd)
 
         # write flopy header
         if self.simulation_data.write_headers:
@@ -2892,6 +3138,7 @@ class MFPackage(PackageContainer, PackageInterface):
         self._write_blocks(fd, ext_file_action)
 
         fd.close()
+        self._set_unmodified()
 
     def create_package_dimensions(self):
         """Creates a package dimensions object.  For internal FloPy library
@@ -3045,7 +3292,8 @@ class MFPackage(PackageContainer, PackageInterface):
             ):
                 print(f"      writing block {block.structure.name}...")
             # write block
-            block.write(fd, ext_file_action=ext_file_action)
+            with self._profile("write", block.structure.name):
+                block.write(fd, ext_file_action=ext_file_action)
             block_num += 1
 
     def get_file_path(self):
@@ -1,69 +1,98 @@
+from importlib import import_module
+
 from .mfsimulation import MFSimulation  # isort:skip
-from .mfgnc import ModflowGnc
-from .mfgwf import ModflowGwf
-from .mfgwfapi import ModflowGwfapi
-from .mfgwfbuy import ModflowGwfbuy
-from .mfgwfchd import ModflowGwfchd
-from .mfgwfcsub import ModflowGwfcsub
-from .mfgwfdis import ModflowGwfdis
-from .mfgwfdisu import ModflowGwfdisu
-from .mfgwfdisv import ModflowGwfdisv
-from .mfgwfdrn import ModflowGwfdrn
-from .mfgwfevt import ModflowGwfevt
-from .mfgwfevta import ModflowGwfevta
-from .mfgwfghb import ModflowGwfghb
-from .mfgwfgnc import ModflowGwfgnc
-from .mfgwfgwf import ModflowGwfgwf
-from .mfgwfgwt import ModflowGwfgwt
-from .mfgwfhfb import ModflowGwfhfb
-from .mfgwfic import ModflowGwfic
-from .mfgwflak import ModflowGwflak
-from .mfgwfmaw import ModflowGwfmaw
-from .mfgwfmvr import ModflowGwfmvr
-from .mfgwfnam import ModflowGwfnam
-from .mfgwfnpf import ModflowGwfnpf
-from .mfgwfoc import ModflowGwfoc
-from .mfgwfrch import ModflowGwfrch
-from .mfgwfrcha import ModflowGwfrcha
-from .mfgwfriv import ModflowGwfriv
-from .mfgwfsfr import ModflowGwfsfr
-from .mfgwfsto import ModflowGwfsto
-from .mfgwfuzf import ModflowGwfuzf
-from .mfgwfwel import ModflowGwfwel
-from .mfgwt import ModflowGwt
-from .mfgwtadv import ModflowGwtadv
-from .mfgwtapi import ModflowGwtapi
-from .mfgwtcnc import ModflowGwtcnc
-from .mfgwtdis import ModflowGwtdis
-from .mfgwtdisu import ModflowGwtdisu
-from .mfgwtdisv import ModflowGwtdisv
-from .mfgwtdsp import ModflowGwtdsp
-from .mfgwtfmi import ModflowGwtfmi
-from .mfgwtgwt import ModflowGwtgwt
-from .mfgwtic import ModflowGwtic
-from .mfgwtist import ModflowGwtist
-from .mfgwtlkt import ModflowGwtlkt
-from .mfgwtmst import ModflowGwtmst
-from .mfgwtmvt import ModflowGwtmvt
-from .mfgwtmwt import ModflowGwtmwt
-from .mfgwtnam import ModflowGwtnam
-from .mfgwtoc import ModflowGwtoc
-from .mfgwtsft import ModflowGwtsft
-from .mfgwtsrc import ModflowGwtsrc
-from .mfgwtssm import ModflowGwtssm
-from .mfgwtuzt import ModflowGwtuzt
-from .mfims import ModflowIms
-from .mfmvr import ModflowMvr
-from .mfmvt import ModflowMvt
-from .mfnam import ModflowNam
-from .mftdis import ModflowTdis
-from .mfutlats import ModflowUtlats
-from .mfutllaktab import ModflowUtllaktab
-from .mfutlobs import ModflowUtlobs
-from .mfutlsfrtab import ModflowUtlsfrtab
-from .mfutlspc import ModflowUtlspc
-from .mfutlspca import ModflowUtlspca
-from .mfutltas import ModflowUtltas
-from .mfutlts import ModflowUtlts
-from .mfutltvk import ModflowUtltvk
-from .mfutltvs import ModflowUtltvs
+
+# Generated package and model classes are imported the first time they are
+# used.  Packages are listed by abbreviation with their module, class, and
+# definition file so that the simulation structure can be built without
+# importing them.
+package_modules = {
+    "gnc": ("mfgnc", "ModflowGnc", "gwf-gnc.dfn"),
+    "gwfapi": ("mfgwfapi", "ModflowGwfapi", "gwf-api.dfn"),
+    "gwfbuy": ("mfgwfbuy", "ModflowGwfbuy", "gwf-buy.dfn"),
+    "gwfchd": ("mfgwfchd", "ModflowGwfchd", "gwf-chd.dfn"),
+    "gwfcsub": ("mfgwfcsub", "ModflowGwfcsub", "gwf-csub.dfn"),
+    "gwfdis": ("mfgwfdis", "ModflowGwfdis", "gwf-dis.dfn"),
+    "gwfdisu": ("mfgwfdisu", "ModflowGwfdisu", "gwf-disu.dfn"),
+    "gwfdisv": ("mfgwfdisv", "ModflowGwfdisv", "gwf-disv.dfn"),
+    "gwfdrn": ("mfgwfdrn", "ModflowGwfdrn", "gwf-drn.dfn"),
+    "gwfevt": ("mfgwfevt", "ModflowGwfevt", "gwf-evt.dfn"),
+    "gwfevta": ("mfgwfevta", "ModflowGwfevta", "gwf-evta.dfn"),
+    "gwfghb": ("mfgwfghb", "ModflowGwfghb", "gwf-ghb.dfn"),
+    "gwfgnc": ("mfgwfgnc", "ModflowGwfgnc", "gwf-gnc.dfn"),
+    "gwfgwf": ("mfgwfgwf", "ModflowGwfgwf", "exg-gwfgwf.dfn"),
+    "gwfgwt": ("mfgwfgwt", "ModflowGwfgwt", "exg-gwfgwt.dfn"),
+    "gwfhfb": ("mfgwfhfb", "ModflowGwfhfb", "gwf-hfb.dfn"),
+    "gwfic": ("mfgwfic", "ModflowGwfic", "gwf-ic.dfn"),
+    "gwflak": ("mfgwflak", "ModflowGwflak", "gwf-lak.dfn"),
+    "gwfmaw": ("mfgwfmaw", "ModflowGwfmaw", "gwf-maw.dfn"),
+    "gwfmvr": ("mfgwfmvr", "ModflowGwfmvr", "gwf-mvr.dfn"),
+    "gwfnam": ("mfgwfnam", "ModflowGwfnam", "gwf-nam.dfn"),
+    "gwfnpf": ("mfgwfnpf", "ModflowGwfnpf", "gwf-npf.dfn"),
+    "gwfoc": ("mfgwfoc", "ModflowGwfoc", "gwf-oc.dfn"),
+    "gwfrch": ("mfgwfrch", "ModflowGwfrch", "gwf-rch.dfn"),
+    "gwfrcha": ("mfgwfrcha", "ModflowGwfrcha", "gwf-rcha.dfn"),
+    "gwfriv": ("mfgwfriv", "ModflowGwfriv", "gwf-riv.dfn"),
+    "gwfsfr": ("mfgwfsfr", "ModflowGwfsfr", "gwf-sfr.dfn"),
+    "gwfsto": ("mfgwfsto", "ModflowGwfsto", "gwf-sto.dfn"),
+    "gwfuzf": ("mfgwfuzf", "ModflowGwfuzf", "gwf-uzf.dfn"),
+    "gwfwel": ("mfgwfwel", "ModflowGwfwel", "gwf-wel.dfn"),
+    "gwtadv": ("mfgwtadv", "ModflowGwtadv", "gwt-adv.dfn"),
+    "gwtapi": ("mfgwtapi", "ModflowGwtapi", "gwt-api.dfn"),
+    "gwtcnc": ("mfgwtcnc", "ModflowGwtcnc", "gwt-cnc.dfn"),
+    "gwtdis": ("mfgwtdis", "ModflowGwtdis", "gwt-dis.dfn"),
+    "gwtdisu": ("mfgwtdisu", "ModflowGwtdisu", "gwt-disu.dfn"),
+    "gwtdisv": ("mfgwtdisv", "ModflowGwtdisv", "gwt-disv.dfn"),
+    "gwtdsp": ("mfgwtdsp", "ModflowGwtdsp", "gwt-dsp.dfn"),
+    "gwtfmi": ("mfgwtfmi", "ModflowGwtfmi", "gwt-fmi.dfn"),
+    "gwtgwt": ("mfgwtgwt", "ModflowGwtgwt", "exg-gwtgwt.dfn"),
+    "gwtic": ("mfgwtic", "ModflowGwtic", "gwt-ic.dfn"),
+    "gwtist": ("mfgwtist", "ModflowGwtist", "gwt-ist.dfn"),
+    "gwtlkt": ("mfgwtlkt", "ModflowGwtlkt", "gwt-lkt.dfn"),
+    "gwtmst": ("mfgwtmst", "ModflowGwtmst", "gwt-mst.dfn"),
+    "gwtmvt": ("mfgwtmvt", "ModflowGwtmvt", "gwt-mvt.dfn"),
+    "gwtmwt": ("mfgwtmwt", "ModflowGwtmwt", "gwt-mwt.dfn"),
+    "gwtnam": ("mfgwtnam", "ModflowGwtnam", "gwt-nam.dfn"),
+    "gwtoc": ("mfgwtoc", "ModflowGwtoc", "gwt-oc.dfn"),
+    "gwtsft": ("mfgwtsft", "ModflowGwtsft", "gwt-sft.dfn"),
+    "gwtsrc": ("mfgwtsrc", "ModflowGwtsrc", "gwt-src.dfn"),
+    "gwtssm": ("mfgwtssm", "ModflowGwtssm", "gwt-ssm.dfn"),
+    "gwtuzt": ("mfgwtuzt", "ModflowGwtuzt", "gwt-uzt.dfn"),
+    "ims": ("mfims", "ModflowIms", "sln-ims.dfn"),
+    "mvr": ("mfmvr", "ModflowMvr", "gwf-mvr.dfn"),
+    "mvt": ("mfmvt", "ModflowMvt", "gwt-mvt.dfn"),
+    "nam": ("mfnam", "ModflowNam", "sim-nam.dfn"),
+    "tdis": ("mftdis", "ModflowTdis", "sim-tdis.dfn"),
+    "utlats": ("mfutlats", "ModflowUtlats", "utl-ats.dfn"),
+    "utllaktab": ("mfutllaktab", "ModflowUtllaktab", "utl-laktab.dfn"),
+    "utlobs": ("mfutlobs", "ModflowUtlobs", "utl-obs.dfn"),
+    "utlsfrtab": ("mfutlsfrtab", "ModflowUtlsfrtab", "utl-sfrtab.dfn"),
+    "utlspc": ("mfutlspc", "ModflowUtlspc", "utl-spc.dfn"),
+    "utlspca": ("mfutlspca", "ModflowUtlspca", "utl-spca.dfn"),
+    "utltas": ("mfutltas", "ModflowUtltas", "utl-tas.dfn"),
+    "utlts": ("mfutlts", "ModflowUtlts", "utl-ts.dfn"),
+    "utltvk": ("mfutltvk", "ModflowUtltvk", "utl-tvk.dfn"),
+    "utltvs": ("mfutltvs", "ModflowUtltvs", "utl-tvs.dfn"),
+}
+model_modules = {
+    "gwf": ("mfgwf", "ModflowGwf"),
+    "gwt": ("mfgwt", "ModflowGwt"),
+}
+_class_modules = {
+    module_info[1]: module_info[0]
+    for module_info in [*package_modules.values(), *model_modules.values()]
+}
+__all__ = ["MFSimulation"] + sorted(_class_modules)
+
+
+def __getattr__(name):
+    if name in _class_modules:
+        module = import_module(f".{_class_modules[name]}", __name__)
+        return getattr(module, name)
+    if name in _class_modules.values():
+        return import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
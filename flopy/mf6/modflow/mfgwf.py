@@ -123,6 +123,7 @@ class ModflowGwf(mfmodel.MFModel):
         strict=True,
         model_rel_path=".",
         load_only=None,
+        workers=1,
     ):
         return mfmodel.MFModel.load_base(
             simulation,
@@ -135,4 +136,5 @@ class ModflowGwf(mfmodel.MFModel):
             strict,
             model_rel_path,
             load_only,
+            workers,
         )
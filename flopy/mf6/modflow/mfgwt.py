@@ -116,6 +116,7 @@ class ModflowGwt(mfmodel.MFModel):
         strict=True,
         model_rel_path=".",
         load_only=None,
+        workers=1,
     ):
         return mfmodel.MFModel.load_base(
             simulation,
@@ -128,4 +129,5 @@ class ModflowGwt(mfmodel.MFModel):
             strict,
             model_rel_path,
             load_only,
+            workers,
         )
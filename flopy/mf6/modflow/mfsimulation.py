@@ -3,6 +3,8 @@ import inspect
 import os.path
 import sys
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 
 import numpy as np
 
@@ -20,7 +22,7 @@ from ..mfbase import (
     VerbosityLevel,
 )
 from ..mfpackage import MFPackage
-from ..modflow import mfgwfgnc, mfgwfmvr, mfgwtmvt, mfims, mfnam, mftdis
+from ..modflow import mfims, mfnam, mftdis
 from ..utils import binaryfile_utils, mfobservation
 
 
@@ -104,7 +106,8 @@ class SimulationDict(dict):
 
         """
         key_path_size = len(key_path)
-        for key, item in self.items():
+        # iterate over a copy, packages may be loading or writing in parallel
+        for key, item in list(self.items()):
             if key[:key_path_size] == key_path:
                 if key[-1] == key_leaf:
                     # found key_leaf as a key in the dictionary
@@ -226,12 +229,25 @@ class MFSimulationData:
         Numbers greater than this threshold are written in scientific notation
     sci_note_lower_thres : float
         Numbers less than this threshold are written in scientific notation
+    vectorized_array_format : bool
+        Whether to format integer and floating point text arrays a line at a
+        time instead of a value at a time.  The output is the same either
+        way, the vectorized formatter is faster for large arrays
     mfpath : MFFileMgmt
         File path location information for the simulation
     model_dimensions : dict
         Dictionary containing discretization information for each model
     mfdata : SimulationDict
         Custom dictionary containing all model data for the simulation
+    lazy_load : bool
+        When true blocks are not parsed when packages are loaded, block
+        data is instead parsed from the package file when first accessed
+    modified_packages : set
+        Paths of the packages whose data has changed since the package was
+        loaded or last written
+    profiler : MFProfiler
+        When set, records the time spent loading and writing each package
+        and block
 
     """
 
@@ -246,10 +262,14 @@ class MFSimulationData:
         self.write_headers = True
         self._sci_note_upper_thres = 100000
         self._sci_note_lower_thres = 0.001
+        self.vectorized_array_format = True
         self.fast_write = True
         self.comments_on = False
         self.auto_set_sizes = True
         self.verify_data = True
+        self.lazy_load = False
+        self.modified_packages = set()
+        self.profiler = None
         self.debug = False
         self.verbose = True
         self.verbosity_level = VerbosityLevel.normal
@@ -600,6 +620,9 @@ class MFSimulation(PackageContainer):
         load_only=None,
         verify_data=False,
         write_headers=True,
+        workers=1,
+        lazy_load=False,
+        profiler=None,
     ):
         """
         Load an existing model.
@@ -636,6 +659,24 @@ class MFSimulation(PackageContainer):
         write_headers: bool
             When true flopy writes a header to each package file indicating
             that it was created by flopy
+        workers : int
+            Number of threads used to load the packages of each model.  The
+            discretization package of a model is loaded first and the
+            remaining packages are then loaded in parallel and added to the
+            model in name file order.  Default is 1, which loads packages
+            one at a time.
+        lazy_load : bool
+            Only record the location of the data in each package block when
+            loading.  Block data is parsed the first time it is accessed and
+            blocks that have not been accessed are copied unchanged when the
+            simulation is written.  Options and dimensions blocks, blocks
+            that reference other files, and blocks with external data are
+            always loaded.
+        profiler : MFProfiler
+            Profiler that records the time spent, the data read, and the
+            number of lines read for each package and block loaded.  Only
+            used while loading, set simulation_data.profiler to also
+            profile blocks parsed later by a lazy load.
 
         Returns
         -------
@@ -647,100 +688,60 @@ class MFSimulation(PackageContainer):
 
         """
         # initialize
-        instance = cls(
-            sim_name,
-            version,
-            exe_name,
-            sim_ws,
-            verbosity_level,
-            write_headers=write_headers,
-        )
+        if profiler is None:
+            init_profile = nullcontext()
+        else:
+            init_profile = profiler.record("initialize")
+        with init_profile:
+            instance = cls(
+                sim_name,
+                version,
+                exe_name,
+                sim_ws,
+                verbosity_level,
+                write_headers=write_headers,
+            )
+        instance.simulation_data.profiler = profiler
         verbosity_level = instance.simulation_data.verbosity_level
         instance.simulation_data.verify_data = verify_data
+        instance.simulation_data.lazy_load = lazy_load
 
-        if verbosity_level.value >= VerbosityLevel.normal.value:
-            print("loading simulation...")
-
-        # build case consistent load_only dictionary for quick lookups
-        load_only = instance._load_only_dict(load_only)
-
-        # load simulation name file
-        if verbosity_level.value >= VerbosityLevel.normal.value:
-            print("  loading simulation name file...")
-        instance.name_file.load(strict)
-
-        # load TDIS file
-        tdis_pkg = f"tdis{mfstructure.MFStructure().get_version_string()}"
-        tdis_attr = getattr(instance.name_file, tdis_pkg)
-        instance._tdis_file = mftdis.ModflowTdis(
-            instance, filename=tdis_attr.get_data()
-        )
+        try:
+            if verbosity_level.value >= VerbosityLevel.normal.value:
+                print("loading simulation...")
 
-        instance._tdis_file._filename = instance.simulation_data.mfdata[
-            ("nam", "timing", tdis_pkg)
-        ].get_data()
-        if verbosity_level.value >= VerbosityLevel.normal.value:
-            print("  loading tdis package...")
-        instance._tdis_file.load(strict)
+            # build case consistent load_only dictionary for quick lookups
+            load_only = instance._load_only_dict(load_only)
 
-        # load models
-        try:
-            model_recarray = instance.simulation_data.mfdata[
-                ("nam", "models", "models")
-            ]
-            models = model_recarray.get_data()
-        except MFDataException as mfde:
-            message = (
-                "Error occurred while loading model names from the "
-                "simulation name file."
-            )
-            raise MFDataException(
-                mfdata_except=mfde,
-                model=instance.name,
-                package="nam",
-                message=message,
-            )
-        for item in models:
-            # resolve model working folder and name file
-            path, name_file = os.path.split(item[1])
-            model_obj = PackageContainer.model_factory(item[0][:-1].lower())
-            # load model
+            # load simulation name file
             if verbosity_level.value >= VerbosityLevel.normal.value:
-                print(f"  loading model {item[0].lower()}...")
-            instance._models[item[2]] = model_obj.load(
-                instance,
-                instance.structure.model_struct_objs[item[0].lower()],
-                item[2],
-                name_file,
-                version,
-                exe_name,
-                strict,
-                path,
-                load_only,
+                print("  loading simulation name file...")
+            instance.name_file.load(strict)
+
+            # load TDIS file
+            tdis_pkg = f"tdis{mfstructure.MFStructure().get_version_string()}"
+            tdis_attr = getattr(instance.name_file, tdis_pkg)
+            instance._tdis_file = mftdis.ModflowTdis(
+                instance, filename=tdis_attr.get_data()
             )
 
-        # load exchange packages and dependent packages
-        try:
-            exchange_recarray = instance.name_file.exchanges
-            has_exch_data = exchange_recarray.has_data()
-        except MFDataException as mfde:
-            message = (
-                "Error occurred while loading exchange names from the "
-                "simulation name file."
-            )
-            raise MFDataException(
-                mfdata_except=mfde,
-                model=instance.name,
-                package="nam",
-                message=message,
-            )
-        if has_exch_data:
+            instance._tdis_file._filename = instance.simulation_data.mfdata[
+                ("nam", "timing", tdis_pkg)
+            ].get_data()
+            if verbosity_level.value >= VerbosityLevel.normal.value:
+                print("  loading tdis package...")
+            instance._tdis_file.load(strict)
+
+            # load models
             try:
-                exch_data = exchange_recarray.get_data()
+                model_recarray = instance.simulation_data.mfdata[
+                    ("nam", "models", "models")
+                ]
+                models = model_recarray.get_data()
             except MFDataException as mfde:
                 message = (
-                    "Error occurred while loading exchange names from "
-                    "the simulation name file."
+                    "Error occurred while loading model names from the "
+                    "simulation name file."
                 )
                 raise MFDataException(
                     mfdata_except=mfde,
@@ -748,109 +749,174 @@ class MFSimulation(PackageContainer):
                     package="nam",
                     message=message,
                 )
-            for exgfile in exch_data:
-                if load_only is not None and not instance._in_pkg_list(
-                    load_only, exgfile[0], exgfile[2]
-                ):
-                    if (
-                        instance.simulation_data.verbosity_level.value
-                        >= VerbosityLevel.normal.value
-                    ):
-                        print(f"    skipping package {exgfile[0].lower()}...")
-                    continue
-                # get exchange type by removing numbers from exgtype
-                exchange_type = "".join(
-                    [char for char in exgfile[0] if not char.isdigit()]
-                ).upper()
-                # get exchange number for this type
-                if exchange_type not in instance._exg_file_num:
-                    exchange_file_num = 0
-                    instance._exg_file_num[exchange_type] = 1
-                else:
-                    exchange_file_num = instance._exg_file_num[exchange_type]
-                    instance._exg_file_num[exchange_type] += 1
+            for item in models:
+                # resolve model working folder and name file
+                path, name_file = os.path.split(item[1])
+                model_obj = PackageContainer.model_factory(
+                    item[0][:-1].lower()
+                )
+                # load model
+                if verbosity_level.value >= VerbosityLevel.normal.value:
+                    print(f"  loading model {item[0].lower()}...")
+                instance._models[item[2]] = model_obj.load(
+                    instance,
+                    instance.structure.model_struct_objs[item[0].lower()],
+                    item[2],
+                    name_file,
+                    version,
+                    exe_name,
+                    strict,
+                    path,
+                    load_only,
+                    workers,
+                )
 
-                exchange_name = f"{exchange_type}_EXG_{exchange_file_num}"
-                # find package class the corresponds to this exchange type
-                package_obj = instance.package_factory(
-                    exchange_type.replace("-", "").lower(), ""
+            # load exchange packages and dependent packages
+            try:
+                exchange_recarray = instance.name_file.exchanges
+                has_exch_data = exchange_recarray.has_data()
+            except MFDataException as mfde:
+                message = (
+                    "Error occurred while loading exchange names from the "
+                    "simulation name file."
                 )
-                if not package_obj:
+                raise MFDataException(
+                    mfdata_except=mfde,
+                    model=instance.name,
+                    package="nam",
+                    message=message,
+                )
+            if has_exch_data:
+                try:
+                    exch_data = exchange_recarray.get_data()
+                except MFDataException as mfde:
                     message = (
-                        "An error occurred while loading the "
-                        "simulation name file.  Invalid exchange type "
-                        '"{}" specified.'.format(exchange_type)
+                        "Error occurred while loading exchange names from "
+                        "the simulation name file."
                     )
-                    type_, value_, traceback_ = sys.exc_info()
                     raise MFDataException(
-                        instance.name,
-                        "nam",
-                        "nam",
-                        "loading simulation name file",
-                        exchange_recarray.structure.name,
-                        inspect.stack()[0][3],
-                        type_,
-                        value_,
-                        traceback_,
-                        message,
-                        instance._simulation_data.debug,
+                        mfdata_except=mfde,
+                        model=instance.name,
+                        package="nam",
+                        message=message,
+                    )
+                for exgfile in exch_data:
+                    if load_only is not None and not instance._in_pkg_list(
+                        load_only, exgfile[0], exgfile[2]
+                    ):
+                        if (
+                            instance.simulation_data.verbosity_level.value
+                            >= VerbosityLevel.normal.value
+                        ):
+                            print(
+                                f"    skipping package {exgfile[0].lower()}..."
+                            )
+                        continue
+                    # get exchange type by removing numbers from exgtype
+                    exchange_type = "".join(
+                        [char for char in exgfile[0] if not char.isdigit()]
+                    ).upper()
+                    # get exchange number for this type
+                    if exchange_type not in instance._exg_file_num:
+                        exchange_file_num = 0
+                        instance._exg_file_num[exchange_type] = 1
+                    else:
+                        exchange_file_num = instance._exg_file_num[
+                            exchange_type
+                        ]
+                        instance._exg_file_num[exchange_type] += 1
+
+                    exchange_name = f"{exchange_type}_EXG_{exchange_file_num}"
+                    # find package class the corresponds to this exchange type
+                    package_obj = instance.package_factory(
+                        exchange_type.replace("-", "").lower(), ""
                     )
+                    if not package_obj:
+                        message = (
+                            "An error occurred while loading the "
+                            "simulation name file.  Invalid exchange type "
+                            '"{}" specified.'.format(exchange_type)
+                        )
+                        type_, value_, traceback_ = sys.exc_info()
+                        raise MFDataException(
+                            instance.name,
+                            "nam",
+                            "nam",
+                            "loading simulation name file",
+                            exchange_recarray.structure.name,
+                            inspect.stack()[0][3],
+                            type_,
+                            value_,
+                            traceback_,
+                            message,
+                            instance._simulation_data.debug,
+                        )
 
-                # build and load exchange package object
-                exchange_file = package_obj(
-                    instance,
-                    exgtype=exgfile[0],
-                    exgmnamea=exgfile[2],
-                    exgmnameb=exgfile[3],
-                    filename=exgfile[1],
-                    pname=exchange_name,
-                    loading_package=True,
-                )
-                if verbosity_level.value >= VerbosityLevel.normal.value:
-                    print(
-                        f"  loading exchange package {exchange_file._get_pname()}..."
+                    # build and load exchange package object
+                    exchange_file = package_obj(
+                        instance,
+                        exgtype=exgfile[0],
+                        exgmnamea=exgfile[2],
+                        exgmnameb=exgfile[3],
+                        filename=exgfile[1],
+                        pname=exchange_name,
+                        loading_package=True,
                     )
-                exchange_file.load(strict)
-                instance._exchange_files[exgfile[1]] = exchange_file
+                    if verbosity_level.value >= VerbosityLevel.normal.value:
+                        print(
+                            f"  loading exchange package {exchange_file._get_pname()}..."
+                        )
+                    exchange_file.load(strict)
+                    instance._exchange_files[exgfile[1]] = exchange_file
 
-        # load simulation packages
-        solution_recarray = instance.simulation_data.mfdata[
-            ("nam", "solutiongroup", "solutiongroup")
-        ]
+            # load simulation packages
+            solution_recarray = instance.simulation_data.mfdata[
+                ("nam", "solutiongroup", "solutiongroup")
+            ]
 
-        try:
-            solution_group_dict = solution_recarray.get_data()
-        except MFDataException as mfde:
-            message = (
-                "Error occurred while loading solution groups from "
-                "the simulation name file."
-            )
-            raise MFDataException(
-                mfdata_except=mfde,
-                model=instance.name,
-                package="nam",
-                message=message,
-            )
-        for solution_group in solution_group_dict.values():
-            for solution_info in solution_group:
-                if load_only is not None and not instance._in_pkg_list(
-                    load_only, solution_info[0], solution_info[2]
-                ):
-                    if (
-                        instance.simulation_data.verbosity_level.value
-                        >= VerbosityLevel.normal.value
+            try:
+                solution_group_dict = solution_recarray.get_data()
+            except MFDataException as mfde:
+                message = (
+                    "Error occurred while loading solution groups from "
+                    "the simulation name file."
+                )
+                raise MFDataException(
+                    mfdata_except=mfde,
+                    model=instance.name,
+                    package="nam",
+                    message=message,
+                )
+            for solution_group in solution_group_dict.values():
+                for solution_info in solution_group:
+                    if load_only is not None and not instance._in_pkg_list(
+                        load_only, solution_info[0], solution_info[2]
                     ):
+                        if (
+                            instance.simulation_data.verbosity_level.value
+                            >= VerbosityLevel.normal.value
+                        ):
+                            print(
+                                f"    skipping package {solution_info[0].lower()}..."
+                            )
+                        continue
+                    ims_file = mfims.ModflowIms(
+                        instance,
+                        filename=solution_info[1],
+                        pname=solution_info[2],
+                    )
+                    if verbosity_level.value >= VerbosityLevel.normal.value:
                         print(
-                            f"    skipping package {solution_info[0].lower()}..."
+                            f"  loading ims package {ims_file._get_pname()}..."
                         )
-                    continue
-                ims_file = mfims.ModflowIms(
-                    instance, filename=solution_info[1], pname=solution_info[2]
-                )
-                if verbosity_level.value >= VerbosityLevel.normal.value:
-                    print(f"  loading ims package {ims_file._get_pname()}...")
-                ims_file.load(strict)
-
+                    ims_file.load(strict)
+        finally:
+            # packages added or loaded later are not deferred
+            instance.simulation_data.lazy_load = False
+
+        # the loaded simulation matches its files
+        instance.simulation_data.modified_packages.clear()
+        instance.simulation_data.profiler = None
         instance.simulation_data.mfpath.set_last_accessed_path()
         if verify_data:
             instance.check()
@@ -1272,7 +1338,7 @@ class MFSimulation(PackageContainer):
             model.rename_all_packages(name)
 
     def set_all_data_external(
-        self, check_data=True, external_data_folder=None
+        self, check_data=True, external_data_folder=None, binary=False
     ):
         """Sets the simulation's list and array data to be stored externally.
 
@@ -1285,20 +1351,31 @@ class MFSimulation(PackageContainer):
                 Folder, relative to the simulation path or model relative path
                 (see use_model_relative_path parameter), where external data
                 will be stored
+            binary: bool
+                Whether array data will be stored in binary files.  List
+                data is always stored in text files.
         """
         # copy any files whose paths have changed
         self.simulation_data.mfpath.copy_files()
         # set data external for all packages in all models
         for model in self._models.values():
-            model.set_all_data_external(check_data, external_data_folder)
+            model.set_all_data_external(
+                check_data, external_data_folder, binary
+            )
         # set data external for ims packages
         for package in self._ims_files.values():
-            package.set_all_data_external(check_data, external_data_folder)
+            package.set_all_data_external(
+                check_data, external_data_folder, binary
+            )
         # set data external for other packages
         for package in self._other_files.values():
-            package.set_all_data_external(check_data, external_data_folder)
+            package.set_all_data_external(
+                check_data, external_data_folder, binary
+            )
         for package in self._exchange_files.values():
-            package.set_all_data_external(check_data, external_data_folder)
+            package.set_all_data_external(
+                check_data, external_data_folder, binary
+            )
 
     def set_all_data_internal(self, check_data=True):
         # set data external for all packages in all models
@@ -1315,7 +1392,12 @@ class MFSimulation(PackageContainer):
             package.set_all_data_internal(check_data)
 
     def write_simulation(
-        self, ext_file_action=ExtFileAction.copy_relative_paths, silent=False
+        self,
+        ext_file_action=ExtFileAction.copy_relative_paths,
+        silent=False,
+        workers=1,
+        skip_unchanged=False,
+        profiler=None,
     ):
         """
         Write the simulation to files.
@@ -1328,6 +1410,17 @@ class MFSimulation(PackageContainer):
                 by absolute paths fixed.
             silent : bool
                 Writes out the simulation in silent mode (verbosity_level = 0)
+            workers : int
+                Number of threads used to write package files.  Default is
+                1, which writes one package file at a time.
+            skip_unchanged : bool
+                Only write packages whose data has changed since the package
+                was loaded or last written, or whose file is not in the
+                simulation folder.  Changes made directly to arrays returned
+                by get_data are not detected.
+            profiler : MFProfiler
+                Profiler that records the time spent, the data written, and
+                the number of lines written for each package and block.
 
         """
         sim_data = self.simulation_data
@@ -1344,61 +1437,123 @@ class MFSimulation(PackageContainer):
         if silent:
             self.simulation_data.verbosity_level = VerbosityLevel.quiet
 
-        # write simulation name file
-        if (
-            self.simulation_data.verbosity_level.value
-            >= VerbosityLevel.normal.value
-        ):
-            print("writing simulation...")
-            print("  writing simulation name file...")
-        self.name_file.write(ext_file_action=ext_file_action)
-
-        # write TDIS file
-        if (
-            self.simulation_data.verbosity_level.value
-            >= VerbosityLevel.normal.value
-        ):
-            print("  writing simulation tdis package...")
-        self._tdis_file.write(ext_file_action=ext_file_action)
-
-        # write ims files
-        for ims_file in self._ims_files.values():
+        saved_profiler = sim_data.profiler
+        if profiler is not None:
+            sim_data.profiler = profiler
+        executor = None
+        if workers > 1:
+            executor = ThreadPoolExecutor(max_workers=workers)
+        futures = []
+        try:
+            # write simulation name file
             if (
                 self.simulation_data.verbosity_level.value
                 >= VerbosityLevel.normal.value
             ):
-                print(f"  writing ims package {ims_file._get_pname()}...")
-            ims_file.write(ext_file_action=ext_file_action)
-
-        # write exchange files
-        for exchange_file in self._exchange_files.values():
-            exchange_file.write()
+                print("writing simulation...")
+                print("  writing simulation name file...")
+            self._write_package(
+                self.name_file,
+                ext_file_action,
+                skip_unchanged,
+                executor,
+                futures,
+            )
 
-        # write other packages
-        for pp in self._other_files.values():
+            # write TDIS file
             if (
                 self.simulation_data.verbosity_level.value
                 >= VerbosityLevel.normal.value
             ):
-                print(f"  writing package {pp._get_pname()}...")
-            pp.write(ext_file_action=ext_file_action)
+                print("  writing simulation tdis package...")
+            self._write_package(
+                self._tdis_file,
+                ext_file_action,
+                skip_unchanged,
+                executor,
+                futures,
+            )
+
+            # write ims files
+            for ims_file in self._ims_files.values():
+                if (
+                    self.simulation_data.verbosity_level.value
+                    >= VerbosityLevel.normal.value
+                ):
+                    print(f"  writing ims package {ims_file._get_pname()}...")
+                self._write_package(
+                    ims_file,
+                    ext_file_action,
+                    skip_unchanged,
+                    executor,
+                    futures,
+                )
 
-        # FIX: model working folder should be model name file folder
+            # write exchange files
+            for exchange_file in self._exchange_files.values():
+                self._write_package(
+                    exchange_file,
+                    ext_file_action,
+                    skip_unchanged,
+                    executor,
+                    futures,
+                )
 
-        # write models
-        for model in self._models.values():
-            if (
-                self.simulation_data.verbosity_level.value
-                >= VerbosityLevel.normal.value
-            ):
-                print(f"  writing model {model.name}...")
-            model.write(ext_file_action=ext_file_action)
+            # write other packages
+            for pp in self._other_files.values():
+                if (
+                    self.simulation_data.verbosity_level.value
+                    >= VerbosityLevel.normal.value
+                ):
+                    print(f"  writing package {pp._get_pname()}...")
+                self._write_package(
+                    pp, ext_file_action, skip_unchanged, executor, futures
+                )
+
+            # FIX: model working folder should be model name file folder
+
+            # write models
+            for model in self._models.values():
+                if (
+                    self.simulation_data.verbosity_level.value
+                    >= VerbosityLevel.normal.value
+                ):
+                    print(f"  writing model {model.name}...")
+                if executor is None and not skip_unchanged:
+                    model.write(ext_file_action=ext_file_action)
+                    continue
+                # write name file and package files of the model
+                for pp in [model.name_file] + model.packagelist:
+                    self._write_package(
+                        pp, ext_file_action, skip_unchanged, executor, futures
+                    )
+
+            # wait for the package files, raising any error that occurred
+            for future in futures:
+                future.result()
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            sim_data.profiler = saved_profiler
 
         self.simulation_data.mfpath.set_last_accessed_path()
 
         if silent:
             self.simulation_data.verbosity_level = saved_verb_lvl
 
+    @staticmethod
+    def _write_package(
+        package, ext_file_action, skip_unchanged, executor, futures
+    ):
+        if skip_unchanged and not package.modified:
+            return
+        if executor is None:
+            package.write(ext_file_action=ext_file_action)
+        else:
+            futures.append(
+                executor.submit(package.write, ext_file_action=ext_file_action)
+            )
+
     def set_sim_path(self, path):
         """Return a list of output data keys.
 
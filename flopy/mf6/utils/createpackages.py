@@ -395,13 +395,13 @@ def build_model_load(model_type):
         "model_nam_file='modflowtest.nam', version='mf6',\n"
         "             exe_name='mf6', strict=True, "
         "model_rel_path='.',\n"
-        "             load_only=None):\n        "
+        "             load_only=None, workers=1):\n        "
         "return mfmodel.MFModel.load_base(simulation, structure, "
         "modelname,\n                                         "
         "model_nam_file, '{}', version,\n"
         "                                         exe_name, strict, "
         "model_rel_path,\n"
-        "                                         load_only)"
+        "                                         load_only, workers)"
         "\n".format(model_type)
     )
     return model_load, model_load_c
@@ -417,6 +417,47 @@ def build_model_init_vars(param_list):
     return "\n".join(init_var_list)
 
 
+def build_modflow_init(package_modules, model_modules):
+    init_string = (
+        "from importlib import import_module\n\n"
+        "from .mfsimulation import MFSimulation  # isort:skip\n\n"
+        "# Generated package and model classes are imported the first time "
+        "they are\n# used.  Packages are listed by abbreviation with their "
+        "module, class, and\n# definition file so that the simulation "
+        "structure can be built without\n# importing them.\n"
+        "package_modules = {\n"
+    )
+    for package_abbr, module_info in sorted(package_modules.items()):
+        init_string += '    "{}": ("{}", "{}", "{}"),\n'.format(
+            package_abbr, *module_info
+        )
+    init_string += "}\nmodel_modules = {\n"
+    for model_type, module_info in sorted(model_modules.items()):
+        init_string += '    "{}": ("{}", "{}"),\n'.format(
+            model_type, *module_info
+        )
+    init_string += (
+        "}\n_class_modules = {\n"
+        "    module_info[1]: module_info[0]\n"
+        "    for module_info in [*package_modules.values(), "
+        "*model_modules.values()]\n"
+        "}\n"
+        '__all__ = ["MFSimulation"] + sorted(_class_modules)\n\n\n'
+        "def __getattr__(name):\n"
+        "    if name in _class_modules:\n"
+        '        module = import_module(f".{_class_modules[name]}", '
+        "__name__)\n"
+        "        return getattr(module, name)\n"
+        "    if name in _class_modules.values():\n"
+        '        return import_module(f".{name}", __name__)\n'
+        '    raise AttributeError(f"module {__name__!r} has no attribute '
+        '{name!r}")\n\n\n'
+        "def __dir__():\n"
+        "    return sorted(set(globals()) | set(__all__))\n"
+    )
+    return init_string
+
+
 def create_packages():
     indent = "    "
     init_string_def = "    def __init__(self"
@@ -485,12 +526,6 @@ def create_packages():
             )
 
     util_path, tail = os.path.split(os.path.realpath(__file__))
-    init_file = io.open(
-        os.path.join(util_path, "..", "modflow", "__init__.py"),
-        "w",
-        newline="\n",
-    )
-    init_file.write("from .mfsimulation import MFSimulation  # isort:skip\n")
 
     nam_import_string = (
         "from .. import mfmodel\nfrom ..data.mfdatautil "
@@ -498,7 +533,8 @@ def create_packages():
     )
 
     # loop through packages list
-    init_file_imports = []
+    package_modules = {}
+    model_modules = {}
     for package in package_list:
         data_structure_dict = {}
         package_properties = []
@@ -850,8 +886,10 @@ def create_packages():
             pb_file.write(packages_str)
         pb_file.close()
 
-        init_file_imports.append(
-            f"from .mf{package_name} import Modflow{package_name.title()}\n"
+        package_modules[package_abbr] = (
+            f"mf{package_name}",
+            f"Modflow{package_name.title()}",
+            package[0].dfn_file_name,
         )
 
         if package[0].dfn_type == mfstructure.DfnType.model_name_file:
@@ -925,12 +963,16 @@ def create_packages():
             )
             md_file.write(package_string)
             md_file.close()
-            init_file_imports.append(
-                f"from .mf{model_name} import Modflow{model_name.capitalize()}\n"
+            model_modules[model_name] = (
+                f"mf{model_name}",
+                f"Modflow{model_name.capitalize()}",
             )
-    # Sort the imports
-    for line in sorted(init_file_imports, key=lambda x: x.split()[3]):
-        init_file.write(line)
+    init_file = io.open(
+        os.path.join(util_path, "..", "modflow", "__init__.py"),
+        "w",
+        newline="\n",
+    )
+    init_file.write(build_modflow_init(package_modules, model_modules))
     init_file.close()
 
 
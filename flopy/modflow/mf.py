@@ -152,6 +152,8 @@ class Modflow(BaseModel):
         # self.external_binflag = []
 
         self.load_fail = False
+        # read OPEN/CLOSE arrays only when they are accessed
+        self.lazy_load = False
         # the starting external data unit number
         self._next_ext_unit = 1000
 
@@ -658,6 +660,7 @@ class Modflow(BaseModel):
         load_only=None,
         forgive=False,
         check=True,
+        lazy_load=False,
     ):
         """
         Load an existing MODFLOW model.
@@ -687,6 +690,11 @@ class Modflow(BaseModel):
             useful for debugging. Default False.
         check : boolean, optional
             Check model input for common errors. Default True.
+        lazy_load : bool, optional
+            Do not read arrays that are specified with OPEN/CLOSE until
+            they are accessed. Arrays that are never accessed are copied
+            from their original files by write_input. Checking the model
+            reads all of the arrays, so use with check=False. Default False.
 
         Returns
         -------
@@ -727,6 +735,7 @@ class Modflow(BaseModel):
             model_ws=model_ws,
             **attribs,
         )
+        ml.lazy_load = lazy_load
 
         files_successfully_loaded = []
         files_not_loaded = []
@@ -8,7 +8,13 @@ important classes that can be accessed by the user.
 *  CellBudgetFile (Binary cell-by-cell flow file)
 
 """
+import json
+import os
+import time
 import warnings
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
@@ -191,6 +197,87 @@ def join_struct_arrays(arrays):
     return newrecarray
 
 
+# a span of a record is read at once by BinaryArrayView when it holds at
+# most this many values for each selected value, otherwise it is read by row
+_DENSE_SPAN_FACTOR = 4
+
+
+# version of the sidecar index cache layout written by _save_index_cache,
+# which is incremented whenever keys are added to or removed from the cache
+_INDEX_CACHE_VERSION = 2
+
+
+def get_index_cache_path(filename):
+    """
+    Get the path of the sidecar index cache for a MODFLOW binary file.
+
+    Parameters
+    ----------
+    filename : str
+        Name of binary MODFLOW file.
+
+    Returns
+    -------
+    path : str
+        Path of the index cache, which is stored next to the binary file.
+
+    """
+    return f"{filename}.index.npz"
+
+
+def _get_file_signature(filename):
+    """
+    Get the size and modification time (in nanoseconds) of a file, which
+    are used to determine if an index cache is stale.
+
+    """
+    st = os.stat(filename)
+    return np.array([st.st_size, st.st_mtime_ns], dtype=np.int64)
+
+
+def _load_index_cache(filename, **expected):
+    """
+    Load the sidecar index cache for a binary file.  None is returned if
+    the cache does not exist, cannot be read, is stale, or if any of the
+    expected values do not match the values stored in the cache.
+
+    """
+    path = get_index_cache_path(filename)
+    if not os.path.isfile(path):
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as npz:
+            cache = {key: npz[key] for key in npz.files}
+    except Exception:
+        return None
+    if cache.get("version", -1) != _INDEX_CACHE_VERSION:
+        return None
+    if not np.array_equal(
+        cache.get("signature"), _get_file_signature(filename)
+    ):
+        return None
+    for key, value in expected.items():
+        if key not in cache or cache[key].item() != value:
+            return None
+    return cache
+
+
+def _save_index_cache(filename, signature, **data):
+    """
+    Write the sidecar index cache for a binary file.  signature is the file
+    signature taken before the index was built.  A warning is issued if the
+    cache cannot be written.
+
+    """
+    path = get_index_cache_path(filename)
+    try:
+        np.savez(
+            path, version=_INDEX_CACHE_VERSION, signature=signature, **data
+        )
+    except OSError as e:
+        warnings.warn(f"Could not write index cache {path}: {e}")
+
+
 def get_headfile_precision(filename):
     """
     Determine precision of a MODFLOW head file.
@@ -273,6 +360,185 @@ def get_headfile_precision(filename):
     return result
 
 
+class BinaryArrayView:
+    """
+    Lazily evaluated, read-only (ntimes, nlay, nrow, ncol) array over the
+    data records of a binary output file.  Data are only read from the
+    file when the view is indexed, and only the span of each record that
+    contains the selected rows and columns is read.  If that span is
+    sparse, such as for a single column, only the span of the selected
+    columns is read from each selected row.
+
+    Instances are created with the as_array() method of HeadFile, UcnFile
+    and CellBudgetFile.
+
+    Parameters
+    ----------
+    file : file object
+        Open binary file handle.
+    positions : numpy array
+        Integer array of size (ntimes, nlay) with the position in the file
+        of the data for each time and layer, or -1 if there are no data.
+    shape : tuple of ints
+        (nrow, ncol) shape of the data for a layer.
+    dtype : numpy dtype
+        Data type of the values in the file.
+    mmap : numpy memmap
+        Optional memory-mapped uint8 array of the file.  If provided the
+        data are gathered from the memory map instead of the file handle.
+
+    Notes
+    -----
+    Indexing uses outer (orthogonal) indexing, like netCDF4 variables:
+    each of the four dimensions can be selected with an integer, a slice,
+    or a one-dimensional list or array of integers or booleans, and each
+    selection applies to its dimension independently.  Integer selections
+    remove the dimension from the result.  Times or layers without data
+    are returned as np.nan.
+
+    Examples
+    --------
+    >>> import flopy
+    >>> hdobj = flopy.utils.HeadFile('test.hds')
+    >>> heads = hdobj.as_array()
+    >>> heads.shape
+    (10000, 3, 100, 100)
+    >>> transect = heads[:1000, 0, :, 50]
+
+    """
+
+    def __init__(self, file, positions, shape, dtype, mmap=None):
+        self.file = file
+        self.positions = np.asarray(positions, dtype=np.int64)
+        self.dtype = np.dtype(dtype)
+        self.shape = self.positions.shape + tuple(int(n) for n in shape)
+        self.mmap = mmap
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(shape={self.shape}, "
+            f"dtype={self.dtype})"
+        )
+
+    def __array__(self, dtype=None):
+        data = self[...]
+        if dtype is not None:
+            data = data.astype(dtype)
+        return data
+
+    def _get_indices(self, key):
+        """
+        Convert key to an array of indices for each dimension and a list of
+        the dimensions selected with an integer.
+
+        """
+        if not isinstance(key, tuple):
+            key = (key,)
+        if any(k is Ellipsis for k in key):
+            i = [k is Ellipsis for k in key].index(True)
+            fill = (slice(None),) * (self.ndim - len(key) + 1)
+            key = key[:i] + fill + key[i + 1 :]
+        if len(key) > self.ndim:
+            raise IndexError(
+                f"too many indices: array is {self.ndim}-dimensional, but "
+                f"{len(key)} were indexed"
+            )
+        key = key + (slice(None),) * (self.ndim - len(key))
+
+        indices = []
+        scalar = []
+        for dim, (k, n) in enumerate(zip(key, self.shape)):
+            if isinstance(k, (int, np.integer)):
+                if k < -n or k >= n:
+                    raise IndexError(
+                        f"index {k} is out of bounds for axis {dim} "
+                        f"with size {n}"
+                    )
+                indices.append(np.array([k % n]))
+                scalar.append(dim)
+            elif isinstance(k, slice):
+                indices.append(np.arange(n)[k])
+            elif k is None:
+                raise IndexError("new axes are not supported")
+            else:
+                k = np.asarray(k)
+                if k.ndim != 1:
+                    raise IndexError(
+                        "only one-dimensional index arrays are supported"
+                    )
+                indices.append(np.arange(n)[k])
+        return indices, scalar
+
+    def __getitem__(self, key):
+        (itim, ilay, irow, icol), scalar = self._get_indices(key)
+        ncol = self.shape[3]
+        data = np.empty(
+            (len(itim), len(ilay), len(irow), len(icol)), dtype=self.dtype
+        )
+        data[:] = np.nan
+
+        if data.size > 0:
+            # span of the layer record containing the selected cells
+            ncol = self.shape[3]
+            offsets = (irow[:, None] * ncol + icol[None, :]).ravel()
+            n0 = offsets.min()
+            count = offsets.max() - n0 + 1
+            if (
+                self.mmap is not None
+                or count <= _DENSE_SPAN_FACTOR * offsets.size
+            ):
+                spans = [(n0, count, slice(None), offsets - n0)]
+            else:
+                # the span is sparse, for example a column transect, so
+                # only read the span of the selected columns in each row
+                c0 = icol.min()
+                ccount = icol.max() - c0 + 1
+                spans = [
+                    (
+                        irow[ir] * ncol + c0,
+                        ccount,
+                        slice(ir * len(icol), (ir + 1) * len(icol)),
+                        icol - c0,
+                    )
+                    for ir in range(len(irow))
+                ]
+            itemsize = self.dtype.itemsize
+            for i, t in enumerate(itim):
+                for j, k in enumerate(ilay):
+                    ipos = self.positions[t, k]
+                    if ipos < 0:
+                        continue
+                    # flat view of the selected rows and columns
+                    target = data[i, j].reshape(-1)
+                    for start, n, dest, index in spans:
+                        if self.mmap is not None:
+                            values = np.ndarray(
+                                shape=(n,),
+                                dtype=self.dtype,
+                                buffer=self.mmap,
+                                offset=int(ipos + start * itemsize),
+                            )
+                        else:
+                            self.file.seek(int(ipos + start * itemsize), 0)
+                            values = binaryread(
+                                self.file, self.dtype.type, shape=(n,)
+                            )
+                        target[dest] = values[index]
+
+        if scalar:
+            data = data[
+                tuple(0 if dim in scalar else slice(None) for dim in range(4))
+            ]
+        return data
+
+
 class BinaryLayerFile(LayerFile):
     """
     The BinaryLayerFile class is the super class from which specific derived
@@ -280,8 +546,22 @@ class BinaryLayerFile(LayerFile):
 
     """
 
-    def __init__(self, filename, precision, verbose, kwargs):
+    def __init__(
+        self,
+        filename,
+        precision,
+        verbose,
+        kwargs,
+        mmap=False,
+        index_cache=False,
+    ):
+        self.mmap = mmap
+        self.index_cache = index_cache
+        self._mmap = None
+        self._recordview = None
         super().__init__(filename, precision, verbose, kwargs)
+        if mmap:
+            self._init_mmap()
         return
 
     def __enter__(self):
@@ -290,12 +570,432 @@ class BinaryLayerFile(LayerFile):
     def __exit__(self, *exc):
         self.close()
 
+    def _init_mmap(self):
+        """
+        Memory-map the file and, if every data record has the same shape
+        and the records are evenly spaced in the file, build a strided
+        (nrecords, ...) view over all of the data records.
+
+        """
+        self._mmap = np.memmap(self.filename, dtype=np.uint8, mode="r")
+        self._recordview = None
+        nrec = len(self.iposarray)
+        if nrec == 0:
+            return
+        shp = self._get_record_shape(self.recordarray[0])
+        for header in self.recordarray[1:]:
+            if self._get_record_shape(header) != shp:
+                return
+        ipos = self.iposarray.astype(np.int64)
+        if nrec > 1:
+            stride = int(ipos[1] - ipos[0])
+            if not np.all(np.diff(ipos) == stride):
+                return
+        else:
+            stride = int(self.get_databytes(self.recordarray[0]))
+        itemsize = self.realtype(1).nbytes
+        strides = (stride,) + tuple(
+            itemsize * int(np.prod(shp[i + 1 :])) for i in range(len(shp))
+        )
+        self._recordview = np.ndarray(
+            shape=(nrec,) + shp,
+            dtype=self.realtype,
+            buffer=self._mmap,
+            offset=int(ipos[0]),
+            strides=strides,
+        )
+
+    def _get_record_shape(self, header):
+        """
+        Return the shape of the data array that follows a header.
+
+        """
+        return int(header["nrow"]), int(header["ncol"])
+
+    def _read_record(self, idx):
+        """
+        Read the data array for a zero-based record number.  If the file
+        is memory-mapped a read-only view of the record is returned.
+
+        """
+        shp = self._get_record_shape(self.recordarray[idx])
+        ipos = int(self.iposarray[idx])
+        if self._mmap is not None:
+            return np.ndarray(
+                shape=shp,
+                dtype=self.realtype,
+                buffer=self._mmap,
+                offset=ipos,
+            )
+        self.file.seek(ipos, 0)
+        return self._read_data(shp)
+
+    def _get_time_indices(self):
+        """
+        Return the zero-based index into self.times for every record.
+
+        """
+        times = np.array(self.times)
+        sorter = np.argsort(times, kind="stable")
+        isort = np.searchsorted(
+            times, self.recordarray["totim"], sorter=sorter
+        )
+        return sorter[isort]
+
+    def _get_data_array(self, totim=0):
+        """
+        Get the three dimensional data array for the specified totim value.
+        For memory-mapped files a read-only view into the file is returned
+        when the layers for totim are stored contiguously.
+
+        """
+        if self._recordview is None:
+            return super()._get_data_array(totim)
+
+        if totim >= 0.0:
+            keyindices = np.where((self.recordarray["totim"] == totim))[0]
+            if len(keyindices) == 0:
+                msg = f"totim value ({totim}) not found in file..."
+                raise Exception(msg)
+        else:
+            raise Exception("Data not found...")
+
+        ilay = self.recordarray["ilay"][keyindices]
+        i0 = keyindices[0]
+        if np.array_equal(
+            keyindices, np.arange(i0, i0 + self.nlay)
+        ) and np.array_equal(ilay, np.arange(1, self.nlay + 1)):
+            return self._recordview[i0 : i0 + self.nlay]
+        data = np.empty(
+            (self.nlay,) + self._recordview.shape[1:], dtype=self.realtype
+        )
+        data[:] = np.nan
+        data[ilay - 1] = self._recordview[keyindices]
+        return data
+
+    def get_alldata(self, mflay=None, nodata=-9999):
+        """
+        Get all of the data from the file.
+
+        Parameters
+        ----------
+        mflay : integer
+           MODFLOW zero-based layer number to return.  If None, then all
+           all layers will be included. (Default is None.)
+
+        nodata : float
+           The nodata value in the data array.  All array values that have the
+           nodata value will be assigned np.nan.
+
+        Returns
+        ----------
+        data : numpy array
+            Array has size (ntimes, nlay, nrow, ncol) if mflay is None or it
+            has size (ntimes, nrow, ncol) if mlay is specified.
+
+        """
+        if self._recordview is None:
+            return super().get_alldata(mflay=mflay, nodata=nodata)
+
+        ntimes = len(self.times)
+        nlay = self.nlay
+        itim = self._get_time_indices()
+        ilay = self.recordarray["ilay"] - 1
+        shp = self._recordview.shape[1:]
+        # the records are copied from the memory map once, into the
+        # returned array, and the nodata values are replaced in place
+        if (
+            len(itim) == ntimes * nlay
+            and np.array_equal(itim, np.repeat(np.arange(ntimes), nlay))
+            and np.array_equal(ilay, np.tile(np.arange(nlay), ntimes))
+        ):
+            data = self._recordview.reshape((ntimes, nlay) + shp)
+            if mflay is not None:
+                data = data[:, mflay]
+            data = np.array(data, dtype=self.realtype)
+        elif mflay is None:
+            data = np.empty((ntimes, nlay) + shp, dtype=self.realtype)
+            data[:] = np.nan
+            data[itim, ilay] = self._recordview
+        else:
+            data = np.empty((ntimes,) + shp, dtype=self.realtype)
+            data[:] = np.nan
+            for irec in np.flatnonzero(ilay == mflay):
+                data[itim[irec]] = self._recordview[irec]
+        data[data == nodata] = np.nan
+        return data
+
+    def iter_alldata(
+        self, chunksize=10, mflay=None, nodata=-9999, times=None, workers=1
+    ):
+        """
+        Iterate over all of the data in the file in chunks of simulation
+        times, so that the full (ntimes, nlay, nrow, ncol) array is never
+        held in memory.
+
+        Parameters
+        ----------
+        chunksize : int
+            Maximum number of simulation times in each chunk.
+            (Default is 10.)
+        mflay : integer
+           MODFLOW zero-based layer number to return.  If None, then all
+           all layers will be included. (Default is None.)
+        nodata : float
+            The nodata value in the data array.  All array values that have
+            the nodata value will be assigned np.nan.  If None, values are
+            not replaced.  (Default is -9999.)
+        times : list of floats
+            Simulation times (totim) to return.  Times that are not in the
+            file are returned as np.nan.  If None, all of the times in the
+            file are returned.  (Default is None.)
+        workers : int
+            Number of threads used to read chunks ahead of the chunk that is
+            being processed.  Each thread reads from its own file handle.
+            (Default is 1.)
+
+        Yields
+        ------
+        data : numpy array
+            Array has size (nchunk, nlay, nrow, ncol) if mflay is None or it
+            has size (nchunk, nrow, ncol) if mflay is specified, where nchunk
+            is at most chunksize.
+
+        Notes
+        -----
+        At most workers + 1 chunks are held in memory at any time.
+
+        Examples
+        --------
+        >>> import flopy
+        >>> hdobj = flopy.utils.HeadFile('test.hds')
+        >>> for data in hdobj.iter_alldata(chunksize=100, workers=4):
+        ...     print(np.nanmax(data))
+
+        """
+        if chunksize < 1:
+            raise ValueError("chunksize must be greater than zero")
+        if workers < 1:
+            raise ValueError("workers must be greater than zero")
+        shp = self._get_record_shape(self.recordarray[0])
+        for header in self.recordarray[1:]:
+            if self._get_record_shape(header) != shp:
+                raise ValueError(
+                    "iter_alldata requires data records of equal shape"
+                )
+        if times is None:
+            times = self.times
+        times = np.array(times, dtype=float)
+        ntimes = len(times)
+
+        # time index for every record, or -1 if the time is not requested
+        itim = np.full(len(self.recordarray), -1, dtype=np.int64)
+        if ntimes > 0:
+            sorter = np.argsort(times, kind="stable")
+            totim = self.recordarray["totim"]
+            isort = np.searchsorted(times, totim, sorter=sorter)
+            isort = np.minimum(isort, ntimes - 1)
+            found = times[sorter[isort]] == totim
+            itim[found] = sorter[isort[found]]
+        ilay = self.recordarray["ilay"] - 1
+        if mflay is not None:
+            itim[ilay != mflay] = -1
+
+        def read_chunk(itim0):
+            itim1 = min(itim0 + chunksize, ntimes)
+            irecs = np.where((itim >= itim0) & (itim < itim1))[0]
+            irecs = irecs[np.argsort(self.iposarray[irecs], kind="stable")]
+            if mflay is None:
+                data = np.empty(
+                    (itim1 - itim0, self.nlay) + shp, self.realtype
+                )
+            else:
+                data = np.empty((itim1 - itim0,) + shp, self.realtype)
+            data[:] = np.nan
+            if self._mmap is not None:
+                for irec in irecs:
+                    out = data[itim[irec] - itim0]
+                    if mflay is None:
+                        out = out[ilay[irec]]
+                    out[:] = self._read_record(irec)
+            elif len(irecs) > 0:
+                with open(self.filename, "rb") as f:
+                    for irec in irecs:
+                        out = data[itim[irec] - itim0]
+                        if mflay is None:
+                            out = out[ilay[irec]]
+                        f.seek(int(self.iposarray[irec]), 0)
+                        f.readinto(out)
+            if nodata is not None:
+                data[data == nodata] = np.nan
+            return data
+
+        chunks = iter(range(0, ntimes, chunksize))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = deque()
+            for itim0 in chunks:
+                futures.append(executor.submit(read_chunk, itim0))
+                if len(futures) == workers:
+                    break
+            while futures:
+                data = futures.popleft().result()
+                for itim0 in chunks:
+                    futures.append(executor.submit(read_chunk, itim0))
+                    break
+                yield data
+
+    def to_zarr(
+        self,
+        path,
+        chunksize=10,
+        mflay=None,
+        nodata=-9999,
+        workers=1,
+        complevel=1,
+    ):
+        """
+        Write all of the data in the file to a chunked and compressed
+        directory store, reading one chunk of simulation times at a time.
+
+        The store follows version 2 of the Zarr storage specification, with
+        zlib compressed chunks of chunksize simulation times, and can be
+        opened with zarr (zarr.open(path)) without converting the file.
+
+        Parameters
+        ----------
+        path : str or PathLike
+            Directory of the store.  It is created if it does not exist.
+        chunksize : int
+            Number of simulation times in each chunk. (Default is 10.)
+        mflay : integer
+           MODFLOW zero-based layer number to write.  If None, then all
+           all layers will be included. (Default is None.)
+        nodata : float
+            The nodata value in the data array.  All array values that have
+            the nodata value will be assigned np.nan.  (Default is -9999.)
+        workers : int
+            Number of threads used to read chunks. (Default is 1.)
+        complevel : int
+            zlib compression level, from 0 to 9. (Default is 1.)
+
+        Returns
+        -------
+        path : str
+            Directory of the store.
+
+        See Also
+        --------
+        iter_alldata
+
+        Examples
+        --------
+        >>> import flopy
+        >>> hdobj = flopy.utils.HeadFile('test.hds')
+        >>> hdobj.to_zarr('test.hds.zarr', chunksize=100, workers=4)
+
+        """
+        path = str(path)
+        os.makedirs(path, exist_ok=True)
+        shp = self._get_record_shape(self.recordarray[0])
+        if mflay is None:
+            shp = (int(self.nlay),) + shp
+        shape = (len(self.times),) + shp
+        dtype = np.dtype(self.realtype).newbyteorder("<")
+        zarray = {
+            "zarr_format": 2,
+            "shape": list(shape),
+            "chunks": [chunksize] + list(shp),
+            "dtype": dtype.str,
+            "compressor": {"id": "zlib", "level": complevel},
+            "fill_value": "NaN",
+            "order": "C",
+            "filters": None,
+        }
+        dimensions = ["time", "layer", "row", "col"]
+        if mflay is not None:
+            dimensions.remove("layer")
+        zattrs = {
+            "_ARRAY_DIMENSIONS": dimensions,
+            "text": self.text.decode().strip(),
+            "totim": [float(t) for t in self.times],
+            "kstpkper": [[int(k), int(p)] for k, p in self.get_kstpkper()],
+        }
+        with open(os.path.join(path, ".zarray"), "w") as f:
+            json.dump(zarray, f, indent=4)
+        with open(os.path.join(path, ".zattrs"), "w") as f:
+            json.dump(zattrs, f, indent=4)
+
+        suffix = ".0" * len(shp)
+        for ichunk, data in enumerate(
+            self.iter_alldata(
+                chunksize=chunksize,
+                mflay=mflay,
+                nodata=nodata,
+                workers=workers,
+            )
+        ):
+            # chunks at the end of the array are padded to full size
+            if data.shape[0] < chunksize:
+                pad = np.empty((chunksize,) + shp, dtype=dtype)
+                pad[:] = np.nan
+                pad[: data.shape[0]] = data
+                data = pad
+            chunk = zlib.compress(data.astype(dtype, copy=False), complevel)
+            with open(os.path.join(path, f"{ichunk}{suffix}"), "wb") as f:
+                f.write(chunk)
+        return path
+
+    def as_array(self):
+        """
+        Get a lazily evaluated, read-only array view of all of the data in
+        the file.  Data are only read when the view is indexed, for the
+        selected times, layers, rows, and columns.
+
+        Returns
+        -------
+        data : BinaryArrayView
+            Array-like view of size (ntimes, nlay, nrow, ncol).  Times are
+            in the order of get_times().
+
+        See Also
+        --------
+        BinaryArrayView
+
+        Examples
+        --------
+        >>> import flopy
+        >>> hdobj = flopy.utils.HeadFile('test.hds')
+        >>> heads = hdobj.as_array()
+        >>> transect = heads[100:200, 0, :, 25]
+
+        """
+        shp = self._get_record_shape(self.recordarray[0])
+        for header in self.recordarray[1:]:
+            if self._get_record_shape(header) != shp:
+                raise ValueError(
+                    "as_array requires data records of equal shape"
+                )
+        positions = np.full((len(self.times), self.nlay), -1, dtype=np.int64)
+        positions[
+            self._get_time_indices(), self.recordarray["ilay"] - 1
+        ] = self.iposarray
+        return BinaryArrayView(
+            self.file, positions, shp, self.realtype, mmap=self._mmap
+        )
+
     def _build_index(self):
         """
         Build the recordarray and iposarray, which maps the header information
-        to the position in the binary file.
+        to the position in the binary file.  If index_cache is True the
+        index is loaded from the sidecar index cache when it is current and
+        the cache is written after the file has been indexed.
 
         """
+        if self.index_cache:
+            signature = _get_file_signature(self.filename)
+            if self._read_index_cache():
+                return
+
         header = self._get_header()
         self.nrow = header["nrow"]
         self.ncol = header["ncol"]
@@ -308,16 +1008,40 @@ class BinaryLayerFile(LayerFile):
             s = "Possible error. ncol ({}) * nrow ({}) > 10,000,000 "
             s = s.format(self.ncol, self.nrow)
             warnings.warn(s)
+        self._index_records(0)
+
+        # self.recordarray contains a recordarray of all the headers.
+        self.recordarray = np.array(self.recordarray, dtype=self.header_dtype)
+        self.iposarray = np.array(self.iposarray, dtype=np.int64)
+        if self.recordarray.shape[0] == 0:
+            raise Exception(f"No complete records in {self.filename}")
+        self.nlay = np.max(self.recordarray["ilay"])
+        if self.index_cache:
+            self._write_index_cache(signature)
+        return
+
+    def _index_records(self, ipos):
+        """
+        Append the headers and data positions of the complete records
+        stored from byte position ipos to the end of the file to the
+        recordarray and iposarray lists.  A partially written record at
+        the end of the file, from a model that is still running, is not
+        indexed.
+
+        """
         self.file.seek(0, 2)
         self.totalbytes = self.file.tell()
-        self.file.seek(0, 0)
-        ipos = 0
-        while ipos < self.totalbytes:
+        self.file.seek(ipos, 0)
+        headerbytes = self.header_dtype.itemsize
+        while ipos + headerbytes <= self.totalbytes:
             header = self._get_header()
+            databytes = self.get_databytes(header)
+            if self.file.tell() + databytes > self.totalbytes:
+                break
             self.recordarray.append(header)
             if self.text.upper() not in header["text"]:
                 continue
-            if ipos == 0:
+            if len(self.times) == 0:
                 self.times.append(header["totim"])
                 kstpkper = (header["kstp"], header["kper"])
                 self.kstpkper.append(kstpkper)
@@ -329,15 +1053,137 @@ class BinaryLayerFile(LayerFile):
                     self.kstpkper.append(kstpkper)
             ipos = self.file.tell()
             self.iposarray.append(ipos)
-            databytes = self.get_databytes(header)
             self.file.seek(databytes, 1)
             ipos = self.file.tell()
+        self._index_end = ipos
 
-        # self.recordarray contains a recordarray of all the headers.
-        self.recordarray = np.array(self.recordarray, dtype=self.header_dtype)
-        self.iposarray = np.array(self.iposarray)
-        self.nlay = np.max(self.recordarray["ilay"])
-        return
+    def refresh(self):
+        """
+        Index records that have been appended to the file since it was
+        last indexed, for example by a model that is still running.  The
+        file is not read again from the beginning and a partially written
+        record at the end of the file is ignored until it is complete.
+
+        Returns
+        -------
+        nrecords : int
+            Number of new records that were indexed.
+
+        Examples
+        --------
+        >>> import flopy
+        >>> hdobj = flopy.utils.HeadFile('test.hds')
+        >>> nrecords = hdobj.refresh()
+        >>> times = hdobj.get_times()
+
+        """
+        recordarray, iposarray = self.recordarray, self.iposarray
+        self.recordarray, self.iposarray = [], []
+        self._index_records(self._index_end)
+        nrecords = len(self.recordarray)
+        self.recordarray = np.concatenate(
+            (recordarray, np.array(self.recordarray, dtype=self.header_dtype))
+        )
+        self.iposarray = np.concatenate(
+            (iposarray, np.array(self.iposarray, dtype=np.int64))
+        )
+        if nrecords > 0:
+            self.nlay = np.max(self.recordarray["ilay"])
+            if self._mmap is not None:
+                self._init_mmap()
+        return nrecords
+
+    def follow(self, interval=1.0, timeout=None):
+        """
+        Generator that yields the data for each simulation time in the
+        file, waiting for new simulation times to be appended to the file
+        by a model that is still running.
+
+        Parameters
+        ----------
+        interval : float
+            Number of seconds to wait between checks for new records.
+            (Default is 1.)
+        timeout : float
+            Stop when no new simulation times have been written for timeout
+            seconds.  If None, wait indefinitely. (Default is None.)
+
+        Yields
+        ------
+        kstpkper : tuple of ints
+            A tuple containing the zero-based time step and stress period.
+        totim : float
+            The simulation time.
+        data : numpy array
+            The data returned by get_data for totim.
+
+        Examples
+        --------
+        >>> import flopy
+        >>> hdobj = flopy.utils.HeadFile('test.hds')
+        >>> for kstpkper, totim, head in hdobj.follow(timeout=60.):
+        ...     print(totim, head.max())
+
+        """
+        itime = 0
+        tlast = time.monotonic()
+        while True:
+            # the last time is complete once all of its layers are written
+            ntimes = len(self.times)
+            if ntimes > 0:
+                nlast = np.count_nonzero(
+                    self.recordarray["totim"] == self.times[-1]
+                )
+                if nlast < self.nlay:
+                    ntimes -= 1
+            while itime < ntimes:
+                kstp, kper = self.kstpkper[itime]
+                totim = self.times[itime]
+                yield (kstp - 1, kper - 1), totim, self.get_data(totim=totim)
+                itime += 1
+                tlast = time.monotonic()
+            if timeout is not None and time.monotonic() - tlast >= timeout:
+                return
+            time.sleep(interval)
+            self.refresh()
+
+    def _read_index_cache(self):
+        """
+        Set the index from the sidecar index cache.  Returns True if the
+        cache is current and was loaded.
+
+        """
+        cache = _load_index_cache(
+            self.filename, precision=self.precision, text=self.text
+        )
+        if cache is None or cache.get("index_end") is None:
+            return False
+        self.recordarray = cache["recordarray"]
+        self.iposarray = cache["iposarray"]
+        self.times = list(cache["times"])
+        self.kstpkper = [tuple(kk) for kk in cache["kstpkper"]]
+        self.nrow, self.ncol, self.nlay = cache["shape"]
+        self.totalbytes = int(cache["signature"][0])
+        self._index_end = int(cache["index_end"])
+        return True
+
+    def _write_index_cache(self, signature):
+        """
+        Write the index to the sidecar index cache.
+
+        """
+        _save_index_cache(
+            self.filename,
+            signature,
+            precision=self.precision,
+            text=self.text,
+            recordarray=self.recordarray,
+            iposarray=self.iposarray,
+            times=np.array(self.times, dtype=self.realtype),
+            kstpkper=np.array(self.kstpkper, dtype=np.int32).reshape(-1, 2),
+            shape=np.array([self.nrow, self.ncol, self.nlay]),
+            index_end=self._index_end,
+        )
 
     def get_databytes(self, header):
         """
@@ -405,27 +1251,111 @@ class BinaryLayerFile(LayerFile):
 
         # Initialize result array and put times in first column
         result = self._init_result(nstation)
+        result[:, 1:] = self._get_ts_values(kijlist)
+        return result
 
-        istat = 1
-        for k, i, j in kijlist:
-            ioffset = (i * self.ncol + j) * self.realtype(1).nbytes
-            for irec, header in enumerate(self.recordarray):
-                ilay = (
-                    header["ilay"] - 1
-                )  # change ilay from header to zero-based
-                if ilay != k:
-                    continue
-                ipos = int(self.iposarray[irec])
+    def iter_ts(self, idx, chunksize=100):
+        """
+        Iterate over a time series from the binary file in chunks of
+        simulation times, so that memory use is bounded by chunksize.
 
-                # Calculate offset necessary to reach intended cell
-                self.file.seek(ipos + int(ioffset), 0)
+        Parameters
+        ----------
+        idx : tuple of ints, or a list of a tuple of ints
+            idx can be (layer, row, column) or it can be a list in the form
+            [(layer, row, column), (layer, row, column), ...].  The layer,
+            row, and column values must be zero based.
+        chunksize : int
+            Maximum number of simulation times in each chunk.
+            (Default is 100.)
 
-                # Find the time index and then put value into result in the
-                # correct location.
-                itim = np.where(result[:, 0] == header["totim"])[0]
-                result[itim, istat] = binaryread(self.file, self.realtype)
-            istat += 1
-        return result
+        Yields
+        ------
+        out : numpy array
+            Array has size (nchunk, ncells + 1), where nchunk is at most
+            chunksize.  The first column in the data array will contain
+            time (totim).
+
+        Examples
+        --------
+        >>> import flopy
+        >>> hdobj = flopy.utils.HeadFile('test.hds')
+        >>> for ts in hdobj.iter_ts([(0, 10, 10), (1, 10, 10)]):
+        ...     print(ts[:, 0].min(), ts[:, 1:].max())
+
+        """
+        if chunksize < 1:
+            raise ValueError("chunksize must be greater than zero")
+        kijlist = self._build_kijlist(idx)
+        times = np.array(self.times)
+        ntimes = len(times)
+        for itim0 in range(0, ntimes, chunksize):
+            itim1 = min(itim0 + chunksize, ntimes)
+            result = np.empty(
+                (itim1 - itim0, len(kijlist) + 1), dtype=self.realtype
+            )
+            result[:, 0] = times[itim0:itim1]
+            result[:, 1:] = self._get_ts_values(kijlist, itim0, itim1)
+            yield result
+
+    def _get_ts_values(self, kijlist, itim0=0, itim1=None):
+        """
+        Get the values for a list of (layer, row, column) cells for the
+        simulation times itim0 to itim1.  Cells are grouped by layer and
+        each layer record is read at most once, only spanning the range of
+        the requested cells.
+
+        Returns
+        -------
+        values : numpy array
+            Array has size (itim1 - itim0, ncells).
+
+        """
+        if itim1 is None:
+            itim1 = len(self.times)
+        kij = np.array(kijlist, dtype=np.int64).reshape(-1, 3)
+        values = np.empty((itim1 - itim0, kij.shape[0]), dtype=self.realtype)
+        values[:, :] = np.nan
+        if kij.shape[0] == 0 or itim1 <= itim0:
+            return values
+
+        itim = self._get_time_indices()
+        ilay = self.recordarray["ilay"] - 1
+        nbytes = self.realtype(1).nbytes
+        for k in np.unique(kij[:, 0]):
+            icells = np.where(kij[:, 0] == k)[0]
+            irecs = np.where((ilay == k) & (itim >= itim0) & (itim < itim1))[0]
+            if len(irecs) == 0:
+                continue
+            rows = itim[irecs] - itim0
+            i = kij[icells, 1]
+            j = kij[icells, 2]
+
+            # gather the values directly from the memory-mapped records
+            if self._recordview is not None:
+                values[rows[:, None], icells] = self._recordview[
+                    irecs[:, None], i, j
+                ]
+                continue
+
+            # read the span of the layer record containing all of the cells
+            offsets = i * self.ncol + j
+            n0 = offsets.min()
+            count = offsets.max() - n0 + 1
+            for irec, row in zip(irecs, rows):
+                self.file.seek(int(self.iposarray[irec]) + int(n0) * nbytes, 0)
+                data = binaryread(self.file, self.realtype, shape=(count,))
+                values[row, icells] = data[offsets - n0]
+        return values
+
+    def close(self):
+        """
+        Close the file handle and release the memory map, if any.
+
+        """
+        self._recordview = None
+        self._mmap = None
+        super().close()
 
 
 class HeadFile(BinaryLayerFile):
@@ -442,6 +1372,15 @@ class HeadFile(BinaryLayerFile):
         'auto', 'single' or 'double'.  Default is 'auto'.
     verbose : bool
         Write information to the screen.  Default is False.
+    mmap : bool
+        Memory-map the file instead of reading each record with a seek and
+        read.  Data are returned as read-only views into the file whenever
+        possible.  Default is False.
+    index_cache : bool
+        Load the record index from a sidecar index cache stored next to the
+        file (see get_index_cache_path), instead of reading every header in
+        the file.  The cache is validated using the file size and
+        modification time, and is rebuilt if it is stale.  Default is False.
 
     Attributes
     ----------
@@ -480,7 +1419,14 @@ class HeadFile(BinaryLayerFile):
     """
 
     def __init__(
-        self, filename, text="head", precision="auto", verbose=False, **kwargs
+        self,
+        filename,
+        text="head",
+        precision="auto",
+        verbose=False,
+        mmap=False,
+        index_cache=False,
+        **kwargs,
     ):
         self.text = text.encode()
         if precision == "auto":
@@ -492,7 +1438,14 @@ class HeadFile(BinaryLayerFile):
         self.header_dtype = BinaryHeader.set_dtype(
             bintype="Head", precision=precision
         )
-        super().__init__(filename, precision, verbose, kwargs)
+        super().__init__(
+            filename,
+            precision,
+            verbose,
+            kwargs,
+            mmap=mmap,
+            index_cache=index_cache,
+        )
         return
 
 
@@ -510,6 +1463,15 @@ class UcnFile(BinaryLayerFile):
         'auto', 'single' or 'double'.  Default is 'auto'.
     verbose : bool
         Write information to the screen.  Default is False.
+    mmap : bool
+        Memory-map the file instead of reading each record with a seek and
+        read.  Data are returned as read-only views into the file whenever
+        possible.  Default is False.
+    index_cache : bool
+        Load the record index from a sidecar index cache stored next to the
+        file (see get_index_cache_path), instead of reading every header in
+        the file.  The cache is validated using the file size and
+        modification time, and is rebuilt if it is stale.  Default is False.
 
     Attributes
     ----------
@@ -548,6 +1510,8 @@ class UcnFile(BinaryLayerFile):
         text="concentration",
         precision="auto",
         verbose=False,
+        mmap=False,
+        index_cache=False,
         **kwargs,
     ):
         self.text = text.encode()
@@ -560,7 +1524,14 @@ class UcnFile(BinaryLayerFile):
         self.header_dtype = BinaryHeader.set_dtype(
             bintype="Ucn", precision=precision
         )
-        super().__init__(filename, precision, verbose, kwargs)
+        super().__init__(
+            filename,
+            precision,
+            verbose,
+            kwargs,
+            mmap=mmap,
+            index_cache=index_cache,
+        )
         return
 
 
@@ -580,6 +1551,11 @@ class CellBudgetFile:
         'single' or 'double'.  Default is 'single'.
     verbose : bool
         Write information to the screen.  Default is False.
+    index_cache : bool
+        Load the record index from a sidecar index cache stored next to the
+        file (see get_index_cache_path), instead of reading every header in
+        the file.  The cache is validated using the file size and
+        modification time, and is rebuilt if it is stale.  Default is False.
 
     Attributes
     ----------
@@ -603,10 +1579,18 @@ class CellBudgetFile:
 
     """
 
-    def __init__(self, filename, precision="auto", verbose=False, **kwargs):
+    def __init__(
+        self,
+        filename,
+        precision="auto",
+        verbose=False,
+        index_cache=False,
+        **kwargs,
+    ):
         self.filename = filename
         self.precision = precision
         self.verbose = verbose
+        self.index_cache = index_cache
         self.file = open(self.filename, "rb")
         # Get filesize to ensure this is not an empty file
         self.file.seek(0, 2)
@@ -664,8 +1648,23 @@ class CellBudgetFile:
             args = ",".join(kwargs.keys())
             raise Exception(f"LayerFile error: unrecognized kwargs: {args}")
 
-        if precision == "auto":
-            success = self._set_precision("single")
+        cached = False
+        if index_cache:
+            signature = _get_file_signature(self.filename)
+            cached = self._read_index_cache()
+
+        if cached:
+            success = True
+        elif precision == "auto":
+            # determine the precision from the first records so that the
+            # file is only indexed once, and fall back to trying to index
+            # the file with each precision
+            success = False
+            detected = self._detect_precision()
+            if detected != "unknown":
+                success = self._set_precision(detected)
+            if not success:
+                success = self._set_precision("single")
             if not success:
                 success = self._set_precision("double")
             if not success:
@@ -678,6 +1677,9 @@ class CellBudgetFile:
         else:
             raise Exception(f"Unknown precision specified: {precision}")
 
+        if index_cache and success and not cached:
+            self._write_index_cache(signature)
+
         # set shape for full3D option
         if self.modelgrid is None:
             self.shape = (self.nlay, self.nrow, self.ncol)
@@ -725,6 +1727,84 @@ class CellBudgetFile:
             budget file precision (accepts 'single' or 'double')
         """
         success = True
+        self._set_header_dtypes(precision)
+
+        try:
+            self._build_index()
+        except BudgetIndexError:
+            success = False
+            self.__reset()
+
+        return success
+
+    def _detect_precision(self):
+        """
+        Determine the precision of the budget file from the first record
+        and the header of the second record, without indexing the file.
+
+        Returns
+        -------
+        precision : str
+            'single', 'double' or 'unknown'
+
+        """
+        asciiset = " "
+        for i in range(33, 127):
+            asciiset += chr(i)
+
+        def is_text(values):
+            for text in values:
+                if isinstance(text, bytes):
+                    try:
+                        text = text.decode()
+                    except UnicodeDecodeError:
+                        return False
+                for t in text:
+                    if t.upper() not in asciiset:
+                        return False
+            return True
+
+        self.file.seek(0, 2)
+        totalbytes = self.file.tell()
+        result = "unknown"
+        for precision in ("single", "double"):
+            self._set_header_dtypes(precision)
+            self.file.seek(0, 0)
+            try:
+                header = self._get_header()
+                if not is_text([header["text"], header["modelnam"]]):
+                    continue
+                if header["nlay"] < 0:
+                    times = [header["delt"], header["pertim"], header["totim"]]
+                    if not np.all(np.isfinite(times)) or min(times) < 0:
+                        continue
+                self._skip_record(header)
+            except Exception:
+                continue
+            ipos = self.file.tell()
+            if ipos == totalbytes:
+                result = precision
+                break
+            elif ipos > totalbytes:
+                continue
+
+            # the header of the next record must also be valid
+            header1 = binaryread(self.file, self.header1_dtype, (1,))
+            if header1.shape[0] == 1 and is_text([header1["text"][0]]):
+                result = precision
+                break
+        self.file.seek(0, 0)
+        return result
+
+    def _set_header_dtypes(self, precision="single"):
+        """
+        Set the real type and the header dtypes for a budget precision
+
+        Parameters
+        ----------
+        precision : str
+            budget file precision (accepts 'single' or 'double')
+        """
         h1dt = [
             ("kstp", "i4"),
             ("kper", "i4"),
@@ -762,13 +1842,62 @@ class CellBudgetFile:
         hdt = h1dt + h2dt
         self.header_dtype = np.dtype(hdt)
 
-        try:
-            self._build_index()
-        except BudgetIndexError:
-            success = False
-            self.__reset()
+    def _read_index_cache(self):
+        """
+        Set the precision and index from the sidecar index cache.  Returns
+        True if the cache is current and was loaded.
+
+        """
+        expected = {"dis": self.dis is not None}
+        if self.precision in ("single", "double"):
+            expected["precision"] = self.precision
+        cache = _load_index_cache(self.filename, **expected)
+        if cache is None or cache.get("index_end") is None:
+            return False
+        self._set_header_dtypes(str(cache["precision"]))
+        self.recordarray = cache["recordarray"]
+        self.iposheader = cache["iposheader"]
+        self.iposarray = cache["iposarray"]
+        self.times = list(cache["times"])
+        self.kstpkper = [tuple(kk) for kk in cache["kstpkper"]]
+        self.textlist = cache["textlist"].tolist()
+        self.imethlist = cache["imethlist"].tolist()
+        self.paknamlist = cache["paknamlist"].tolist()
+        self.nrow, self.ncol, self.nlay = cache["shape"]
+        self.nrecords = self.recordarray.shape[0]
+        self.nper = self.recordarray["kper"].max()
+        self.totalbytes = int(cache["signature"][0])
+        self._index_end = int(cache["index_end"])
+        self.recorddict = dict(
+            zip(map(tuple, self.recordarray.tolist()), self.iposarray)
+        )
+        return True
 
-        return success
+    def _write_index_cache(self, signature):
+        """
+        Write the precision and index to the sidecar index cache.
+
+        """
+        if self.realtype == np.float64:
+            precision = "double"
+        else:
+            precision = "single"
+        _save_index_cache(
+            self.filename,
+            signature,
+            precision=precision,
+            dis=self.dis is not None,
+            recordarray=self.recordarray,
+            iposheader=self.iposheader,
+            iposarray=self.iposarray,
+            times=np.array(self.times, dtype=self.realtype),
+            kstpkper=np.array(self.kstpkper, dtype=np.int32).reshape(-1, 2),
+            textlist=np.array(self.textlist, dtype="S16"),
+            imethlist=np.array(self.imethlist, dtype=np.int32),
+            paknamlist=np.array(self.paknamlist, dtype="S16"),
+            shape=np.array([self.nrow, self.ncol, self.nlay]),
+            index_end=self._index_end,
+        )
 
     def _totim_from_kstpkper(self, kstpkper):
         if self.dis is None:
@@ -794,12 +1923,8 @@ class CellBudgetFile:
     def _build_index(self):
         """
         Build the ordered dictionary, which maps the header information
-        to the position in the binary file.
-        """
-        asciiset = " "
-        for i in range(33, 127):
-            asciiset += chr(i)
-
+        to the position in the binary file.
+        """
         # read first record
         header = self._get_header()
         nrow = header["nrow"]
@@ -813,15 +1938,65 @@ class CellBudgetFile:
             self.nrow = nrow
             self.ncol = ncol
             self.nlay = np.abs(header["nlay"])
-        self.file.seek(0, 2)
-        self.totalbytes = self.file.tell()
-        self.file.seek(0, 0)
         self.recorddict = {}
         # read the remaining records
-        ipos = 0
-        while ipos < self.totalbytes:
+        self._index_records(0)
+        if len(self.recordarray) == 0:
+            raise BudgetIndexError("No complete records in budget file")
+
+        # convert to numpy arrays
+        self.recordarray = np.array(self.recordarray, dtype=self.header_dtype)
+        self.iposheader = np.array(self.iposheader, dtype=np.int64)
+        self.iposarray = np.array(self.iposarray, dtype=np.int64)
+        self.nper = self.recordarray["kper"].max()
+        return
+
+    def _index_records(self, ipos):
+        """
+        Append the headers and positions of the complete records stored
+        from byte position ipos to the end of the file to the recordarray,
+        iposheader and iposarray lists.  A partially written record at the
+        end of the file, from a model that is still running, is not indexed.
+
+        """
+        asciiset = " "
+        for i in range(33, 127):
+            asciiset += chr(i)
+
+        self.file.seek(0, 2)
+        self.totalbytes = self.file.tell()
+        self.file.seek(ipos, 0)
+        while ipos + self.header1_dtype.itemsize <= self.totalbytes:
+            try:
+                header = self._get_header()
+            except (IndexError, ValueError):
+                # partially written header
+                break
+            iposdata = self.file.tell()
+            if header["text"] not in self.textlist:
+                # check the precision of the file using text records
+                try:
+                    tlist = [header["text"], header["modelnam"]]
+                    for text in tlist:
+                        if isinstance(text, bytes):
+                            text = text.decode()
+                        for t in text:
+                            if t.upper() not in asciiset:
+                                raise Exception()
+
+                except:
+                    raise BudgetIndexError("Improper precision")
+
+            # skip over the data to the next record, and stop if the data
+            # have not been completely written
+            try:
+                self._skip_record(header)
+            except IndexError:
+                break
+            if self.file.tell() > self.totalbytes:
+                break
+
             self.iposheader.append(ipos)
-            header = self._get_header()
             self.nrecords += 1
             totim = header["totim"]
             if totim == 0:
@@ -835,23 +2010,10 @@ class CellBudgetFile:
             if kstpkper not in self.kstpkper:
                 self.kstpkper.append(kstpkper)
             if header["text"] not in self.textlist:
-                # check the precision of the file using text records
-                try:
-                    tlist = [header["text"], header["modelnam"]]
-                    for text in tlist:
-                        if isinstance(text, bytes):
-                            text = text.decode()
-                        for t in text:
-                            if t.upper() not in asciiset:
-                                raise Exception()
-
-                except:
-                    raise BudgetIndexError("Improper precision")
                 self.textlist.append(header["text"])
                 self.imethlist.append(header["imeth"])
             if header["paknam"] not in self.paknamlist:
                 self.paknamlist.append(header["paknam"])
-            ipos = self.file.tell()
 
             if self.verbose:
                 for itxt in [
@@ -874,7 +2036,7 @@ class CellBudgetFile:
                     if isinstance(s, bytes):
                         s = s.decode()
                     print(f"{itxt}: {s}")
-                print("file position: ", ipos)
+                print("file position: ", iposdata)
                 if (
                     int(header["imeth"]) != 5
                     and int(header["imeth"]) != 6
@@ -895,22 +2057,111 @@ class CellBudgetFile:
             # store record and byte position mapping
             self.recorddict[
                 tuple(header)
-            ] = ipos  # store the position right after header2
+            ] = iposdata  # store the position right after header2
             self.recordarray.append(header)
             self.iposarray.append(
-                ipos
+                iposdata
             )  # store the position right after header2
 
-            # skip over the data to the next record and set ipos
-            self._skip_record(header)
+            # set ipos to the start of the next record
             ipos = self.file.tell()
+        self._index_end = ipos
 
-        # convert to numpy arrays
-        self.recordarray = np.array(self.recordarray, dtype=self.header_dtype)
-        self.iposheader = np.array(self.iposheader, dtype=np.int64)
-        self.iposarray = np.array(self.iposarray, dtype=np.int64)
-        self.nper = self.recordarray["kper"].max()
-        return
+    def refresh(self):
+        """
+        Index records that have been appended to the file since it was
+        last indexed, for example by a model that is still running.  The
+        file is not read again from the beginning and a partially written
+        record at the end of the file is ignored until it is complete.
+
+        Returns
+        -------
+        nrecords : int
+            Number of new records that were indexed.
+
+        Examples
+        --------
+        >>> import flopy
+        >>> cbb = flopy.utils.CellBudgetFile('mymodel.cbb')
+        >>> nrecords = cbb.refresh()
+        >>> times = cbb.get_times()
+
+        """
+        recordarray = self.recordarray
+        iposheader = self.iposheader
+        iposarray = self.iposarray
+        self.recordarray, self.iposheader, self.iposarray = [], [], []
+        self._index_records(self._index_end)
+        nrecords = len(self.recordarray)
+        self.recordarray = np.concatenate(
+            (recordarray, np.array(self.recordarray, dtype=self.header_dtype))
+        )
+        self.iposheader = np.concatenate(
+            (iposheader, np.array(self.iposheader, dtype=np.int64))
+        )
+        self.iposarray = np.concatenate(
+            (iposarray, np.array(self.iposarray, dtype=np.int64))
+        )
+        if nrecords > 0:
+            self.nper = self.recordarray["kper"].max()
+        return nrecords
+
+    def follow(self, text=None, interval=1.0, timeout=None, full3D=False):
+        """
+        Generator that yields each record in the file, waiting for new
+        records to be appended to the file by a model that is still running.
+
+        Parameters
+        ----------
+        text : str
+            The text identifier for the records to return.  Examples include
+            'RIVER LEAKAGE', 'STORAGE', 'FLOW RIGHT FACE', etc.  If None,
+            all records are returned. (Default is None.)
+        interval : float
+            Number of seconds to wait between checks for new records.
+            (Default is 1.)
+        timeout : float
+            Stop when no new records have been written for timeout seconds.
+            If None, wait indefinitely. (Default is None.)
+        full3D : boolean
+            If true, then return the record as a three dimensional numpy
+            array, even for those list-style records written as part of a
+            'COMPACT BUDGET' MODFLOW budget file.  (Default is False.)
+
+        Yields
+        ------
+        kstpkper : tuple of ints
+            A tuple containing the zero-based time step and stress period.
+        totim : float
+            The simulation time.
+        record : a single data record
+            The record returned by get_record.
+
+        Examples
+        --------
+        >>> import flopy
+        >>> cbb = flopy.utils.CellBudgetFile('mymodel.cbb')
+        >>> for kstpkper, totim, q in cbb.follow('STORAGE', timeout=60.):
+        ...     print(totim, q.sum())
+
+        """
+        if isinstance(text, bytes):
+            text = text.decode()
+        irec = 0
+        tlast = time.monotonic()
+        while True:
+            while irec < self.recordarray.shape[0]:
+                header = self.recordarray[irec]
+                if text is None or text.upper() in header["text"].decode():
+                    kstpkper = (header["kstp"] - 1, header["kper"] - 1)
+                    record = self.get_record(irec, full3D=full3D)
+                    yield kstpkper, header["totim"], record
+                irec += 1
+                tlast = time.monotonic()
+            if timeout is not None and time.monotonic() - tlast >= timeout:
+                return
+            time.sleep(interval)
+            self.refresh()
 
     def _skip_record(self, header):
         """
@@ -1255,6 +2506,265 @@ class CellBudgetFile:
         Examples
         --------
 
+        """
+        select_indices = self._get_select_indices(
+            idx=idx, kstpkper=kstpkper, totim=totim, text=text, paknam=paknam
+        )
+
+        # build and return the record list
+        recordlist = []
+        for idx in select_indices:
+            rec = self.get_record(idx, full3D=full3D)
+            recordlist.append(rec)
+
+        return recordlist
+
+    def get_alldata(
+        self,
+        idx=None,
+        kstpkper=None,
+        totim=None,
+        text=None,
+        paknam=None,
+        full3D=False,
+    ):
+        """
+        Get data for all selected records from the binary budget file as a
+        single stacked array, instead of a list of records.
+
+        Parameters
+        ----------
+        idx : int or list
+            The zero-based record number.  The first record is record 0.
+        kstpkper : tuple of ints
+            A tuple containing the time step and stress period (kstp, kper).
+            The kstp and kper values are zero based.
+        totim : float
+            The simulation time.
+        text : str
+            The text identifier for the record.  Examples include
+            'RIVER LEAKAGE', 'STORAGE', 'FLOW RIGHT FACE', etc.
+        paknam : str
+            The package name for the record.
+        full3D : boolean
+            If true, then list-style records are returned as a numpy masked
+            array of size (ntimes, nlay, nrow, ncol).  (Default is False.)
+
+        Returns
+        ----------
+        data : numpy.ndarray
+            For full grid records (imeth 0, 1, and 4) an array of size
+            (ntimes, nlay, nrow, ncol), or (ntimes, nrow, ncol) for imeth 4.
+            For list-style records (imeth 2, 5, and 6) a numpy recarray with
+            the entries of all selected records, with an additional leading
+            "itim" field containing the zero-based position of the record in
+            the selection.  For imeth 3 records, and for list-style records if
+            full3D is True, a numpy masked array of size
+            (ntimes, nlay, nrow, ncol).
+
+        See Also
+        --------
+        get_data
+
+        Notes
+        -----
+        All selected records must have the same imeth value and shape,
+        which is the case when selecting records using text (and paknam).
+        Records are read in order of their position in the file, into a
+        preallocated array.
+
+        Examples
+        --------
+
+        >>> import flopy
+        >>> cbb = flopy.utils.CellBudgetFile('mymodel.cbb')
+        >>> flowja = cbb.get_alldata(text='FLOW-JA-FACE')
+        >>> wel = cbb.get_alldata(text='WEL')
+        >>> wel[wel['itim'] == 0]
+
+        """
+        select_indices = np.atleast_1d(
+            np.asarray(
+                self._get_select_indices(
+                    idx=idx,
+                    kstpkper=kstpkper,
+                    totim=totim,
+                    text=text,
+                    paknam=paknam,
+                ),
+                dtype=int,
+            )
+        )
+        if len(select_indices) == 0:
+            raise ValueError("no records match the selection")
+
+        headers = self.recordarray[select_indices]
+        imeth = np.unique(headers["imeth"])
+        if len(imeth) > 1:
+            raise ValueError(
+                "selected records have different imeth values: "
+                f"{imeth.tolist()}"
+            )
+        imeth = imeth[0]
+        nlay = np.abs(headers["nlay"])
+        nrow = headers["nrow"]
+        ncol = headers["ncol"]
+        if (
+            np.any(nlay != nlay[0])
+            or np.any(nrow != nrow[0])
+            or np.any(ncol != ncol[0])
+        ):
+            raise ValueError("selected records have different shapes")
+        shape = (nlay[0], nrow[0], ncol[0])
+        ntimes = len(select_indices)
+
+        # visit records in order of position in the file
+        order = np.argsort(self.iposarray[select_indices], kind="stable")
+        positions = self.iposarray[select_indices][order]
+
+        if imeth in (0, 1, 4):
+            if imeth == 4:
+                shape = shape[1:]
+            data = np.empty((ntimes,) + shape, dtype=self.realtype)
+            for itim, ipos in zip(order, positions):
+                self.file.seek(ipos, 0)
+                self.file.readinto(data[itim])
+            return data
+
+        elif imeth == 3:
+            data = np.ma.empty((ntimes,) + self.shape, dtype=np.float32)
+            for itim in range(ntimes):
+                data[itim] = self.get_record(select_indices[itim], full3D=True)
+            return data
+
+        elif imeth in (2, 5, 6):
+            # read the list headers, then each list into one array
+            dtype = None
+            nlists = np.empty(ntimes, dtype=np.int64)
+            datapos = np.empty(ntimes, dtype=np.int64)
+            for itim, ipos in zip(order, positions):
+                self.file.seek(ipos, 0)
+                recdtype, nlists[itim] = self._read_list_header(imeth)
+                if dtype is None:
+                    dtype = recdtype
+                elif recdtype != dtype:
+                    raise ValueError(
+                        "selected records have different auxiliary variables"
+                    )
+                datapos[itim] = self.file.tell()
+            offsets = np.zeros(ntimes + 1, dtype=np.int64)
+            np.cumsum(nlists, out=offsets[1:])
+            values = np.empty(offsets[-1], dtype=dtype)
+            for itim in order:
+                if nlists[itim] > 0:
+                    self.file.seek(datapos[itim], 0)
+                    self.file.readinto(
+                        values[offsets[itim] : offsets[itim + 1]]
+                    )
+            itims = np.repeat(np.arange(ntimes, dtype=np.int32), nlists)
+
+            if full3D:
+                q = np.zeros((ntimes, self.nnodes), dtype=np.float32)
+                nodes = values["node"] - 1
+                np.add.at(q, (itims, nodes), values["q"])
+                mask = np.ones((ntimes, self.nnodes), dtype=bool)
+                mask[itims, nodes] = False
+                return np.ma.masked_array(q, mask=mask).reshape(
+                    (ntimes,) + self.shape
+                )
+
+            data = np.empty(
+                len(values), dtype=[("itim", np.int32)] + dtype.descr
+            )
+            data["itim"] = itims
+            for name in dtype.names:
+                data[name] = values[name]
+            return data.view(np.recarray)
+
+        else:
+            raise ValueError(f"invalid imeth value - {imeth}")
+
+    def as_array(self, text, paknam=None):
+        """
+        Get a lazily evaluated, read-only array view of a full grid budget
+        term for all time steps.  Data are only read when the view is
+        indexed, for the selected time steps, layers, rows, and columns.
+
+        Parameters
+        ----------
+        text : str
+            The text identifier for the record.  Examples include
+            'STORAGE', 'FLOW RIGHT FACE', 'FLOW-JA-FACE', etc.
+        paknam : str
+            The package name for the record.
+
+        Returns
+        -------
+        data : BinaryArrayView
+            Array-like view of size (ntimes, nlay, nrow, ncol).  Time steps
+            are in the order of get_kstpkper().  If there are several
+            records for text in a time step, the first one is used.
+
+        See Also
+        --------
+        BinaryArrayView
+        get_alldata
+
+        Notes
+        -----
+        Only full grid records (imeth 0 and 1) can be viewed lazily.  Use
+        get_alldata for list-style records.
+
+        Examples
+        --------
+        >>> import flopy
+        >>> cbb = flopy.utils.CellBudgetFile('mymodel.cbb')
+        >>> frf = cbb.as_array(text='FLOW RIGHT FACE')
+        >>> transect = frf[:, 0, 10, :]
+
+        """
+        if text is None:
+            raise TypeError("as_array() missing 1 required argument: 'text'")
+        select_indices = self._get_select_indices(text=text, paknam=paknam)
+        if len(select_indices) == 0:
+            raise ValueError("no records match the selection")
+        headers = self.recordarray[select_indices]
+        if not np.all(np.isin(headers["imeth"], (0, 1))):
+            raise ValueError(
+                "as_array only supports full grid records (imeth 0 and 1), "
+                "use get_alldata for list-style records"
+            )
+        nlay = np.abs(headers["nlay"])
+        nrow = headers["nrow"]
+        ncol = headers["ncol"]
+        if (
+            np.any(nlay != nlay[0])
+            or np.any(nrow != nrow[0])
+            or np.any(ncol != ncol[0])
+        ):
+            raise ValueError("selected records have different shapes")
+        nlay, nrow, ncol = int(nlay[0]), int(nrow[0]), int(ncol[0])
+
+        kkindex = {kk: itim for itim, kk in enumerate(self.kstpkper)}
+        layerbytes = nrow * ncol * self.realtype(1).nbytes
+        positions = np.full((len(self.kstpkper), nlay), -1, dtype=np.int64)
+        # reversed, so that the first record of a time step is used
+        for irec in select_indices[::-1]:
+            header = self.recordarray[irec]
+            itim = kkindex[(header["kstp"], header["kper"])]
+            positions[itim] = self.iposarray[irec] + layerbytes * np.arange(
+                nlay
+            )
+        return BinaryArrayView(
+            self.file, positions, (nrow, ncol), self.realtype
+        )
+
+    def _get_select_indices(
+        self, idx=None, kstpkper=None, totim=None, text=None, paknam=None
+    ):
+        """
+        Get the record indices selected by get_data() style arguments.
+
         """
         # trap for totim error
         if totim is not None:
@@ -1341,15 +2851,9 @@ class CellBudgetFile:
                 "'idx', or 'text'"
             )
 
-        # build and return the record list
         if isinstance(select_indices, tuple):
             select_indices = select_indices[0]
-        recordlist = []
-        for idx in select_indices:
-            rec = self.get_record(idx, full3D=full3D)
-            recordlist.append(rec)
-
-        return recordlist
+        return select_indices
 
     def get_ts(self, idx, text=None, times=None):
         """
@@ -1417,6 +2921,13 @@ class CellBudgetFile:
         for idx, t in enumerate(timesint):
             result[idx, 0] = t
 
+        # gather list-style records for all time steps at once
+        select_indices = self.get_indices(text)
+        imeth = np.unique(self.recordarray["imeth"][select_indices])
+        if len(imeth) == 1 and imeth[0] in (2, 5, 6):
+            result[:, 1:] = self._get_ts_list(kijlist, select_indices)
+            return result
+
         for itim, k in enumerate(kk):
             try:
                 v = self.get_data(kstpkper=k, text=text, full3D=True)
@@ -1438,20 +2949,7 @@ class CellBudgetFile:
                         )
                         raise AssertionError(s)
 
-                    if self.modelgrid.grid_type == "structured":
-                        ndx = [
-                            lrc[0]
-                            * (self.modelgrid.nrow * self.modelgrid.ncol)
-                            + lrc[1] * self.modelgrid.ncol
-                            + (lrc[2] + 1)
-                            for lrc in kijlist
-                        ]
-                    else:
-                        ndx = [
-                            lrc[0] * self.modelgrid.ncpl + (lrc[-1] + 1)
-                            for lrc in kijlist
-                        ]
-
+                    ndx = self._get_nodes(kijlist)
                     for vv in v:
                         field = vv.dtype.names[2]
                         dix = np.where(np.isin(vv["node"], ndx))[0]
@@ -1460,6 +2958,61 @@ class CellBudgetFile:
 
         return result
 
+    def _get_nodes(self, kijlist):
+        """
+        Get the one-based node numbers of the cells in kijlist, as used in
+        list-style budget records.
+
+        """
+        kij = np.array(kijlist, dtype=np.int64).reshape(-1, 3)
+        if self.modelgrid is None:
+            nrow, ncol = self.nrow, self.ncol
+        elif self.modelgrid.grid_type == "structured":
+            nrow, ncol = self.modelgrid.nrow, self.modelgrid.ncol
+        else:
+            return kij[:, 0] * self.modelgrid.ncpl + kij[:, -1] + 1
+        return kij[:, 0] * nrow * ncol + kij[:, 1] * ncol + kij[:, 2] + 1
+
+    def _get_ts_list(self, kijlist, select_indices):
+        """
+        Get time series values for the cells in kijlist from list-style
+        (imeth 2, 5, or 6) records, as an array of size (ntimes, ncells).
+
+        The list entries of all records are read with get_alldata and
+        matched to the requested cells with a single sorted node lookup.
+        Flows for cells listed more than once in a record are summed, and
+        cells that are not in the list of a time step are set to nan.
+
+        """
+        # use the first record of each time step, as get_data(full3D=True)
+        kkindex = {kk: itim for itim, kk in enumerate(self.kstpkper)}
+        header = self.recordarray[select_indices]
+        rows = np.array(
+            [
+                kkindex[(kstp, kper)]
+                for kstp, kper in zip(header["kstp"], header["kper"])
+            ],
+            dtype=np.int64,
+        )
+        rows, ifirst = np.unique(rows, return_index=True)
+        data = self.get_alldata(idx=select_indices[ifirst].tolist())
+        datarows = rows[data["itim"]]
+
+        # node-to-column lookup for the requested cells
+        nodes = self._get_nodes(kijlist)
+        unodes, inverse = np.unique(nodes, return_inverse=True)
+        pos = np.searchsorted(unodes, data["node"])
+        pos = np.minimum(pos, len(unodes) - 1)
+        found = unodes[pos] == data["node"]
+        datarows, pos = datarows[found], pos[found]
+
+        values = np.zeros((len(self.kstpkper), len(unodes)), self.realtype)
+        np.add.at(values, (datarows, pos), data["q"][found])
+        present = np.zeros(values.shape, dtype=bool)
+        present[datarows, pos] = True
+        values[~present] = np.nan
+        return values[:, inverse.ravel()]
+
     def _build_kijlist(self, idx):
         if isinstance(idx, list):
             kijlist = idx
@@ -1571,8 +3124,7 @@ class CellBudgetFile:
 
         # imeth 2
         elif imeth == 2:
-            nlist = binaryread(self.file, np.int32)[0]
-            dtype = np.dtype([("node", np.int32), ("q", self.realtype)])
+            dtype, nlist = self._read_list_header(imeth)
             if self.verbose:
                 if full3D:
                     s += (
@@ -1627,16 +3179,8 @@ class CellBudgetFile:
 
         # imeth 5
         elif imeth == 5:
-            nauxp1 = binaryread(self.file, np.int32)[0]
-            naux = nauxp1 - 1
-            l = [("node", np.int32), ("q", self.realtype)]
-            for i in range(naux):
-                auxname = binaryread(self.file, str, charlen=16)
-                if not isinstance(auxname, str):
-                    auxname = auxname.decode()
-                l.append((auxname, self.realtype))
-            dtype = np.dtype(l)
-            nlist = binaryread(self.file, np.int32)[0]
+            dtype, nlist = self._read_list_header(imeth)
+            naux = len(dtype) - 2
             data = binaryread(self.file, dtype, shape=(nlist,))
             if full3D:
                 if self.verbose:
@@ -1652,16 +3196,7 @@ class CellBudgetFile:
         # imeth 6
         elif imeth == 6:
             # read rest of list data
-            nauxp1 = binaryread(self.file, np.int32)[0]
-            naux = nauxp1 - 1
-            l = [("node", np.int32), ("node2", np.int32), ("q", self.realtype)]
-            for i in range(naux):
-                auxname = binaryread(self.file, str, charlen=16)
-                if not isinstance(auxname, str):
-                    auxname = auxname.decode()
-                l.append((auxname.strip(), self.realtype))
-            dtype = np.dtype(l)
-            nlist = binaryread(self.file, np.int32)[0]
+            dtype, nlist = self._read_list_header(imeth)
             data = binaryread(self.file, dtype, shape=(nlist,))
             if self.verbose:
                 if full3D:
@@ -1683,6 +3218,48 @@ class CellBudgetFile:
         # should not reach this point
         return
 
+    def _read_list_header(self, imeth):
+        """
+        Read the auxiliary variable names and list length of a list-style
+        (imeth 2, 5, or 6) record, starting from the current file position.
+
+        Parameters
+        ----------
+        imeth : int
+            The imeth value of the record.
+
+        Returns
+        -------
+        dtype : numpy.dtype
+            The structured dtype of the list entries.
+        nlist : int
+            The number of list entries.
+
+        """
+        if imeth == 2:
+            l = [("node", np.int32), ("q", self.realtype)]
+        else:
+            nauxp1 = binaryread(self.file, np.int32)[0]
+            naux = nauxp1 - 1
+            if imeth == 5:
+                l = [("node", np.int32), ("q", self.realtype)]
+            else:
+                l = [
+                    ("node", np.int32),
+                    ("node2", np.int32),
+                    ("q", self.realtype),
+                ]
+            for i in range(naux):
+                auxname = binaryread(self.file, str, charlen=16)
+                if not isinstance(auxname, str):
+                    auxname = auxname.decode()
+                if imeth == 6:
+                    auxname = auxname.strip()
+                l.append((auxname, self.realtype))
+        dtype = np.dtype(l)
+        nlist = int(binaryread(self.file, np.int32)[0])
+        return dtype, nlist
+
     def __create3D(self, data):
         """
         Convert a dictionary of {node: q, ...} into a numpy masked array.
@@ -1835,6 +3412,15 @@ class HeadUFile(BinaryLayerFile):
         'auto', 'single' or 'double'.  Default is 'auto'.
     verbose : bool
         Write information to the screen.  Default is False.
+    mmap : bool
+        Memory-map the file instead of reading each record with a seek and
+        read.  Data are returned as read-only views into the file whenever
+        possible.  Default is False.
+    index_cache : bool
+        Load the record index from a sidecar index cache stored next to the
+        file (see get_index_cache_path), instead of reading every header in
+        the file.  The cache is validated using the file size and
+        modification time, and is rebuilt if it is stale.  Default is False.
 
     Attributes
     ----------
@@ -1877,7 +3463,14 @@ class HeadUFile(BinaryLayerFile):
     """
 
     def __init__(
-        self, filename, text="headu", precision="auto", verbose=False, **kwargs
+        self,
+        filename,
+        text="headu",
+        precision="auto",
+        verbose=False,
+        mmap=False,
+        index_cache=False,
+        **kwargs,
     ):
         """
         Class constructor
@@ -1892,7 +3485,14 @@ class HeadUFile(BinaryLayerFile):
         self.header_dtype = BinaryHeader.set_dtype(
             bintype="Head", precision=precision
         )
-        super().__init__(filename, precision, verbose, kwargs)
+        super().__init__(
+            filename,
+            precision,
+            verbose,
+            kwargs,
+            mmap=mmap,
+            index_cache=index_cache,
+        )
 
     def _get_data_array(self, totim=0.0):
         """
@@ -1914,15 +3514,18 @@ class HeadUFile(BinaryLayerFile):
         for idx in keyindices:
             ipos = self.iposarray[idx]
             ilay = self.recordarray["ilay"][idx]
-            nstrt = self.recordarray["ncol"][idx]
-            nend = self.recordarray["nrow"][idx]
-            npl = nend - nstrt + 1
             if self.verbose:
                 print(f"Byte position in file: {ipos} for layer {ilay}")
-            self.file.seek(ipos, 0)
-            data[ilay - 1] = binaryread(self.file, self.realtype, shape=(npl,))
+            data[ilay - 1] = self._read_record(idx)
         return data
 
+    def _get_record_shape(self, header):
+        """
+        Return the shape of the data array that follows a header.
+
+        """
+        return (int(header["nrow"]) - int(header["ncol"]) + 1,)
+
     def get_databytes(self, header):
         """
 
@@ -1,5 +1,6 @@
 import os
 import shlex
+import threading
 
 import numpy as np
 
@@ -84,6 +85,31 @@ class DatumUtil:
         return False
 
 
+class _DelimiterState(threading.local):
+    delimiter_used = None
+    line_num = 0
+    consistent_delim = False
+
+
+class _DelimiterStateAttribute:
+    """
+    Read-only class and instance attribute of PyListUtil that returns the
+    value of the same attribute from the delimiter state of this thread.
+
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if objtype is None:
+            objtype = type(obj)
+        return getattr(objtype.delimiter_state, self.name)
+
+    def __set__(self, obj, value):
+        raise AttributeError(f"can't set attribute {self.name}")
+
+
 class PyListUtil:
     """
     Class contains miscellaneous methods to work with and compare python lists
@@ -144,9 +170,12 @@ class PyListUtil:
     }
     quote_list = {"'", '"'}
     delimiter_list = {",": 1}
-    delimiter_used = None
-    line_num = 0
-    consistent_delim = False
+    # delimiter detection state is kept per thread so that files can be
+    # split from several threads at once
+    delimiter_state = _DelimiterState()
+    delimiter_used = _DelimiterStateAttribute()
+    line_num = _DelimiterStateAttribute()
+    consistent_delim = _DelimiterStateAttribute()
 
     def __init__(self, path=None, max_error=0.01):
         self.max_error = max_error
@@ -283,25 +312,24 @@ class PyListUtil:
 
     @staticmethod
     def reset_delimiter_used():
-        PyListUtil.delimiter_used = None
-        PyListUtil.line_num = 0
-        PyListUtil.consistent_delim = True
+        state = PyListUtil.delimiter_state
+        state.delimiter_used = None
+        state.line_num = 0
+        state.consistent_delim = True
 
     @staticmethod
     def split_data_line(line, external_file=False, delimiter_conf_length=15):
-        if (
-            PyListUtil.line_num > delimiter_conf_length
-            and PyListUtil.consistent_delim
-        ):
+        state = PyListUtil.delimiter_state
+        if state.line_num > delimiter_conf_length and state.consistent_delim:
             # consistent delimiter has been found.  continue using that
             # delimiter without doing further checks
-            if PyListUtil.delimiter_used is None:
+            if state.delimiter_used is None:
                 comment_split = line.split("#", 1)
                 clean_line = comment_split[0].strip().split()
             else:
                 comment_split = line.split("#", 1)
                 clean_line = (
-                    comment_split[0].strip().split(PyListUtil.delimiter_used)
+                    comment_split[0].strip().split(state.delimiter_used)
                 )
                 if len(comment_split) > 1:
                     clean_line.append("#")
@@ -341,11 +369,11 @@ class PyListUtil:
 
             if max_split_type is not None:
                 clean_line = max_split_list
-                if PyListUtil.line_num == 0:
-                    PyListUtil.delimiter_used = max_split_type
-                elif PyListUtil.delimiter_used != max_split_type:
-                    PyListUtil.consistent_delim = False
-            PyListUtil.line_num += 1
+                if state.line_num == 0:
+                    state.delimiter_used = max_split_type
+                elif state.delimiter_used != max_split_type:
+                    state.consistent_delim = False
+            state.line_num += 1
 
         arr_fixed_line = []
         index = 0
@@ -1,8 +1,10 @@
 """
 Module for input/output utilities
 """
+import io
 import os
 import sys
+import warnings
 
 import numpy as np
 
@@ -417,6 +419,7 @@ def ulstrd(f, nlist, ra, model, sfac_columns, ext_unit_dict):
     sfac = 1.0
     binary = False
     ncol = len(ra.dtype.names)
+    numeric = all(ra.dtype[name].kind in "iuf" for name in ra.dtype.names)
     line_list = line_parse(line)
     close_the_file = False
     file_handle = f
@@ -478,6 +481,10 @@ def ulstrd(f, nlist, ra, model, sfac_columns, ext_unit_dict):
         ra = np.array(d, dtype=ra.dtype)
         ra = ra.view(np.recarray)
 
+    # read all free format rows of numbers at once
+    elif model.free_format_input and nlist > 0 and numeric:
+        _read_free_rows(file_handle, line, nlist, ra)
+
     # else, read ascii
     else:
 
@@ -514,6 +521,55 @@ def ulstrd(f, nlist, ra, model, sfac_columns, ext_unit_dict):
     return ra
 
 
+def _read_free_rows(f, line, nlist, ra):
+    """
+    Read nlist free format rows into ra with a single call to
+    np.loadtxt. Rows that np.loadtxt does not read the same way as
+    line_parse (blank rows, rows with missing values, etc.) are
+    read one at a time instead.
+
+    Parameters
+    ----------
+    f : file handle
+        file handle positioned after the first row
+    line : str
+        the first row, which has already been read
+    nlist : int
+        number of rows to read
+    ra : np.recarray
+        record array with numeric fields that is filled with the rows
+
+    """
+    ncol = len(ra.dtype.names)
+    lines = [line]
+    lines.extend(f.readline() for _ in range(nlist - 1))
+    text = "".join(lines).replace(",", " ")
+    comments = [flag for flag in (";", "#", "!!") if flag in text]
+    data = None
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            data = np.loadtxt(
+                io.StringIO(text),
+                dtype=ra.dtype,
+                comments=comments or None,
+                usecols=range(ncol),
+                ndmin=1,
+            )
+    except (ValueError, Warning):
+        pass
+    if data is not None and data.shape[0] == nlist:
+        ra[:nlist] = data
+        return
+    for ii, line in enumerate(lines):
+        t = line_parse(line)
+        if len(t) < ncol:
+            t = t + (ncol - len(t)) * [0.0]
+        else:
+            t = t[:ncol]
+        ra[ii] = tuple(t)
+
+
 def get_ts_sp(line):
     """
     Reader method to get time step and stress period numbers from
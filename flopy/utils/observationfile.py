@@ -1,4 +1,6 @@
 import io
+import itertools
+import os
 
 import numpy as np
 
@@ -10,6 +12,7 @@ from ..utils.utils_def import FlopyBinaryData
 class ObsFiles(FlopyBinaryData):
     def __init__(self):
         super().__init__()
+        self.mmap = False
         return
 
     def get_times(self):
@@ -22,7 +25,7 @@ class ObsFiles(FlopyBinaryData):
             List contains unique simulation times (totim) in binary file.
 
         """
-        return self.data["totim"].reshape(self.get_ntimes()).tolist()
+        return self._get_selection(["totim"])["totim"].tolist()
 
     def get_ntimes(self):
         """
@@ -34,7 +37,7 @@ class ObsFiles(FlopyBinaryData):
             The number of simulation times (totim) in binary file.
 
         """
-        return self.data["totim"].shape[0]
+        return self._get_selection(["totim"]).shape[0]
 
     def get_nobs(self):
         """
@@ -61,7 +64,7 @@ class ObsFiles(FlopyBinaryData):
             included in the list of observation names.
 
         """
-        return list(self.data.dtype.names[1:])
+        return list(self.dtype.names[1:])
 
     def get_data(self, idx=None, obsname=None, totim=None):
         """
@@ -73,9 +76,9 @@ class ObsFiles(FlopyBinaryData):
             The zero-based record number.  The first record is record 0.
             If idx is None and totim are None, data for all simulation times
             are returned. (default is None)
-        obsname : string
-            The name of the observation to return. If obsname is None, all
-            observation data are returned. (default is None)
+        obsname : string or list of strings
+            The name(s) of the observation(s) to return. If obsname is None,
+            all observation data are returned. (default is None)
         totim : float
             The simulation time to return. If idx is None and totim are None,
             data for all simulation times are returned. (default is None)
@@ -101,9 +104,9 @@ class ObsFiles(FlopyBinaryData):
 
         """
         i0 = 0
-        i1 = self.data.shape[0]
+        i1 = self.get_ntimes()
         if totim is not None:
-            idx = np.where(self.data["totim"] == totim)[0][0]
+            idx = np.where(np.array(self.get_times()) == totim)[0][0]
             i0 = idx
             i1 = idx + 1
         elif idx is not None:
@@ -114,15 +117,15 @@ class ObsFiles(FlopyBinaryData):
         if obsname is None:
             obsname = self.get_obsnames()
         else:
-            if obsname is not None:
-                if obsname not in self.data.dtype.names:
-                    obsname = None
-                else:
-                    if not isinstance(obsname, list):
-                        obsname = [obsname]
+            if not isinstance(obsname, list):
+                obsname = [obsname]
+            if any(name not in self.dtype.names for name in obsname):
+                obsname = None
+            else:
+                obsname = list(obsname)
         if obsname is not None:
             obsname.insert(0, "totim")
-            r = get_selection(self.data, obsname)[i0:i1]
+            r = self._get_selection(obsname)[i0:i1]
         return r
 
     def get_dataframe(
@@ -146,9 +149,9 @@ class ObsFiles(FlopyBinaryData):
             The zero-based record number.  The first record is record 0.
             If idx is None and totim are None, a dataframe with all simulation
             times is  returned. (default is None)
-        obsname : string
-            The name of the observation to return. If obsname is None, all
-            observation data are returned. (default is None)
+        obsname : string or list of strings
+            The name(s) of the observation(s) to return. If obsname is None,
+            all observation data are returned. (default is None)
         totim : float
             The simulation time to return. If idx is None and totim are None,
             a dataframe with all simulation times is returned.
@@ -184,10 +187,11 @@ class ObsFiles(FlopyBinaryData):
             error_message="ObsFiles.get_dataframe() requires pandas.",
         )
 
+        times = self.get_times()
         i0 = 0
-        i1 = self.data.shape[0]
+        i1 = len(times)
         if totim is not None:
-            idx = np.where(self.data["totim"] == totim)[0][0]
+            idx = np.where(np.array(times) == totim)[0][0]
             i0 = idx
             i1 = idx + 1
         elif idx is not None:
@@ -198,42 +202,57 @@ class ObsFiles(FlopyBinaryData):
         if obsname is None:
             obsname = self.get_obsnames()
         else:
-            if obsname is not None:
-                if obsname not in self.data.dtype.names:
-                    obsname = None
-                else:
-                    if not isinstance(obsname, list):
-                        obsname = [obsname]
+            if not isinstance(obsname, list):
+                obsname = [obsname]
+            if any(name not in self.dtype.names for name in obsname):
+                obsname = None
+            else:
+                obsname = list(obsname)
         if obsname is None:
             return None
 
         obsname.insert(0, "totim")
 
-        dti = self.get_times()[i0:i1]
+        dti = times[i0:i1]
         if start_datetime is not None:
             dti = totim_to_datetime(
                 dti, start=pd.to_datetime(start_datetime), timeunit=timeunit
             )
 
-        df = pd.DataFrame(self.data[i0:i1], index=dti, columns=obsname)
+        df = pd.DataFrame(
+            self._get_selection(obsname)[i0:i1], index=dti, columns=obsname
+        )
         return df
 
+    def _get_selection(self, names):
+        """
+        Get a view of the data for a list of column names.
+
+        """
+        return get_selection(self.data, names)
+
     def _read_data(self):
+        """
+        Read all of the complete records that follow the header at once,
+        or memory-map them if mmap is True.
 
+        """
         if self.data is not None:
             return
 
-        while True:
-            try:
-                r = self.read_record(count=1)
-                if self.data is None:
-                    self.data = r.copy()
-                elif r.size == 0:
-                    break
-                else:
-                    self.data = np.hstack((self.data, r))
-            except:
-                break
+        ipos = self.file.tell()
+        nbytes = os.fstat(self.file.fileno()).st_size - ipos
+        nrec = max(nbytes, 0) // self.dtype.itemsize
+        if self.mmap and nrec > 0:
+            self.data = np.memmap(
+                self.file,
+                dtype=self.dtype,
+                mode="r",
+                offset=ipos,
+                shape=(nrec,),
+            )
+        else:
+            self.data = self.read_record(count=nrec)
         return
 
     def _build_dtype(self):
@@ -272,14 +291,23 @@ class Mf6Obs(ObsFiles):
         default is "auto", code will attempt to automatically check if
         file is binary. User can change this to True or False if the auto
         check fails to work
+    mmap : bool
+        If true, binary observation data are memory-mapped instead of read
+        into memory.  (default is False)
 
     Returns
     -------
     None
 
+    Notes
+    -----
+    Data in ascii (csv) observation files are read when they are first
+    used.  get_data() and get_dataframe() with obsname only parse the
+    columns of the requested observations.
+
     """
 
-    def __init__(self, filename, verbose=False, isBinary="auto"):
+    def __init__(self, filename, verbose=False, isBinary="auto", mmap=False):
         """
         Class constructor.
 
@@ -287,6 +315,9 @@ class Mf6Obs(ObsFiles):
         super().__init__()
         # initialize class information
         self.verbose = verbose
+        self.mmap = mmap
+        self._csv = None
+        self._data = None
 
         # check if this is a binary file
         if isBinary == "auto":
@@ -333,11 +364,31 @@ class Mf6Obs(ObsFiles):
             self.data = None
             self._read_data()
         else:
-            # read ascii data
-            csv = CsvFile(filename)
-            self.obsnames = csv.obsnames
-            self.nobs = csv.nobs
-            self.data = csv.data
+            # read ascii data when it is needed
+            self._csv = CsvFile(filename)
+            self.obsnames = self._csv.obsnames
+            self.nobs = self._csv.nobs
+            self.dtype = self._csv.dtype
+
+    @property
+    def data(self):
+        if self._data is None and self._csv is not None:
+            self._data = self._csv.data
+        return self._data
+
+    @data.setter
+    def data(self, data):
+        self._data = data
+
+    def _get_selection(self, names):
+        """
+        Get the data for a list of column names, only reading those columns
+        from ascii files that have not been read yet.
+
+        """
+        if self._data is None and self._csv is not None:
+            return self._csv.read_columns(names)
+        return super()._get_selection(names)
 
     def _build_index(self):
         return
@@ -356,6 +407,9 @@ class HydmodObs(ObsFiles):
         extraction.  (default is False)
     hydlbl_len : int
         Length of hydmod labels. (default is 20)
+    mmap : bool
+        If true, observation data are memory-mapped instead of read into
+        memory.  (default is False)
 
     Returns
     -------
@@ -363,7 +417,7 @@ class HydmodObs(ObsFiles):
 
     """
 
-    def __init__(self, filename, verbose=False, hydlbl_len=20):
+    def __init__(self, filename, verbose=False, hydlbl_len=20, mmap=False):
         """
         Class constructor.
 
@@ -371,6 +425,7 @@ class HydmodObs(ObsFiles):
         super().__init__()
         # initialize class information
         self.verbose = verbose
+        self.mmap = mmap
         # --open binary head file
         self.file = open(filename, "rb")
         # NHYDTOT,ITMUNI
@@ -420,6 +475,9 @@ class SwrObs(ObsFiles):
         'single' or 'double'.  Default is 'double'.
     verbose : bool
         Write information to the screen.  Default is False.
+    mmap : bool
+        If true, observation data are memory-mapped instead of read into
+        memory.  Default is False.
 
     Attributes
     ----------
@@ -441,7 +499,9 @@ class SwrObs(ObsFiles):
 
     """
 
-    def __init__(self, filename, precision="double", verbose=False):
+    def __init__(
+        self, filename, precision="double", verbose=False, mmap=False
+    ):
         """
         Class constructor.
 
@@ -450,6 +510,7 @@ class SwrObs(ObsFiles):
         self.set_float(precision=precision)
         # initialize class information
         self.verbose = verbose
+        self.mmap = mmap
         # open binary head file
         self.file = open(filename, "rb")
 
@@ -503,12 +564,20 @@ class CsvFile:
         optional string containing the character that will be used to replace
         the space with in any column names, defaults to ""
 
+    Notes
+    -----
+    Only the header line is read when the file is opened.  All of the data
+    are read the first time the data attribute is used, while read_columns()
+    and iter_rows() only parse the requested columns.  Columns read by
+    read_columns() are kept, so they are only read from the file once, until
+    the size or modification time of the file changes.
+
     """
 
     def __init__(
         self, csvfile, delimiter=",", deletechars="", replace_space=""
     ):
-
+        self.filename = csvfile
         with open(csvfile, "r") as self.file:
             self.delimiter = delimiter
             self.deletechars = deletechars
@@ -519,10 +588,32 @@ class CsvFile:
             self._header = line.rstrip().split(delimiter)
             self.floattype = "f8"
             self.dtype = _build_dtype(self._header, self.floattype)
+        self._data = None
+        # columns that have already been read, keyed on column name, and
+        # the (size, modification time) of the file they were read from
+        self._columns = {}
+        self._signature = None
 
-            self.data = self.read_csv(
-                self.file, self.dtype, delimiter, deletechars, replace_space
-            )
+    @property
+    def data(self):
+        """
+        All of the data in the file
+
+        Returns
+        -------
+        np.recarray
+        """
+        if self._data is None:
+            with open(self.filename, "r") as f:
+                f.readline()
+                self._data = self.read_csv(
+                    f,
+                    self.dtype,
+                    self.delimiter,
+                    self.deletechars,
+                    self.replace_space,
+                )
+        return self._data
 
     @property
     def obsnames(self):
@@ -546,14 +637,138 @@ class CsvFile:
         """
         return len(self.obsnames)
 
+    def _get_usecols(self, names):
+        """
+        Get the dtype and column numbers for a list of column names.
+
+        """
+        if names is None:
+            return self.dtype, None
+        if not isinstance(names, list):
+            names = [names]
+        names = list(dict.fromkeys(names))
+        for name in names:
+            if name not in self.dtype.names:
+                raise ValueError(f"{name} is not a valid column name")
+        dtype = np.dtype(
+            [(name, self.dtype.fields[name][0]) for name in names]
+        )
+        # totim is added to the dtype if it is not a column in the file
+        offset = len(self.dtype.names) - len(self._header)
+        if offset != 0:
+            return dtype, None
+        usecols = [self.dtype.names.index(name) for name in names]
+        return dtype, usecols
+
+    def read_columns(self, names):
+        """
+        Read selected columns from the file, without converting the values
+        in the other columns.
+
+        Parameters
+        ----------
+        names : str or list of str
+            column names to read
+
+        Returns
+        -------
+        np.recarray
+        """
+        dtype, usecols = self._get_usecols(names)
+        if self._data is not None or usecols is None:
+            return get_selection(self.data, list(dtype.names))
+        st = os.stat(self.filename)
+        signature = (st.st_size, st.st_mtime_ns)
+        if signature != self._signature:
+            self._columns = {}
+            self._signature = signature
+        # only read the columns that have not been read yet, always
+        # including totim so that the times are only read once
+        missing = [
+            name
+            for name in ["totim"] + list(dtype.names)
+            if name in self.dtype.names and name not in self._columns
+        ]
+        missing = list(dict.fromkeys(missing))
+        if missing:
+            read_dtype, read_usecols = self._get_usecols(missing)
+            with open(self.filename, "r") as f:
+                f.readline()
+                arr = self.read_csv(
+                    f,
+                    read_dtype,
+                    self.delimiter,
+                    self.deletechars,
+                    self.replace_space,
+                    usecols=read_usecols,
+                )
+            for name in missing:
+                self._columns[name] = np.array(arr[name])
+        nrow = len(next(iter(self._columns.values())))
+        arr = np.empty(nrow, dtype=dtype)
+        for name in dtype.names:
+            arr[name] = self._columns[name]
+        return arr.view(np.recarray)
+
+    def iter_rows(self, names=None, chunksize=10000):
+        """
+        Iterate over blocks of rows in the file, so that only one block is
+        held in memory.
+
+        Parameters
+        ----------
+        names : str or list of str
+            column names to read.  If None, all of the columns are read.
+        chunksize : int
+            maximum number of rows in each block, defaults to 10000
+
+        Yields
+        ------
+        np.recarray
+        """
+        if chunksize < 1:
+            raise ValueError("chunksize must be greater than zero")
+        dtype, usecols = self._get_usecols(names)
+        with open(self.filename, "r") as f:
+            f.readline()
+            while True:
+                lines = list(itertools.islice(f, chunksize))
+                if len(lines) == 0:
+                    break
+                if usecols is None:
+                    arr = self.read_csv(
+                        lines,
+                        self.dtype,
+                        self.delimiter,
+                        self.deletechars,
+                        self.replace_space,
+                    )
+                    yield get_selection(arr, list(dtype.names))
+                else:
+                    yield self.read_csv(
+                        lines,
+                        dtype,
+                        self.delimiter,
+                        self.deletechars,
+                        self.replace_space,
+                        usecols=usecols,
+                    )
+
     @staticmethod
-    def read_csv(fobj, dtype, delimiter=",", deletechars="", replace_space=""):
+    def read_csv(
+        fobj,
+        dtype,
+        delimiter=",",
+        deletechars="",
+        replace_space="",
+        usecols=None,
+    ):
         """
 
         Parameters
         ----------
         fobj : file object
-            open text file object to read
+            open text file object to read, or a list of lines
         dtype : np.dtype
         delimiter : str
             optional delimiter for the csv or formatted text file,
@@ -564,18 +779,36 @@ class CsvFile:
         replace_space : str
             optional string containing the character that will be used to replace
             the space with in any column names, defaults to ""
+        usecols : list of int
+            optional zero-based numbers of the columns to read, in the order
+            of the fields in dtype.  Defaults to None, which reads all of the
+            columns
 
         Returns
         -------
         np.recarray
         """
-        arr = np.genfromtxt(
-            fobj,
-            dtype=dtype,
-            delimiter=delimiter,
-            deletechars=deletechars,
-            replace_space=replace_space,
-        )
+        ipos = fobj.tell() if hasattr(fobj, "tell") else None
+        try:
+            arr = np.loadtxt(
+                fobj,
+                dtype=dtype,
+                delimiter=delimiter,
+                usecols=usecols,
+                ndmin=1,
+            )
+        except ValueError:
+            # fall back to genfromtxt for missing or malformed values
+            if ipos is not None:
+                fobj.seek(ipos)
+            arr = np.genfromtxt(
+                fobj,
+                dtype=dtype,
+                delimiter=delimiter,
+                deletechars=deletechars,
+                replace_space=replace_space,
+                usecols=usecols,
+            )
         if len(arr.shape) == 0:
             arr = arr.reshape((1,))
         return arr.view(np.recarray)
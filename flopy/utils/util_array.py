@@ -539,18 +539,7 @@ class Util3d(DataInterface):
             self._model = model
             self.array_free_format = array_free_format
             for i, u2d in enumerate(self.util_2ds):
-                self.util_2ds[i] = Util2d(
-                    model,
-                    u2d.shape,
-                    u2d.dtype,
-                    u2d._array,
-                    name=u2d.name,
-                    fmtin=u2d.format.fortran,
-                    locat=locat,
-                    cnstnt=u2d.cnstnt,
-                    ext_filename=u2d.filename,
-                    array_free_format=array_free_format,
-                )
+                self.util_2ds[i] = u2d._copy(model, locat, array_free_format)
 
             return
         if len(shape) != 3:
@@ -1325,17 +1314,8 @@ class Transient2d(DataInterface):
             for attr in value.__dict__.items():
                 setattr(self, attr[0], attr[1])
             for kper, u2d in self.transient_2ds.items():
-                self.transient_2ds[kper] = Util2d(
-                    model,
-                    u2d.shape,
-                    u2d.dtype,
-                    u2d._array,
-                    name=u2d.name,
-                    fmtin=u2d.format.fortran,
-                    locat=locat,
-                    cnstnt=u2d.cnstnt,
-                    ext_filename=u2d.filename,
-                    array_free_format=array_free_format,
+                self.transient_2ds[kper] = u2d._copy(
+                    model, locat, array_free_format
                 )
 
             self._model = model
@@ -2024,6 +2004,32 @@ class Util2d(DataInterface):
     def get_value(self):
         return copy.deepcopy(self.__value)
 
+    def _copy(self, model, locat=None, array_free_format=None):
+        """
+        Copy this Util2d to a new Util2d for model. Arrays of lazily
+        loaded models that are still in their files are not read.
+        """
+        lazy = self.vtype == str and getattr(model, "lazy_load", False)
+        u2d = Util2d(
+            model,
+            self.shape,
+            self.dtype,
+            self.__value if lazy else self._array,
+            name=self.name,
+            fmtin=self.format.fortran,
+            locat=locat,
+            cnstnt=self.cnstnt,
+            ext_filename=self.filename,
+            array_free_format=array_free_format,
+        )
+        if lazy:
+            u2d.format = ArrayFormat(
+                u2d,
+                fortran=self.format.fortran,
+                array_free_format=array_free_format,
+            )
+        return u2d
+
     # overloads, tries to avoid creating arrays if possible
     def __add__(self, other):
         if self.vtype in [np.int32, np.float32] and self.vtype == other.vtype:
@@ -2450,7 +2456,10 @@ class Util2d(DataInterface):
         """
         if self.vtype == str:
             if self.__value_built is None:
-                file_in = open(self.__value, "r")
+                if self.format.binary:
+                    file_in = open(self.__value, "rb")
+                else:
+                    file_in = open(self.__value, "r")
 
                 if self.format.binary:
                     header, self.__value_built = Util2d.load_bin(
@@ -2551,37 +2560,14 @@ class Util2d(DataInterface):
         if openfile:
             file_in = open(file_in, "r")
         npl, fmt, width, decimal = ArrayFormat.decode_fortran_descriptor(fmtin)
-        items = []
-        while len(items) < num_items:
-            line = file_in.readline()
-            if len(line) == 0:
-                raise ValueError("Util2d.load_txt(): no data found")
-            if npl == "free":
-                if "," in line:
-                    line = line.replace(",", " ")
-                if "*" in line:  # use slower method for these types of lines
-                    for item in line.split():
-                        if "*" in item:
-                            num, val = item.split("*")
-                            # repeat val num times
-                            items += int(num) * [val]
-                        else:
-                            items.append(item)
-                else:
-                    items += line.split()
-            else:  # fixed width
-                pos = 0
-                for i in range(npl):
-                    try:
-                        item = line[pos : pos + width].strip()
-                        pos += width
-                        if item:
-                            items.append(item)
-                    except IndexError:
-                        break
+        if npl == "free":
+            data = Util2d._load_txt_free(file_in, num_items, dtype)
+        else:
+            data = Util2d._load_txt_fixed(
+                file_in, num_items, dtype, npl, width
+            )
         if openfile:
             file_in.close()
-        data = np.fromiter(items, dtype=dtype, count=num_items)
         if data.size != num_items:
             raise ValueError(
                 "Util2d.load_txt(): expected array size {0},"
@@ -2589,6 +2575,74 @@ class Util2d(DataInterface):
             )
         return data.reshape(shape)
 
+    @staticmethod
+    def _load_txt_free(file_in, num_items, dtype):
+        """Read num_items values from free format lines.  Repeat tokens
+        (n*value) are expanded with np.repeat."""
+        values = []
+        counts = []
+        count = 0
+        while count < num_items:
+            line = file_in.readline()
+            if len(line) == 0:
+                raise ValueError("Util2d.load_txt(): no data found")
+            if "," in line:
+                line = line.replace(",", " ")
+            if "*" in line:
+                # pad the counts of any preceding items
+                counts += [1] * (len(values) - len(counts))
+                for item in line.split():
+                    if "*" in item:
+                        num, item = item.split("*")
+                        counts.append(int(num))
+                    else:
+                        counts.append(1)
+                    count += counts[-1]
+                    values.append(item)
+            else:
+                line = line.split()
+                values += line
+                count += len(line)
+        if not counts:
+            return np.fromiter(values, dtype=dtype, count=num_items)
+        counts += [1] * (len(values) - len(counts))
+        # skip values beyond the end of the array
+        total = np.cumsum(counts)
+        last = np.searchsorted(total, num_items)
+        counts = np.array(counts[: last + 1])
+        counts[-1] -= total[last] - num_items
+        data = np.fromiter(values, dtype=dtype, count=last + 1)
+        return np.repeat(data, counts)
+
+    @staticmethod
+    def _load_txt_fixed(file_in, num_items, dtype, npl, width):
+        """Read num_items values from lines of npl fixed width fields.
+        Blank fields are skipped."""
+        line_width = npl * width
+        segments = []
+        count = 0
+        while count < num_items:
+            # a line holds at most npl values, so reading this many lines
+            # does not read past the end of the array
+            num_lines = -(-(num_items - count) // npl)
+            lines = []
+            for i in range(num_lines):
+                line = file_in.readline()
+                if len(line) == 0:
+                    raise ValueError("Util2d.load_txt(): no data found")
+                lines.append(line.rstrip("\n")[:line_width].ljust(line_width))
+            text = "".join(lines).encode("ascii", "replace")
+            fields = np.frombuffer(text, dtype=f"S{width}")
+            chars = np.frombuffer(text, dtype=np.uint8).reshape(-1, width)
+            fields = fields[(chars > 32).any(axis=1)][: num_items - count]
+            segments.append(
+                np.fromiter(fields.tolist(), dtype=dtype, count=fields.size)
+            )
+            count += fields.size
+        if len(segments) == 1:
+            return segments[0]
+        return np.concatenate(segments)
+
     @staticmethod
     def write_txt(
         shape, file_out, data, fortran_format="(FREE)", python_format=None
@@ -2883,6 +2937,25 @@ class Util2d(DataInterface):
             assert os.path.exists(
                 fname
             ), f"Util2d.load() error: open/close file {fname} not found"
+            if getattr(model, "lazy_load", False):
+                # keep the file name so the array is only read when it is
+                # accessed and the file is copied as is by write_input
+                u2d = cls(
+                    model,
+                    shape,
+                    dtype,
+                    fname,
+                    name=name,
+                    iprn=cr_dict["iprn"],
+                    cnstnt=cr_dict["cnstnt"],
+                    array_free_format=array_free_format,
+                )
+                u2d.format = ArrayFormat(
+                    u2d,
+                    fortran=cr_dict["fmtin"],
+                    array_free_format=array_free_format,
+                )
+                return u2d
             if str("binary") not in str(cr_dict["fmtin"].lower()):
                 f = open(fname, "r")
                 data = Util2d.load_txt(
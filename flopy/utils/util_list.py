@@ -750,16 +750,8 @@ class MfList(DataInterface, DataListInterface):
                     kper_data = model_filepath
 
             if kper_vtype == np.recarray:
-                name = f.name
-                if self.__binary:
-                    f.close()
-                    # switch file append mode to binary
-                    with open(name, "ab+") as f:
-                        self.__tofile(f, kper_data)
-                    # continue back to non-binary
-                    f = open(name, "a")
-                else:
-                    self.__tofile(f, kper_data)
+                # binary data is always written to external files above
+                self.__tofile(f, kper_data)
             elif kper_vtype == str:
                 f.write(f"         open/close {kper_data}")
                 if self.__binary:
@@ -779,21 +771,42 @@ class MfList(DataInterface, DataListInterface):
         ), "MfList.__tofile() data arg not a recarray"
 
         # Add one to the kij indices
-        lnames = [name.lower() for name in self.dtype.names]
-        # --make copy of data for multiple calls
-        d = data.copy()
-        for idx in ["k", "i", "j", "node"]:
-            if idx in lnames:
-                d[idx] += 1
+        columns = []
+        for name in data.dtype.names:
+            column = data[name]
+            if name.lower() in ("k", "i", "j", "node"):
+                column = column + 1
+            columns.append(column)
         if self.__binary:
             dtype2 = []
             for name in self.dtype.names:
                 dtype2.append((name, np.float32))
-            dtype2 = np.dtype(dtype2)
-            d = np.array(d, dtype=dtype2)
+            d = np.empty(data.shape[0], dtype=dtype2)
+            for name, column in zip(data.dtype.names, columns):
+                d[name] = column
             d.tofile(f)
+        elif hasattr(f, "write"):
+            self.__write_text(f, columns)
         else:
-            np.savetxt(f, d, fmt=self.fmt_string, delimiter="")
+            with open(f, "w") as fh:
+                self.__write_text(fh, columns)
+
+    def __write_text(self, f, columns, chunksize=100000):
+        # Write the columns with fmt_string, formatting chunksize rows with
+        # one string operation instead of formatting one row at a time
+        fmt_string = self.fmt_string
+        fmts = fmt_string.split("%")[1:]
+        nrow = len(columns[0]) if columns else 0
+        for start in range(0, nrow, chunksize):
+            end = min(start + chunksize, nrow)
+            values = [None] * ((end - start) * len(columns))
+            for icol, (fmt, column) in enumerate(zip(fmts, columns)):
+                column = column[start:end]
+                # "%s" writes floats the way numpy prints them
+                if column.dtype.kind == "f" and fmt.rstrip().endswith("s"):
+                    column = column.astype(str)
+                values[icol :: len(columns)] = column.tolist()
+            f.write(f"{fmt_string}\n" * (end - start) % tuple(values))
 
     def check_kij(self):
         names = self.dtype.names
@@ -1059,132 +1072,128 @@ class MfList(DataInterface, DataListInterface):
         >>> v = ml.wel.stress_period_data.to_array(kper=1)
 
         """
-        i0 = 3
-        unstructured = False
+        return self.__to_array(kper, mask)
+
+    def __array_shape(self):
         if "inode" in self.dtype.names:
             raise NotImplementedError()
-
         if "node" in self.dtype.names:
             if "i" not in self.dtype.names and "j" not in self.dtype.names:
-                i0 = 1
-                unstructured = True
-
-        arrays = {}
-        for name in self.dtype.names[i0:]:
-            if not self.dtype.fields[name][0] == object:
-                if unstructured:
-                    arr = np.zeros((self._model.nlay * self._model.ncpl,))
-                else:
-                    arr = np.zeros(
-                        (self._model.nlay, self._model.nrow, self._model.ncol)
-                    )
-                arrays[name] = arr.copy()
+                return (self._model.nlay * self._model.ncpl,)
+        return self._model.nlay, self._model.nrow, self._model.ncol
+
+    def __array_names(self):
+        i0 = 1 if len(self.__array_shape()) == 1 else 3
+        return [
+            name
+            for name in self.dtype.names[i0:]
+            if not self.dtype.fields[name][0] == object
+        ]
 
-        # if this kper is not found
+    def __get_period(self, kper):
+        # Get the recarray that is in effect for kper, or None if there
+        # are no entries for kper. Stress periods that reuse data (-1)
+        # resolve to the recarray of the stress period they reuse.
+        kpers = sorted(self.data.keys())
         if kper not in self.data.keys():
-            kpers = list(self.data.keys())
-            kpers.sort()
-            # if this kper is before the first entry,
-            # (maybe) mask and return
             if kper < kpers[0]:
-                if mask:
-                    for name, arr in arrays.items():
-                        arrays[name][:] = np.NaN
-                return arrays
-            # find the last kper
-            else:
-                kper = self.__find_last_kper(kper)
-
+                return None
+            kper = self.__find_last_kper(kper)
+        pos = kpers.index(kper)
         sarr = self.data[kper]
+        while np.isscalar(sarr) and sarr == -1 and pos > 0:
+            pos -= 1
+            sarr = self.data[kpers[pos]]
         if isinstance(sarr, str):
             sarr = self.__fromfile(sarr)
-
         if np.isscalar(sarr):
             # if there are no entries for this kper
-            if sarr == 0:
-                if mask:
-                    for name, arr in arrays.items():
-                        arrays[name][:] = np.NaN
-                return arrays
-            else:
-                raise Exception("MfList: something bad happened")
+            if sarr in (0, -1):
+                return None
+            raise Exception("MfList: something bad happened")
+        return sarr
+
+    def __cell_index(self, sarr, shape):
+        # flat array index of the cell of each record
+        if len(shape) == 1:
+            cellids = (sarr["node"],)
+        else:
+            cellids = (sarr["k"], sarr["i"], sarr["j"])
+        cellids = tuple(
+            np.where(cellid < 0, cellid + n, cellid)
+            for cellid, n in zip(cellids, shape)
+        )
+        return np.ravel_multi_index(cellids, shape)
 
-        for name, arr in arrays.items():
-            if unstructured:
-                cnt = np.zeros(
-                    (self._model.nlay * self._model.ncpl,), dtype=float
-                )
-            else:
-                cnt = np.zeros(
-                    (self._model.nlay, self._model.nrow, self._model.ncol),
-                    dtype=float,
-                )
-            # print(name,kper)
-            for rec in sarr:
-                if unstructured:
-                    arr[rec["node"]] += rec[name]
-                    cnt[rec["node"]] += 1.0
-                else:
-                    arr[rec["k"], rec["i"], rec["j"]] += rec[name]
-                    cnt[rec["k"], rec["i"], rec["j"]] += 1.0
+    def __to_array(self, kper, mask, names=None, sarr=None):
+        shape = self.__array_shape()
+        if names is None:
+            names = self.__array_names()
+        if sarr is None:
+            sarr = self.__get_period(kper)
+
+        arrays = {}
+        for name in names:
+            arrays[name] = np.zeros(shape)
+
+        # if there are no entries for this kper, (maybe) mask and return
+        if sarr is None:
+            if mask:
+                for name, arr in arrays.items():
+                    arrays[name][:] = np.NaN
+            return arrays
+
+        size = int(np.prod(shape))
+        idx = self.__cell_index(sarr, shape)
+        cnt = np.bincount(idx, minlength=size).astype(float).reshape(shape)
+        for name in names:
+            arr = np.bincount(idx, weights=sarr[name], minlength=size).reshape(
+                shape
+            )
             # average keys that should not be added
             if name not in ("cond", "flux"):
-                idx = cnt > 0.0
-                arr[idx] /= cnt[idx]
+                idx_cnt = cnt > 0.0
+                arr[idx_cnt] /= cnt[idx_cnt]
             if mask:
                 arr = np.ma.masked_where(cnt == 0.0, arr)
                 arr[cnt == 0.0] = np.NaN
-
-            arrays[name] = arr.copy()
-        # elif mask:
-        #     for name, arr in arrays.items():
-        #         arrays[name][:] = np.NaN
+            arrays[name] = arr
         return arrays
 
+    def __period_groups(self):
+        # Group the stress periods that have identical data, so that the
+        # data for each group are only converted to arrays once
+        groups = []
+        hashes = {}
+        for kper in range(self._model.nper):
+            sarr = self.__get_period(kper)
+            key = None if sarr is None else hash(sarr.tobytes())
+            for group in hashes.get(key, []):
+                if group[0] is sarr or (
+                    sarr is not None and np.array_equal(group[0], sarr)
+                ):
+                    group[1].append(kper)
+                    break
+            else:
+                group = (sarr, [kper])
+                hashes.setdefault(key, []).append(group)
+                groups.append(group)
+        return groups
+
     @property
     def masked_4D_arrays(self):
-        # get the first kper
-        arrays = self.to_array(kper=0, mask=True)
-
-        # initialize these big arrays
-        m4ds = {}
-        for name, array in arrays.items():
-            m4d = np.zeros(
-                (
-                    self._model.nper,
-                    self._model.nlay,
-                    self._model.nrow,
-                    self._model.ncol,
-                )
-            )
-            m4d[0, :, :, :] = array
-            m4ds[name] = m4d
-        for kper in range(1, self._model.nper):
-            arrays = self.to_array(kper=kper, mask=True)
-            for name, array in arrays.items():
-                m4ds[name][kper, :, :, :] = array
-        return m4ds
+        return dict(self.masked_4D_arrays_itr())
 
     def masked_4D_arrays_itr(self):
-        # get the first kper
-        arrays = self.to_array(kper=0, mask=True)
-
-        # initialize these big arrays
-        for name, array in arrays.items():
-            m4d = np.zeros(
-                (
-                    self._model.nper,
-                    self._model.nlay,
-                    self._model.nrow,
-                    self._model.ncol,
-                )
-            )
-            m4d[0, :, :, :] = array
-            for kper in range(1, self._model.nper):
-                arrays = self.to_array(kper=kper, mask=True)
-                for tname, array in arrays.items():
-                    if tname == name:
-                        m4d[kper, :, :, :] = array
+        shape = (self._model.nper,) + self.__array_shape()
+        groups = self.__period_groups()
+        for name in self.__array_names():
+            m4d = np.zeros(shape)
+            for sarr, kpers in groups:
+                m4d[kpers[0]] = self.__to_array(
+                    kpers[0], True, names=[name], sarr=sarr
+                )[name]
+                m4d[kpers[1:]] = m4d[kpers[0]]
             yield name, m4d
 
     @property